@@ -133,18 +133,17 @@ async def trace_url_processing(url: str):
         print("   检测到 arXiv URL，使用专用提取器...")
         try:
             metadata = zotero_connector._extract_arxiv_metadata(url)
-            if 'error' not in metadata:
-                metadata = {
-                    'title': metadata.get('title', 'Unknown'),
-                    'authors': metadata.get('authors_string', ''),
-                    'date': metadata.get('date', ''),
-                    'abstract': metadata.get('abstract', ''),
-                    'url': metadata.get('abs_url', url),
-                    'pdf_url': metadata.get('pdf_url', ''),
-                    'arxiv_id': metadata.get('arxiv_id', ''),
-                    'extractor': 'arXiv专用提取器',
-                    'DOI': metadata.get('doi', ''),
-                }
+            metadata = {
+                'title': metadata.get('title', 'Unknown'),
+                'authors': metadata.get('authors_string', ''),
+                'date': metadata.get('date', ''),
+                'abstract': metadata.get('abstract', ''),
+                'url': metadata.get('abs_url', url),
+                'pdf_url': metadata.get('pdf_url', ''),
+                'arxiv_id': metadata.get('arxiv_id', ''),
+                'extractor': 'arXiv专用提取器',
+                'DOI': metadata.get('doi', ''),
+            }
         except Exception as e:
             print(f"❌ 提取失败: {e}")
             return
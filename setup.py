@@ -33,6 +33,10 @@ setup(
         "advanced": [
             "pycryptodome>=3.19.0"
         ],
+        "fast": [
+            "watchdog>=3.0.0",
+            "orjson>=3.9.0"
+        ],
     },
     entry_points={
         "console_scripts": [
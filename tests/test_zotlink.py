@@ -12,10 +12,11 @@ import sqlite3
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import json
+import time
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from zotlink.zotero_integration import ZoteroConnector
+from zotlink.zotero_integration import ArxivMetadataError, ZoteroConnector
 from zotlink.extractors.arxiv_extractor import ArxivAPIExtractor, extract_arxiv_metadata, search_arxiv
 from zotlink.pdf_fetcher import PDFFetcher
 
@@ -235,6 +236,32 @@ class TestZoteroConnector:
             result = connector.update_item_tags("ABC123", ["tag1", "tag2"])
             assert result["success"] is True
 
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_update_item_tags_reuses_existing_tags(self, mock_db_path, connector, tmp_path):
+        """Test update_item_tags links existing tags and creates only missing ones"""
+        mock_db_path.return_value = tmp_path / "tags.sqlite"
+
+        conn = sqlite3.connect(str(mock_db_path.return_value))
+        conn.execute("CREATE TABLE items (itemID INTEGER PRIMARY KEY, key TEXT UNIQUE, itemTypeID INTEGER, libraryID INTEGER)")
+        conn.execute("CREATE TABLE tags (tagID INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute("CREATE TABLE itemTags (itemID INTEGER, tagID INTEGER, type INTEGER)")
+        conn.execute("INSERT INTO items (itemID, key, itemTypeID, libraryID) VALUES (1, 'ABC123', 1, 1)")
+        conn.execute("INSERT INTO tags (tagID, name) VALUES (7, 'existing')")
+        conn.execute("INSERT INTO itemTags (itemID, tagID, type) VALUES (1, 7, 0)")
+        conn.commit()
+        conn.close()
+
+        with patch.object(connector, 'is_running', return_value=True):
+            result = connector.update_item_tags("ABC123", ["existing", "new1", "new2"])
+            assert result["success"] is True
+
+        conn = sqlite3.connect(str(mock_db_path.return_value))
+        tags = dict(conn.execute("SELECT name, tagID FROM tags"))
+        linked = sorted(r[0] for r in conn.execute("SELECT tagID FROM itemTags WHERE itemID = 1"))
+        conn.close()
+        assert tags == {"existing": 7, "new1": 8, "new2": 9}
+        assert linked == [7, 8, 9]
+
     @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
     def test_delete_item(self, mock_db_path, connector):
         """Test delete_item removes item from database"""
@@ -308,6 +335,152 @@ class TestZoteroConnector:
             result = connector.move_item_to_collection("ABC123", "COLLECTION456")
             assert result["success"] is True
 
+            again = connector.move_item_to_collection("ABC123", "COLLECTION456")
+            assert again["message"] == "Item already in collection"
+            missing = connector.move_item_to_collection("ABC123", "NOPE")
+            assert missing == {"success": False, "error": "Collection not found"}
+
+        conn = sqlite3.connect(str(mock_db_path.return_value))
+        assert conn.execute("SELECT COUNT(*) FROM collectionItems").fetchone()[0] == 1
+        conn.close()
+
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_batch_delete_items(self, mock_db_path, connector, tmp_path):
+        """Test delete_items reports per-key outcomes"""
+        import sqlite3
+
+        mock_db_path.return_value = tmp_path / "zotero.sqlite"
+        conn = sqlite3.connect(str(mock_db_path.return_value))
+        conn.executescript('''
+            CREATE TABLE items (itemID INTEGER PRIMARY KEY, key TEXT UNIQUE, itemTypeID INTEGER, libraryID INTEGER);
+            CREATE TABLE itemTags (itemID INTEGER, tagID INTEGER);
+            CREATE TABLE itemCreators (itemID INTEGER, creatorID INTEGER);
+            CREATE TABLE itemData (itemID INTEGER, fieldID INTEGER, valueID INTEGER);
+            CREATE TABLE collections (collectionID INTEGER PRIMARY KEY, collectionKey TEXT, libraryID INTEGER);
+            CREATE TABLE collectionItems (collectionID INTEGER, itemID INTEGER);
+            INSERT INTO items (itemID, key, itemTypeID, libraryID) VALUES (1, 'A', 1, 1), (2, 'B', 1, 1), (3, 'C', 1, 1);
+            INSERT INTO itemTags VALUES (1, 1), (2, 1);
+            INSERT INTO collections VALUES (10, 'COLL', 1);
+            INSERT INTO collectionItems VALUES (10, 3);
+        ''')
+        conn.commit()
+        conn.close()
+
+        with patch.object(connector, 'is_running', return_value=True):
+            deleted = connector.delete_items(["A", "B", "MISSING"])
+            assert deleted["success"] is True
+            assert deleted["deleted"] == ["A", "B"]
+            assert deleted["not_found"] == ["MISSING"]
+
+        conn = sqlite3.connect(str(mock_db_path.return_value))
+        assert conn.execute("SELECT key FROM items").fetchall() == [("C",)]
+        assert conn.execute("SELECT COUNT(*) FROM itemTags").fetchone()[0] == 0
+        conn.close()
+
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_helper_indexes_created_only_when_enabled(self, mock_db_path, connector, tmp_path):
+        """Test lookup indexes are added to the database only behind the opt-in flag"""
+        import sqlite3
+
+        db_path = tmp_path / "zotero.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript('''
+            CREATE TABLE items (itemID INTEGER PRIMARY KEY, key TEXT, libraryID INTEGER);
+            CREATE TABLE attachments (itemID INTEGER PRIMARY KEY, parentItemID INTEGER, contentType TEXT);
+        ''')
+        conn.close()
+        mock_db_path.return_value = db_path
+
+        def index_names():
+            check = sqlite3.connect(str(db_path))
+            names = {row[0] for row in check.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            check.close()
+            return names
+
+        connector._ro()
+        assert not index_names()
+
+        connector._close_ro_connection()
+        connector._create_indexes = True
+        connector._ro()
+        assert {"zotlink_items_lib_key", "zotlink_attach_parent_ctype"} <= index_names()
+
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_read_connections_are_per_thread(self, mock_db_path, connector, tmp_path):
+        """Test worker threads never share a read-only connection"""
+        import sqlite3
+        import threading
+
+        db_path = tmp_path / "zotero.sqlite"
+        sqlite3.connect(str(db_path)).close()
+        mock_db_path.return_value = db_path
+
+        main_conn = connector._ro()
+        assert connector._ro() is main_conn
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(connector._ro()))
+        worker.start()
+        worker.join()
+        assert seen[0] is not main_conn
+
+    def test_save_sessions_are_per_thread(self, connector):
+        """Test concurrent saves never share a requests.Session"""
+        import threading
+
+        session = connector._save_session()
+        assert connector._save_session() is session
+        assert session.headers['X-Zotero-Connector-API-Version'] == '3'
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(connector._save_session()))
+        worker.start()
+        worker.join()
+        assert seen[0] is not session
+
+    def test_arxiv_metadata_cached_only_on_success(self):
+        """Test arXiv lookups are cached per URL while errors are retried"""
+        from zotlink import zotero_integration
+
+        zotero_integration._fetch_arxiv_metadata_cached.cache_clear()
+        with patch.object(ArxivAPIExtractor, 'extract_metadata',
+                          side_effect=[{"error": "timeout"}, {"title": "T"}]) as mock_extract:
+            assert "error" in zotero_integration._fetch_arxiv_metadata("https://arxiv.org/abs/1.2")
+            first = zotero_integration._fetch_arxiv_metadata("https://arxiv.org/abs/1.2")
+            first["title"] = "changed"
+            assert zotero_integration._fetch_arxiv_metadata("https://arxiv.org/abs/1.2") == {"title": "T"}
+            assert mock_extract.call_count == 2
+        zotero_integration._fetch_arxiv_metadata_cached.cache_clear()
+
+    def test_attach_pdf_prefers_last_successful_endpoint(self, connector, tmp_path):
+        """Test _attach_pdf_to_item retries the cached endpoint first"""
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 test")
+
+        def fake_post(url, **kwargs):
+            response = Mock()
+            response.status_code = 201 if url.endswith("/attachments") and "/connector/" not in url else 404
+            return response
+
+        with patch.object(connector.session, 'post', side_effect=fake_post) as mock_post:
+            assert connector._attach_pdf_to_item("ABC123", str(pdf_path), "Test") is True
+            assert mock_post.call_count == 3
+
+            mock_post.reset_mock()
+            assert connector._attach_pdf_to_item("ABC123", str(pdf_path), "Test") is True
+            assert mock_post.call_count == 1
+            assert mock_post.call_args[0][0] == f"{connector.base_url}/attachments"
+
+    def test_validate_pdf_content_site_min_size(self, connector):
+        """Test site-specific minimum PDF size is keyed on the URL host"""
+        pdf_data = b"%PDF-1.4\n" + b"0" * 4096 + b"\n%%EOF"
+        headers = {"Content-Type": "application/pdf"}
+
+        result = connector._validate_pdf_content(pdf_data, headers, "https://www.nature.com/articles/x.pdf")
+        assert result["is_valid"] is False
+        assert result["details"]["expected_min_size"] == 500000
+
+        result = connector._validate_pdf_content(pdf_data, headers, "https://example.org/nature.com/x.pdf")
+        assert result["is_valid"] is True
+
 
 class TestArxivAPIExtractor:
     """Test cases for arXiv API integration"""
@@ -542,6 +715,34 @@ class TestMetadataValidation:
         result = connector._get_arxiv_url_from_doi(doi)
         assert result is None
 
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_validate_non_arxiv_doi_skips_item_fetch(self, mock_db_path, connector, tmp_path):
+        """Test validation bails out on a non-arXiv DOI before loading the full item"""
+        mock_db_path.return_value = tmp_path / "zotero.sqlite"
+        conn = sqlite3.connect(str(mock_db_path.return_value))
+        conn.executescript('''
+            CREATE TABLE items (itemID INTEGER PRIMARY KEY, key TEXT, libraryID INTEGER);
+            CREATE TABLE fields (fieldID INTEGER PRIMARY KEY, fieldName TEXT);
+            CREATE TABLE itemData (itemID INTEGER, fieldID INTEGER, valueID INTEGER);
+            CREATE TABLE itemDataValues (valueID INTEGER PRIMARY KEY, value TEXT);
+            INSERT INTO items VALUES (1, 'NATURE1', 1);
+            INSERT INTO fields VALUES (1, 'DOI');
+            INSERT INTO itemDataValues VALUES (1, '10.1038/nature12345');
+            INSERT INTO itemData VALUES (1, 1, 1);
+        ''')
+        conn.commit()
+        conn.close()
+
+        with patch.object(connector, 'is_running', return_value=True), \
+             patch.object(connector, 'get_item') as mock_get_item, \
+             patch.object(connector, '_get_item_from_database') as mock_item_lookup:
+            result = connector.validate_item_with_arxiv("NATURE1")
+
+        mock_get_item.assert_not_called()
+        mock_item_lookup.assert_not_called()
+        assert result["success"] is False
+        assert result["doi"] == "10.1038/nature12345"
+
     def test_compare_metadata_titles(self, connector):
         """Test metadata comparison for titles"""
         zotero = {"title": "Attention Is All You Need", "abstract": "", "date": "", "creators": [], "doi": ""}
@@ -565,6 +766,7 @@ class TestMetadataValidation:
         abstract1 = "This   is   a   test"
         abstract2 = "This is a test"
         assert connector._normalize_abstract(abstract1) == connector._normalize_abstract(abstract2)
+        assert connector._normalize_abstract("This\u00a0is a\u2009test") == abstract2
 
     def test_extract_last_names(self, connector):
         """Test extracting last names from creators"""
@@ -986,6 +1188,25 @@ class TestItemAttachmentsNotesTags:
             assert "notes" not in item
             assert "tags" not in item
 
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_get_item_cached_until_write(self, mock_db_path, connector, tmp_path):
+        """Test get_item reuses cached results until the connector writes"""
+        db_path = self._create_test_database(tmp_path)
+        mock_db_path.return_value = db_path
+
+        with patch.object(connector, 'is_running', return_value=True):
+            first = connector.get_item("ITEM123")
+            first["item"]["tags"].append("mutated")
+
+            with patch.object(connector, '_get_item_from_database') as mock_query:
+                second = connector.get_item("ITEM123")
+                mock_query.assert_not_called()
+            assert "mutated" not in second["item"]["tags"]
+
+            connector.update_item_tags("ITEM123", ["ai", "new-tag"])
+            third = connector.get_item("ITEM123")
+            assert "new-tag" in third["item"]["tags"]
+
 
 class TestLibraryItemsWithDetails:
     """Test cases for get_library_items with include_details parameter"""
@@ -1101,6 +1322,36 @@ class TestLibraryItemsWithDetails:
             assert "attachment_count" not in item
             assert "tag_count" not in item
 
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_item_lookup_only_drops_creators_for_missing_tables(self, mock_db_path, connector, tmp_path):
+        """Test a locked database fails the lookup instead of returning an item without creators"""
+        mock_db_path.return_value = self._create_test_database_for_library(tmp_path)
+        conn = MagicMock()
+        conn.cursor.return_value.execute.side_effect = sqlite3.OperationalError("database is locked")
+
+        with patch.object(connector, '_ro', return_value=conn):
+            assert connector._get_item_from_database("LIBRARY001") is None
+        assert conn.cursor.return_value.execute.call_count == 1
+
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_get_library_items_failed_read_not_cached(self, mock_db_path, connector, tmp_path):
+        """Test a transient database error is not remembered as an empty library"""
+        db_path = self._create_test_database_for_library(tmp_path)
+        mock_db_path.return_value = db_path
+        real_ro = connector._ro
+        calls = []
+
+        def flaky_ro():
+            calls.append(1)
+            if len(calls) == 1:
+                raise sqlite3.OperationalError("database is locked")
+            return real_ro()
+
+        with patch.object(connector, 'is_running', return_value=True), \
+             patch.object(connector, '_ro', side_effect=flaky_ro):
+            assert connector.get_library_items(limit=10)["items"] == []
+            assert len(connector.get_library_items(limit=10)["items"]) == 2
+
     @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
     def test_get_library_items_with_details(self, mock_db_path, connector, tmp_path):
         """Test get_library_items includes counts when include_details=True"""
@@ -1123,6 +1374,52 @@ class TestLibraryItemsWithDetails:
             assert "tags" in first_item
             assert len(first_item["tags"]) == 3
 
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_search_items_returns_all_matches_with_titles(self, mock_db_path, connector, tmp_path):
+        """Test search_items returns every matching item with its title"""
+        db_path = self._create_test_database_for_library(tmp_path)
+        mock_db_path.return_value = db_path
+
+        with patch.object(connector, 'is_running', return_value=True):
+            result = connector.search_items("Paper")
+            assert result["success"] is True
+            titles = sorted(item["title"] for item in result["items"])
+            assert titles == ["First Paper", "Second Paper"]
+
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_search_items_prefix_and_substring(self, mock_db_path, connector, tmp_path):
+        """Test title search matches word prefixes and mid-word substrings"""
+        db_path = self._create_test_database_for_library(tmp_path)
+        mock_db_path.return_value = db_path
+
+        with patch.object(connector, 'is_running', return_value=True):
+            result = connector.search_items("firs")
+            assert [item["itemKey"] for item in result["items"]] == ["LIBRARY001"]
+
+            result = connector.search_items("aper")
+            assert len(result["items"]) == 2
+
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_search_items_substring_and_punctuation(self, mock_db_path, connector, tmp_path):
+        """Test substring hits are kept next to word hits and punctuation is matched literally"""
+        db_path = self._create_test_database_for_library(tmp_path)
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("UPDATE itemDataValues SET value = 'Learning C Programs' WHERE valueID = 1")
+        conn.execute("UPDATE itemDataValues SET value = 'Unlearning C++ Idioms' WHERE valueID = 2")
+        conn.commit()
+        conn.close()
+        mock_db_path.return_value = db_path
+
+        with patch.object(connector, 'is_running', return_value=True):
+            result = connector.search_items("learn")
+            assert sorted(item["itemKey"] for item in result["items"]) == ["LIBRARY001", "LIBRARY002"]
+
+            result = connector.search_items("C++")
+            assert [item["itemKey"] for item in result["items"]] == ["LIBRARY002"]
+
+            result = connector.search_items("Learning Programs")
+            assert result["items"] == []
+
 
 class TestPDFTextExtraction:
     """Test cases for PDF text extraction functionality"""
@@ -1216,6 +1513,24 @@ startxref
             assert "pdf_path" in result
             assert result["pdf_path"] == str(pdf_path)
 
+    def test_pdf_text_reused_until_file_changes(self, connector, tmp_path):
+        """Test an unchanged PDF is only extracted once"""
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 first")
+        reader = MagicMock(pages=[object()])
+
+        with patch('pypdf.PdfReader', return_value=reader), \
+             patch.object(connector, '_extract_pdf_text', return_value=["Body text"]) as extract:
+            first = connector._read_pdf_text(pdf_path)
+            second = connector._read_pdf_text(pdf_path)
+            assert extract.call_count == 1
+            assert first == second
+            assert second["text"] == "Body text"
+
+            pdf_path.write_bytes(b"%PDF-1.4 second version")
+            connector._read_pdf_text(pdf_path)
+            assert extract.call_count == 2
+
     @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
     def test_get_item_pdf_content_no_attachment(self, mock_db_path, connector, tmp_path):
         """Test get_item_pdf_content returns error when no attachment"""
@@ -1259,6 +1574,46 @@ startxref
             assert result["success"] is False
             assert "not found in storage" in result["error"]
 
+    @patch('zotlink.zotero_integration.ZoteroConnector._get_zotero_db_path')
+    def test_get_item_pdf_content_storage_prefixed_path(self, mock_db_path, connector, tmp_path):
+        """Test a 'storage:<filename>' attachment path resolves inside storage/<key>/"""
+        from pypdf import PdfWriter
+
+        storage_dir = tmp_path / "storage"
+        db_path = self._create_test_database_with_attachment(tmp_path, storage_dir)
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("UPDATE attachments SET path = 'storage:Vaswani 2017.pdf'")
+        conn.commit()
+        conn.close()
+        mock_db_path.return_value = db_path
+        connector._zotero_storage_dir = storage_dir
+
+        pdf_path = storage_dir / "ATTACH001" / "Vaswani 2017.pdf"
+        writer = PdfWriter()
+        writer.add_blank_page(width=100, height=100)
+        writer.write(str(pdf_path))
+
+        with patch.object(connector, 'is_running', return_value=True):
+            result = connector.get_item_pdf_content("MAINITEM")
+            assert result["success"] is True
+            assert result["pdf_path"] == str(pdf_path)
+
+            missing = connector.get_item_pdf_content("NOSUCHITEM")
+            assert missing["error"] == "Item not found"
+
+    def test_storage_index_refreshed_on_miss(self, connector, tmp_path):
+        """Test a file added inside an existing storage folder is found despite the cached index"""
+        storage_dir = tmp_path / "storage"
+        (storage_dir / "FOLDER01").mkdir(parents=True)
+        (storage_dir / "FOLDER01" / "OLDKEY.pdf").write_bytes(b"%PDF")
+        connector._zotero_storage_dir = storage_dir
+
+        assert connector._find_attachment_storage_path("OLDKEY") == storage_dir / "FOLDER01" / "OLDKEY.pdf"
+        # Adding a file to an existing folder leaves the storage/ mtime unchanged
+        (storage_dir / "FOLDER01" / "NEWKEY.pdf").write_bytes(b"%PDF")
+        assert connector._find_attachment_storage_path("NEWKEY") == storage_dir / "FOLDER01" / "NEWKEY.pdf"
+        assert connector._find_attachment_storage_path("NOKEY") is None
+
 
 class TestGetItemFullData:
     """Test cases for get_item_full_data method"""
@@ -1330,6 +1685,22 @@ class TestGetItemFullData:
 class TestNewMCPTools:
     """Test cases for new MCP tools"""
 
+    @pytest.fixture(autouse=True)
+    def fresh_server_caches(self):
+        """Run every test with empty MCP server caches, and leave them empty even when it fails"""
+        from zotlink import zotero_mcp_server
+
+        def clear():
+            for cache in (zotero_mcp_server._running_cache, zotero_mcp_server._collections_cache):
+                cache.invalidate()
+            for memo in (zotero_mcp_server._cached_doi_info, zotero_mcp_server._cached_arxiv_meta,
+                         zotero_mcp_server._pdf_text_reply):
+                memo.cache_clear()
+
+        clear()
+        yield
+        clear()
+
     def test_get_item_pdf_text_tool_registered(self):
         """Test that get_item_pdf_text tool is registered"""
         from zotlink.zotero_mcp_server import handle_list_tools
@@ -1361,6 +1732,212 @@ class TestNewMCPTools:
                 assert "include_details" in schema["properties"]
                 assert schema["properties"]["include_details"]["type"] == "boolean"
 
+    def test_get_zotero_collections_renders_tree(self):
+        """Test get_zotero_collections nests children under their parents in order"""
+        from zotlink import zotero_mcp_server
+        import asyncio
+        collections = [
+            {"id": 1, "key": "ROOT1", "name": "Root", "parentCollection": None},
+            {"id": 2, "key": "CHILD1", "name": "Child", "parentCollection": 1},
+            {"id": 3, "key": "GRAND1", "name": "Grandchild", "parentCollection": 2},
+            {"id": 4, "key": "ROOT2", "name": "Other", "parentCollection": False},
+        ]
+        with patch.object(zotero_mcp_server.zotero_connector, 'is_running', return_value=True), \
+             patch.object(zotero_mcp_server.zotero_connector, 'get_collections', return_value=collections):
+            result = asyncio.run(zotero_mcp_server.handle_call_tool("get_zotero_collections", {}))
+
+        text = result[0].text
+        assert "  Root\n    Key: ROOT1\n    Child\n      Key: CHILD1\n      Grandchild\n" in text
+        assert text.index("Grandchild") < text.index("Other")
+
+    def test_get_zotero_collections_large_tree(self):
+        """Test a large collection listing comes back as one complete reply"""
+        from zotlink import zotero_mcp_server
+        import asyncio
+        collections = [
+            {"id": i, "key": f"KEY{i}", "name": f"Collection {i}", "parentCollection": None}
+            for i in range(1200)
+        ]
+        with patch.object(zotero_mcp_server.zotero_connector, 'is_running', return_value=True), \
+             patch.object(zotero_mcp_server.zotero_connector, 'get_collections', return_value=collections):
+            result = asyncio.run(zotero_mcp_server.handle_call_tool("get_zotero_collections", {}))
+
+        assert len(result) == 1
+        text = result[0].text
+        assert text.startswith("Zotero Collection List (1200 total)\n")
+        assert "  Collection 1199\n    Key: KEY1199\n" in text
+        assert text.endswith("saved to the specified collection")
+
+    def test_doi_info_cached_only_on_success(self):
+        """Test DOI lookups are reused across saves but failures are retried"""
+        from zotlink import zotero_mcp_server
+        connector = zotero_mcp_server.zotero_connector
+        with patch.object(connector, '_build_paper_info_from_doi',
+                          return_value={"title": "Paper", "authors": "A"}) as mock_build:
+            first = zotero_mcp_server._paper_info_for_doi("10.1/ok")
+            first["title"] = "changed"
+            assert zotero_mcp_server._paper_info_for_doi("10.1/ok")["title"] == "Paper"
+        assert mock_build.call_count == 1
+
+        with patch.object(connector, '_build_paper_info_from_doi',
+                          return_value={"error": "not found"}) as mock_build:
+            assert zotero_mcp_server._paper_info_for_doi("10.1/bad") == {"error": "not found"}
+            zotero_mcp_server._paper_info_for_doi("10.1/bad")
+        assert mock_build.call_count == 2
+
+    def test_arxiv_metadata_cached_only_on_success(self):
+        """Test arXiv metadata is reused across tools but failures are retried"""
+        from zotlink import zotero_mcp_server
+        connector = zotero_mcp_server.zotero_connector
+        url = "https://arxiv.org/abs/2301.00001"
+        with patch.object(connector, '_extract_arxiv_metadata',
+                          return_value={"title": "Paper", "subjects": ["cs.AI"]}) as mock_extract:
+            first = zotero_mcp_server._arxiv_metadata(url)
+            first["subjects"].append("cs.LG")
+            assert zotero_mcp_server._arxiv_metadata(url)["subjects"] == ["cs.AI"]
+        assert mock_extract.call_count == 1
+
+        with pytest.raises(ArxivMetadataError, match="Cannot parse arXiv ID"):
+            zotero_mcp_server._arxiv_metadata("https://example.org/not-arxiv")
+        with patch.object(connector, '_extract_arxiv_metadata',
+                          side_effect=ArxivMetadataError("Cannot parse arXiv ID")) as mock_extract:
+            for _ in range(2):
+                with pytest.raises(ArxivMetadataError):
+                    zotero_mcp_server._arxiv_metadata("bad")
+        assert mock_extract.call_count == 2
+
+    def test_ttl_cache_reuses_value_until_expired_or_invalidated(self):
+        """Test _TTLCache calls through only when its value is stale"""
+        from zotlink.zotero_mcp_server import _TTLCache
+        import asyncio
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return len(calls)
+
+        cache = _TTLCache(60.0)
+        assert asyncio.run(cache.get_or(probe)) == 1
+        assert asyncio.run(cache.get_or(probe)) == 1
+        cache.invalidate()
+        assert asyncio.run(cache.get_or(probe)) == 2
+
+        with patch('zotlink.zotero_mcp_server.time.monotonic', return_value=time.monotonic() + 61):
+            assert asyncio.run(cache.get_or(probe)) == 3
+
+    def test_back_to_back_tool_calls_probe_zotero_once(self):
+        """Test consecutive tool calls share one is_running probe"""
+        from zotlink import zotero_mcp_server
+        import asyncio
+        with patch.object(zotero_mcp_server.zotero_connector, 'is_running', return_value=True) as is_running, \
+             patch.object(zotero_mcp_server.zotero_connector, 'delete_item', return_value=True):
+            for _ in range(3):
+                asyncio.run(zotero_mcp_server.handle_call_tool("delete_zotero_item", {"item_key": "K"}))
+        assert is_running.call_count == 1
+
+    def test_empty_collections_not_cached_while_zotero_down(self):
+        """Test a status check with Zotero down does not hide collections once it starts"""
+        from zotlink import zotero_mcp_server
+        import asyncio
+        with patch.object(zotero_mcp_server.zotero_connector, 'is_running', return_value=False), \
+             patch.object(zotero_mcp_server.zotero_connector, 'get_version', return_value="unknown"), \
+             patch.object(zotero_mcp_server.zotero_connector, 'get_collections', return_value=[]) as get_collections:
+            asyncio.run(zotero_mcp_server.handle_call_tool("check_zotero_status", {}))
+            assert get_collections.call_count == 0
+            # An empty read (Zotero still starting) is not remembered either
+            asyncio.run(zotero_mcp_server._collections_cache.get_or(zotero_mcp_server.zotero_connector.get_collections))
+
+        # Zotero starts
+        zotero_mcp_server._running_cache.invalidate()
+        collections = [{"key": "C1", "name": "Papers", "parentCollection": None}]
+        with patch.object(zotero_mcp_server.zotero_connector, 'is_running', return_value=True), \
+             patch.object(zotero_mcp_server.zotero_connector, 'get_collections', return_value=collections):
+            result = asyncio.run(zotero_mcp_server.handle_call_tool("get_zotero_collections", {}))
+        assert "Papers" in result[0].text
+
+    def test_arxiv_field_diffs(self):
+        """Test validators ignore title case/newlines and dates missing in Zotero"""
+        from zotlink.zotero_mcp_server import _arxiv_field_diffs
+        metadata = {"title": "Attention Is\nAll You Need ", "date": "2017-06-12"}
+        assert _arxiv_field_diffs({"title": "attention is all you need"}, metadata) == {}
+        assert _arxiv_field_diffs({"title": "Other", "date": "2017"}, metadata) == {
+            "title": ("Other", "Attention Is All You Need"),
+            "date": ("2017", "2017-06-12"),
+        }
+
+    def test_every_listed_tool_has_a_handler(self):
+        """Test the dispatch table covers exactly the advertised tools"""
+        from zotlink import zotero_mcp_server
+        import asyncio
+        assert set(zotero_mcp_server._TOOL_HANDLERS) == {t.name for t in zotero_mcp_server._TOOLS}
+        result = asyncio.run(zotero_mcp_server.handle_call_tool("no_such_tool", {}))
+        assert result[0].text == "Unknown tool: no_such_tool"
+
+    def test_fixed_replies_are_reused(self):
+        """Test repeated static replies come from the response cache"""
+        from zotlink import zotero_mcp_server
+        import asyncio
+        first = asyncio.run(zotero_mcp_server.handle_call_tool("get_zotero_item", {"item_key": ""}))
+        second = asyncio.run(zotero_mcp_server.handle_call_tool("delete_zotero_item", {}))
+        assert first[0].text == "Missing item key"
+        assert first is second
+
+    def test_pdf_text_reply_rendered_once_per_text(self):
+        """Test an unchanged PDF reuses its rendered get_item_pdf_text reply"""
+        from zotlink import zotero_mcp_server
+        text = "x" * 2500
+        first = zotero_mcp_server._pdf_text_reply("Paper", 3, 2500, text[:2001])
+        second = zotero_mcp_server._pdf_text_reply("Paper", 3, 2500, text[:2001])
+        assert first is second
+        assert "Characters: 2,500" in first
+        assert "x" * 2000 + "...\n" in first
+        assert zotero_mcp_server._pdf_text_reply.cache_info().hits == 1
+
+    def test_large_library_page_read_in_one_query(self):
+        """Test a large get_library_items limit is served by one consistent read"""
+        from zotlink import zotero_mcp_server
+        import asyncio
+
+        def page(limit, offset, include_details):
+            return {"success": True, "items": [{"title": f"T{n}", "itemKey": f"K{n}"} for n in range(offset, offset + limit)]}
+
+        with patch.object(zotero_mcp_server.zotero_connector, 'is_running', return_value=True), \
+             patch.object(zotero_mcp_server.zotero_connector, 'get_library_items', side_effect=page) as mock_page:
+            result = asyncio.run(zotero_mcp_server.handle_call_tool("get_library_items", {"limit": 120, "offset": 10}))
+        mock_page.assert_called_once_with(limit=120, offset=10, include_details=False)
+        text = result[0].text
+        assert "showing 120 items" in text
+        assert text.index("Key: K10") < text.index("Key: K60") < text.index("Key: K129")
+
+    def test_validate_reads_item_while_probing_zotero(self):
+        """Test validate_zotero_item starts the item read before the liveness probe returns"""
+        from zotlink import zotero_mcp_server
+        import asyncio
+        import threading
+        item_read = threading.Event()
+
+        def get_item(item_key, include_attachments=True):
+            item_read.set()
+            return {"DOI": "10.1/x"}
+
+        with patch.object(zotero_mcp_server.zotero_connector, 'is_running', side_effect=lambda: item_read.wait(5)), \
+             patch.object(zotero_mcp_server.zotero_connector, 'get_item', side_effect=get_item):
+            result = asyncio.run(zotero_mcp_server.handle_call_tool("validate_zotero_item", {"item_key": "K"}))
+        assert "does not have an arXiv DOI" in result[0].text
+
+    def test_validate_accepts_any_arxiv_doi_casing(self):
+        """Test validate_zotero_item matches the arXiv DOI prefix case-insensitively"""
+        from zotlink import zotero_mcp_server
+        import asyncio
+        metadata = {"title": "Attention", "abstract": "", "authors": [], "published": ""}
+
+        with patch.object(zotero_mcp_server.zotero_connector, 'is_running', return_value=True), \
+             patch.object(zotero_mcp_server.zotero_connector, 'get_item', return_value={"DOI": "10.48550/Arxiv.1706.03762", "title": "Attention"}), \
+             patch.object(zotero_mcp_server, '_arxiv_metadata', return_value=metadata) as fetch:
+            result = asyncio.run(zotero_mcp_server.handle_call_tool("validate_zotero_item", {"item_key": "K"}))
+        fetch.assert_called_once_with("https://arxiv.org/abs/1706.03762")
+        assert "arXiv ID: 1706.03762" in result[0].text
+
     def test_get_zotero_item_include_attachments_param(self):
         """Test get_zotero_item tool accepts include_attachments parameter"""
         from zotlink.zotero_mcp_server import handle_list_tools
@@ -1371,3 +1948,94 @@ class TestNewMCPTools:
                 schema = tool.inputSchema
                 assert "include_attachments" in schema["properties"]
                 assert schema["properties"]["include_attachments"]["type"] == "boolean"
+
+
+class TestCookieConfig:
+    """Test cases for cookies.json loading and caching"""
+
+    @pytest.fixture
+    def connector(self):
+        return ZoteroConnector()
+
+    @pytest.fixture
+    def cookies_json(self, tmp_path):
+        path = tmp_path / "cookies.json"
+        path.write_text(json.dumps({
+            "databases": {
+                "nature": {"name": "Nature", "status": "inactive", "cookies": "", "cookie_count": 0}
+            }
+        }), encoding="utf-8")
+        return path
+
+    def test_load_cookies_config_cached_until_file_changes(self, connector, cookies_json):
+        """Test parsed cookies.json is reused while mtime/size are unchanged"""
+        first = connector._load_cookies_config(cookies_json)
+        assert connector._load_cookies_config(cookies_json) is first
+
+        cookies_json.write_text(json.dumps({"databases": {}, "version": 2}), encoding="utf-8")
+        os.utime(cookies_json, ns=(0, 0))
+        second = connector._load_cookies_config(cookies_json)
+        assert second is not first
+        assert second["version"] == 2
+
+    def test_cookies_snapshot_served_until_watcher_reports_change(self, connector, cookies_json):
+        """Test a watched cookies.json snapshot is reused until the generation changes"""
+        connector._resolved_cookies_json_path = cookies_json
+        connector._cookies_watch_path = cookies_json
+
+        with patch.object(connector, '_start_cookies_watcher'):
+            first = connector._cookies_config_snapshot()
+            cookies_json.write_text(json.dumps({"databases": {}, "version": 2}), encoding="utf-8")
+            os.utime(cookies_json, ns=(0, 0))
+            assert connector._cookies_config_snapshot() is first
+
+            connector._cookies_json_generation += 1
+            assert connector._cookies_config_snapshot()["version"] == 2
+
+    def test_update_database_cookies_writes_atomically(self, connector, cookies_json):
+        """Test update_database_cookies replaces the file and leaves no temp file"""
+        connector._resolved_cookies_json_path = cookies_json
+
+        with patch.object(connector, 'set_database_cookies', return_value=True):
+            assert connector.update_database_cookies("nature", "a=1; b=2") is True
+
+        saved = json.loads(cookies_json.read_text(encoding="utf-8"))
+        assert saved["databases"]["nature"]["status"] == "active"
+        assert saved["databases"]["nature"]["cookie_count"] == 2
+        assert not cookies_json.with_suffix(".json.tmp").exists()
+        assert connector.get_databases_status()["nature"]["cookie_count"] == 2
+
+    def test_load_cookies_from_nature_txt_skips_comments(self, connector, tmp_path, monkeypatch):
+        """Test nature_cookies.txt lines are joined with comments and blanks dropped"""
+        config_dir = tmp_path / ".zotlink"
+        config_dir.mkdir()
+        (config_dir / "nature_cookies.txt").write_text("# exported cookies\n  a=1;\n\n   # note\nb=2 \n", encoding="utf-8")
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        connector._resolved_cookies_json_path = config_dir / "cookies.json"
+
+        with patch.object(connector, 'set_database_cookies', return_value=True) as mock_set:
+            results = connector.load_cookies_from_files()
+
+        assert results["nature_txt"] is True
+        mock_set.assert_any_call('nature', "a=1; b=2")
+
+
+class TestDatabaseRegistry:
+    """Test cases for the cookie database registry"""
+
+    def test_bulk_update_cookie_status(self):
+        """Test bulk updates mark known databases configured and skip the rest"""
+        from zotlink.cookie_sync.database_registry import DatabaseRegistry
+
+        registry = DatabaseRegistry()
+        updated = registry.bulk_update_cookie_status({
+            "nature": "session=a; auth=b",
+            "science": "   ",
+            "unknown": "session=c",
+        })
+
+        assert updated == 1
+        assert registry.is_cookies_valid("nature")
+        assert registry.cookie_status["nature"]["cookie_count"] == 2
+        assert not registry.is_cookies_valid("science")
+        assert "unknown" not in registry.cookie_status
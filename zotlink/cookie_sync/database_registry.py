@@ -124,19 +124,9 @@ class DatabaseRegistry:
             return
         
         now = datetime.now()
-        db_config = self.databases.get(identifier)
         
         if cookies and cookies.strip():
-            expires_at = now + timedelta(hours=db_config.cookie_expiry_hours if db_config else 24)
-            cookie_count = len([c for c in cookies.split(';') if c.strip()])
-            
-            self.cookie_status[identifier].update({
-                "has_cookies": True,
-                "last_updated": now,
-                "expires_at": expires_at,
-                "cookie_count": cookie_count,
-                "status": "已配置"
-            })
+            self._mark_configured(identifier, cookies, now)
         else:
             self.cookie_status[identifier].update({
                 "has_cookies": False,
@@ -146,6 +136,33 @@ class DatabaseRegistry:
                 "status": "配置失败"
             })
     
+    def bulk_update_cookie_status(self, updates: Dict[str, str]) -> int:
+        """批量更新多个数据库的cookie状态，返回已更新的数据库数量"""
+        now = datetime.now()
+        updated = 0
+        
+        for identifier, cookies in updates.items():
+            if identifier not in self.cookie_status or not cookies or not cookies.strip():
+                continue
+            self._mark_configured(identifier, cookies, now)
+            updated += 1
+        
+        return updated
+    
+    def _mark_configured(self, identifier: str, cookies: str, now: datetime):
+        """记录数据库已配置cookies"""
+        db_config = self.databases.get(identifier)
+        expires_at = now + timedelta(hours=db_config.cookie_expiry_hours if db_config else 24)
+        cookie_count = len([c for c in cookies.split(';') if c.strip()])
+        
+        self.cookie_status[identifier].update({
+            "has_cookies": True,
+            "last_updated": now,
+            "expires_at": expires_at,
+            "cookie_count": cookie_count,
+            "status": "已配置"
+        })
+    
     def get_all_databases(self) -> Dict[str, DatabaseConfig]:
         """获取所有注册的数据库"""
         return self.databases.copy()
@@ -11,15 +11,27 @@ import requests
 import json
 import time
 import re
+import random
+import string
 import sqlite3
 import tempfile
 import shutil
 import os
+import io
+import mmap
+import threading
+import traceback
+import urllib.request
+from urllib.parse import urlsplit
+import concurrent.futures
+import copy
+import functools
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 
 # 导入提取器管理器
 try:
@@ -37,10 +49,164 @@ except ImportError:
         EXTRACTORS_AVAILABLE = False
         logging.warning("Extractor manager not available，仅支持arXiv")
 
+# 可选：使用orjson加速cookies配置的解析与序列化
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# 可选：使用watchdog监听cookies.json变化，未安装时回退到按mtime检查
+try:
+    from watchdog.observers import Observer as _WatchdogObserver
+    from watchdog.events import FileSystemEventHandler as _WatchdogEventHandler
+except ImportError:
+    _WatchdogObserver = None
+    _WatchdogEventHandler = object
+
 from .utils import AuthorParser, DateParser
 
 logger = logging.getLogger(__name__)
 
+# 书签同步的站点名 -> 数据库标识
+_SITE_TO_DB = {
+    'www.nature.com': 'nature',
+    'nature.com': 'nature',
+    'www.science.org': 'science',
+    'science.org': 'science',
+    'ieeexplore.ieee.org': 'ieee',
+    'link.springer.com': 'springer'
+}
+
+# Non-comment lines of nature_cookies.txt, without surrounding whitespace
+_COOKIE_LINE_RE = re.compile(rb'(?m)^(?![ \t]*#)[ \t]*(\S.*?)\s*$')
+
+# arXiv identifiers inside DOIs/URLs and whitespace runs in abstracts
+_RE_ARXIV_NUM = re.compile(r'(\d+\.\d+)')
+_RE_ARXIV_ID = re.compile(r'arxiv[\.:]*(\d+\.\d+)', re.IGNORECASE)
+_RE_WS = re.compile(r'\s+')
+
+# Zotero creator types counted as authors when comparing with arXiv
+_AUTHOR_TYPES = frozenset({"author", "coauthor"})
+
+# Key -> ID lookups, bound to the configured library
+_ITEM_ID_SQL = "SELECT itemID FROM items WHERE key = ? AND libraryID = ?"
+_COLLECTION_ID_SQL = "SELECT collectionID FROM collections WHERE libraryID = ? AND collectionKey = ?"
+
+# Composite indexes for the key and PDF-attachment lookups, created only when
+# ZOTLINK_CREATE_INDEXES is set since they are written into Zotero's database
+_HELPER_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS zotlink_items_lib_key ON items(libraryID, key)",
+    "CREATE INDEX IF NOT EXISTS zotlink_attach_parent_ctype ON attachments(parentItemID, contentType)",
+)
+
+# Keys per IN (...) query, well below SQLite's bound-parameter limit
+_SQL_IN_CHUNK = 500
+
+# Child tables first, then items, so foreign keys stay satisfied; the text of a
+# full chunk is identical every time, so sqlite3's statement cache reuses it
+_DELETE_ITEM_SQL = tuple(
+    f"DELETE FROM {table} WHERE itemID IN ({{}})"
+    for table in ("itemTags", "itemCreators", "itemData", "items")
+)
+
+# Keys of the summary dicts returned for library listings, in row order
+_ITEM_KEYS = ("itemKey", "itemID", "itemType", "dateAdded", "dateModified", "title")
+
+# Keys of attachment and note dicts, matching the column order of their queries
+_ATTACHMENT_KEYS = ("attachmentItemID", "key", "filename", "contentType", "path", "storagePath")
+_NOTE_KEYS = ("noteItemID", "key", "note")
+
+# Upper bound on entries kept by each read-result LRU cache
+_READ_CACHE_SIZE = 256
+# Extracted PDF texts can be large, so only the most recent few are kept
+_PDF_TEXT_CACHE_SIZE = 32
+
+# 站点特定的PDF最小体积（按host后缀匹配）：(站点名称, 最小字节数)
+_SITE_MIN_PDF_SIZE = {
+    'nature.com': ('Nature', 500000),  # Nature PDF通常至少500KB
+}
+
+# Single-row item lookup with fields and creators aggregated as JSON
+_ITEM_FULL_SQL = """
+    SELECT i.itemID, i.key, i.dateAdded, i.dateModified, t.typeName,
+           (SELECT json_group_object(f.fieldName, v.value)
+            FROM itemData d
+            JOIN fields f ON d.fieldID = f.fieldID
+            JOIN itemDataValues v ON d.valueID = v.valueID
+            WHERE d.itemID = i.itemID) AS fields_json,
+           {creators} AS creators_json
+    FROM items i
+    JOIN itemTypes t ON i.itemTypeID = t.itemTypeID
+    WHERE i.key = ? AND i.libraryID = ?
+"""
+_ITEM_CREATORS_SQL = """(SELECT json_group_array(json_object(
+                'firstName', c.firstName,
+                'lastName', c.lastName,
+                'creatorType', ct.creatorType))
+            FROM itemCreators ic
+            JOIN creators c ON c.creatorID = ic.creatorID
+            JOIN creatorTypes ct ON ic.creatorTypeID = ct.creatorTypeID
+            WHERE ic.itemID = i.itemID)"""
+
+
+def _pdf_page_text(page: Any) -> str:
+    """Plain-mode text of a pypdf page (older pypdf has no extraction_mode argument)"""
+    try:
+        return page.extract_text(extraction_mode="plain") or ""
+    except TypeError:
+        return page.extract_text() or ""
+
+
+class ArxivMetadataError(Exception):
+    """Raised by ZoteroConnector._extract_arxiv_metadata when the abstract page cannot be read"""
+
+
+class _ArxivLookupError(Exception):
+    """Carries an arXiv error result out of the cached fetch so it is not cached"""
+
+    def __init__(self, metadata: Dict):
+        super().__init__(metadata.get("error"))
+        self.metadata = metadata
+
+
+@functools.lru_cache(maxsize=512)
+def _fetch_arxiv_metadata_cached(arxiv_url: str) -> Dict:
+    from .extractors.arxiv_extractor import ArxivAPIExtractor
+    metadata = ArxivAPIExtractor().extract_metadata(arxiv_url)
+    if "error" in metadata:
+        raise _ArxivLookupError(metadata)
+    return metadata
+
+
+def _fetch_arxiv_metadata(arxiv_url: str) -> Dict:
+    """arXiv API metadata for a URL; successful lookups are cached per process"""
+    try:
+        return copy.deepcopy(_fetch_arxiv_metadata_cached(arxiv_url))
+    except _ArxivLookupError as e:
+        return e.metadata
+
+
+class _CookiesFileHandler(_WatchdogEventHandler):
+    """Marks the connector's cookies.json snapshot stale when the file changes"""
+
+    def __init__(self, connector: "ZoteroConnector", json_config_file: Path):
+        super().__init__()
+        self._connector = connector
+        self._name = json_config_file.name
+
+    def on_any_event(self, event):
+        for path in (event.src_path, getattr(event, 'dest_path', '')):
+            if path and os.path.basename(os.fsdecode(path)) == self._name:
+                self._connector._cookies_json_generation += 1
+                return
+
 
 class ZoteroConnector:
     """ZotLink的Zotero连接器（扩展版本）"""
@@ -54,6 +220,55 @@ class ZoteroConnector:
             'Content-Type': 'application/json'
         })
         
+        # saveItems/updateSession等写入请求按线程复用keep-alive会话（requests.Session不保证线程安全）
+        self._save_local = threading.local()
+        
+        # 记录每个base_url上次成功的附件上传端点，避免重复尝试失败端点
+        self._attach_endpoint_cache: Dict[str, str] = {}
+        
+        # cookies.json解析缓存：(路径, st_mtime_ns, st_size, 配置)
+        self._cookies_json_cache: Optional[tuple] = None
+        self._resolved_cookies_json_path: Optional[Path] = None
+        
+        # watchdog观察线程：文件变化时递增generation，快照据此失效
+        self._cookies_observer = None
+        self._cookies_watch_path: Optional[Path] = None
+        self._cookies_watch_disabled = _WatchdogObserver is None
+        self._cookies_watch_lock = threading.Lock()
+        self._cookies_json_generation = 0
+        self._cookies_snapshot_generation = -1
+        
+        # 操作的Zotero库（个人库的libraryID为1）
+        self._library_id = 1
+        
+        # 可选：在Zotero数据库上创建辅助索引（会写入用户数据库，默认关闭）
+        self._create_indexes = os.environ.get('ZOTLINK_CREATE_INDEXES', '').strip().lower() in ('1', 'true', 'yes')
+        self._indexed_db_path: Optional[Path] = None
+        
+        # 只读SQLite连接按线程复用（sqlite3连接不能被多个线程同时查询）
+        self._ro_local = threading.local()
+        self._index_lock = threading.Lock()
+        
+        # 写连接按线程复用（显式事务不能跨线程共享同一连接）
+        self._rw_local = threading.local()
+        
+        # 已确认存在的数据库路径，查询失败时清空以重新检查
+        self._db_exists_path: Optional[Path] = None
+        
+        # fields表（fieldName -> fieldID）缓存：(数据库路径, 映射)
+        self._field_id_cache: Optional[tuple] = None
+        
+        # storage目录下附件文件索引：(目录, st_mtime_ns, {附件key: 路径})
+        self._storage_index: Optional[tuple] = None
+        
+        # get_item / get_library_items结果的LRU缓存，键中包含数据库签名
+        self._item_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self._items_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        
+        # PDF文本提取缓存：(文件路径, st_size, st_mtime_ns) -> 文本与页数
+        self._pdf_text_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        
         # 初始化配置与数据库路径
         self._zotero_storage_dir: Optional[Path] = None
         self._zotero_db_override: Optional[Path] = None
@@ -190,12 +405,12 @@ class ZoteroConnector:
             logger.warning(f"Failed to load Claude config: {e}")
     
     def _extract_arxiv_metadata(self, arxiv_url: str) -> Dict:
-        """Extract detailed paper metadata from arXiv URL"""
+        """Extract detailed paper metadata from arXiv URL; raises ArxivMetadataError on failure"""
         try:
             # Extract arXiv ID
             arxiv_id_match = re.search(r'arxiv\.org/(abs|pdf)/([^/?]+)', arxiv_url)
             if not arxiv_id_match:
-                return {"error": "Cannot parse arXiv ID"}
+                raise ArxivMetadataError("Cannot parse arXiv ID")
             
             arxiv_id = arxiv_id_match.group(2)
             logger.info(f"Extract arXiv ID: {arxiv_id}")
@@ -205,7 +420,7 @@ class ZoteroConnector:
             response = self.session.get(abs_url, timeout=10)
             
             if response.status_code != 200:
-                return {"error": f"Cannot access arXiv page: {response.status_code}"}
+                raise ArxivMetadataError(f"Cannot access arXiv page: {response.status_code}")
             
             html_content = response.text
             
@@ -333,7 +548,6 @@ class ZoteroConnector:
                     date_str = date_match.group(1).strip()
                     # 转换日期格式为标准格式
                     try:
-                        import datetime
                         # 尝试解析各种日期格式
                         for fmt in ['%d %b %Y', '%B %d, %Y', '%Y-%m-%d']:
                             try:
@@ -405,9 +619,11 @@ class ZoteroConnector:
             logger.info(f"Successfully extracted arXiv metadata: {metadata.get('title', 'Unknown')}")
             return metadata
             
+        except ArxivMetadataError:
+            raise
         except Exception as e:
             logger.error(f"Failed to extract arXiv metadata: {e}")
-            return {"error": f"Metadata extraction failed: {e}"}
+            raise ArxivMetadataError(f"Metadata extraction failed: {e}") from e
     
     def _enhance_paper_info_for_arxiv(self, paper_info: Dict) -> Dict:
         """Enhance metadata for arXiv papers"""
@@ -415,31 +631,32 @@ class ZoteroConnector:
         
         if 'arxiv.org' in url:
             logger.info("Detected arXiv paper, enhancing metadata......")
-            arxiv_metadata = self._extract_arxiv_metadata(url)
+            try:
+                arxiv_metadata = self._extract_arxiv_metadata(url)
+            except ArxivMetadataError as e:
+                logger.warning(f"arXiv metadata enhancement failed: {e}")
+                return paper_info
+            
+            # Merge metadata, prefer arXiv extracted info
+            enhanced_info = paper_info.copy()
+            enhanced_info.update({
+                'title': arxiv_metadata.get('title', paper_info.get('title', '')),
+                'authors': arxiv_metadata.get('authors_string', paper_info.get('authors', '')),
+                'abstract': arxiv_metadata.get('abstract', paper_info.get('abstract', '')),
+                'date': arxiv_metadata.get('date', paper_info.get('date', '')),
+                'journal': 'arXiv',
+                'itemType': 'preprint',
+                'url': arxiv_metadata.get('abs_url', url),
+                'arxiv_id': arxiv_metadata.get('arxiv_id', ''),
+                'pdf_url': arxiv_metadata.get('pdf_url', ''),
+                'comment': arxiv_metadata.get('comment', ''),  # 添加comment信息
+                'subjects': arxiv_metadata.get('subjects', []),  # 添加学科信息
+                'doi': arxiv_metadata.get('doi', ''),  # 添加DOI
+                'published_journal': arxiv_metadata.get('published_journal', ''),  # 添加发表期刊
+            })
             
-            if 'error' not in arxiv_metadata:
-                # Merge metadata, prefer arXiv extracted info
-                enhanced_info = paper_info.copy()
-                enhanced_info.update({
-                    'title': arxiv_metadata.get('title', paper_info.get('title', '')),
-                    'authors': arxiv_metadata.get('authors_string', paper_info.get('authors', '')),
-                    'abstract': arxiv_metadata.get('abstract', paper_info.get('abstract', '')),
-                    'date': arxiv_metadata.get('date', paper_info.get('date', '')),
-                    'journal': 'arXiv',
-                    'itemType': 'preprint',
-                    'url': arxiv_metadata.get('abs_url', url),
-                    'arxiv_id': arxiv_metadata.get('arxiv_id', ''),
-                    'pdf_url': arxiv_metadata.get('pdf_url', ''),
-                    'comment': arxiv_metadata.get('comment', ''),  # 添加comment信息
-                    'subjects': arxiv_metadata.get('subjects', []),  # 添加学科信息
-                    'doi': arxiv_metadata.get('doi', ''),  # 添加DOI
-                    'published_journal': arxiv_metadata.get('published_journal', ''),  # 添加发表期刊
-                })
-                
-                logger.info(f"arXiv metadata enhancement complete: {enhanced_info.get('title', 'Unknown')}")
-                return enhanced_info
-            else:
-                logger.warning(f"arXiv metadata enhancement failed: {arxiv_metadata.get('error', 'Unknown')}")
+            logger.info(f"arXiv metadata enhancement complete: {enhanced_info.get('title', 'Unknown')}")
+            return enhanced_info
         
         return paper_info
 
@@ -454,7 +671,6 @@ class ZoteroConnector:
         Returns:
             Dictionary containing paper metadata, or {'error': ...} on failure
         """
-        import re
         
         try:
             # Clean up DOI
@@ -648,9 +864,125 @@ class ZoteroConnector:
         logger.warning("未Found Zotero database文件")
         return None
 
+    def _open_readonly_db(self, db_path: Path) -> sqlite3.Connection:
+        """Open the Zotero database read-only with read-friendly pragmas"""
+        conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True,
+                               cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        for pragma in ("query_only=1", "temp_store=MEMORY", "mmap_size=268435456",
+                       "cache_size=-64000", "busy_timeout=5000"):
+            conn.execute(f"PRAGMA {pragma}")
+        return conn
+
+    def _open_write_db(self, db_path: Path) -> sqlite3.Connection:
+        """Open the Zotero database for writing with explicit transaction control"""
+        conn = sqlite3.connect(str(db_path), isolation_level=None)
+        for pragma in ("synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-64000", "busy_timeout=5000"):
+            conn.execute(f"PRAGMA {pragma}")
+        return conn
+
+    def _ensure_indexes(self, db_path: Path) -> None:
+        """Create ZotLink's lookup indexes once per database (opt-in via ZOTLINK_CREATE_INDEXES)"""
+        if not self._create_indexes or self._indexed_db_path == db_path:
+            return
+        self._indexed_db_path = db_path
+
+        try:
+            conn = self._open_write_db(db_path)
+            try:
+                for sql in _HELPER_INDEXES:
+                    conn.execute(sql)
+            finally:
+                conn.close()
+            logger.info(f"Ensured ZotLink indexes on {db_path}")
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 创建辅助索引失败: {e}")
+
+    def _rw(self) -> sqlite3.Connection:
+        """Return this thread's pooled write connection, reopening it if the database path changed"""
+        db_path = self._get_zotero_db_path()
+        local = self._rw_local
+        if getattr(local, "conn", None) is not None and local.path == db_path:
+            return local.conn
+        self._close_rw_connection()
+        local.conn = self._open_write_db(db_path)
+        local.path = db_path
+        return local.conn
+
+    def _close_rw_connection(self) -> None:
+        """Drop this thread's pooled write connection"""
+        local = self._rw_local
+        conn = getattr(local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        local.conn = None
+        local.path = None
+
+    def _save_session(self) -> requests.Session:
+        """Return this thread's keep-alive session for connector save requests"""
+        session = getattr(self._save_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Content-Type': 'application/json',
+                'X-Zotero-Version': '5.0.97',
+                'X-Zotero-Connector-API-Version': '3'
+            })
+            self._save_local.session = session
+        return session
+
+    def _db_available(self, db_path: Optional[Path]) -> bool:
+        """Whether the database file exists; a hit is remembered until a query fails"""
+        if not db_path:
+            return False
+        if self._db_exists_path == db_path:
+            return True
+        if not db_path.exists():
+            return False
+        self._db_exists_path = db_path
+        return True
+
+    def _ro(self) -> sqlite3.Connection:
+        """Return this thread's pooled read-only connection, reopening it if the database path changed"""
+        db_path = self._get_zotero_db_path()
+        local = self._ro_local
+        conn = getattr(local, "conn", None)
+        if conn is not None and local.path == db_path:
+            try:
+                conn.execute("SELECT 1")
+                return conn
+            except sqlite3.Error:
+                pass
+        self._close_ro_connection_local()
+        with self._index_lock:
+            self._ensure_indexes(db_path)
+        local.conn = self._open_readonly_db(db_path)
+        local.path = db_path
+        return local.conn
+
+    def _close_ro_connection_local(self) -> None:
+        local = self._ro_local
+        conn = getattr(local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        local.conn = None
+        local.path = None
+
+    def _close_ro_connection(self) -> None:
+        """Drop this thread's pooled read-only connection so its next query reopens it"""
+        self._close_ro_connection_local()
+        self._db_exists_path = None
+
     def _read_collections_from_db(self) -> List[Dict]:
         """Read collections directly from database"""
-        if not self._zotero_db_path or not self._zotero_db_path.exists():
+        if not self._db_available(self._zotero_db_path):
             logger.error("Zotero数据库文件不存在")
             return []
         
@@ -883,8 +1215,7 @@ class ZoteroConnector:
                 zotero_item["libraryCatalog"] = "arXiv.org"
                 
                 # 美式日期时间格式
-                import datetime
-                now = datetime.datetime.now()
+                now = datetime.now()
                 month = now.month
                 day = now.day
                 year = now.year
@@ -1019,14 +1350,11 @@ class ZoteroConnector:
             PDF文件的二进制内容，失败返回None
         """
         try:
-            import requests
-            
             # 🧬 特殊处理：bioRxiv使用MCP高级浏览器下载
             if 'biorxiv.org' in pdf_url.lower():
                 logger.info("🧬 检测到bioRxiv - 启动MCP高级浏览器下载")
                 try:
                     # 使用事件循环兼容的异步调用
-                    import asyncio
                     # 使用包内相对导入，避免在运行环境中找不到顶级模块
                     from .extractors.browser_extractor import BrowserExtractor
                     
@@ -1035,8 +1363,6 @@ class ZoteroConnector:
                             return await extractor._download_biorxiv_with_mcp(extractor, pdf_url)
                     
                     # 在新线程中创建新事件循环执行异步任务
-                    import concurrent.futures
-                    import threading
                     
                     def run_in_thread():
                         # 在新线程中创建新事件循环
@@ -1059,9 +1385,6 @@ class ZoteroConnector:
                         # 回退：使用通用反爬虫下载器
                         # 在独立线程中调用异步下载器，避免事件循环冲突
                         try:
-                            import concurrent.futures
-                            import asyncio
-                            
                             def run_fallback_thread():
                                 new_loop = asyncio.new_event_loop()
                                 asyncio.set_event_loop(new_loop)
@@ -1086,9 +1409,6 @@ class ZoteroConnector:
                     # 异常也尝试备用下载器
                     # 异常路径同样在线程中调用异步下载器
                     try:
-                        import concurrent.futures
-                        import asyncio
-                        
                         def run_fallback_thread():
                             new_loop = asyncio.new_event_loop()
                             asyncio.set_event_loop(new_loop)
@@ -1144,7 +1464,6 @@ class ZoteroConnector:
                         if attempt < max_retries - 1:
                             wait_time = 2 ** attempt  # 指数退避：1s, 2s, 4s
                             logger.warning(f"⚠️ PDF下载中断: {type(e).__name__}，{wait_time}秒后重试 (第{attempt+1}/{max_retries}次)")
-                            import time
                             time.sleep(wait_time)
                             continue
                         else:
@@ -1218,16 +1537,9 @@ class ZoteroConnector:
                            collection_key: Optional[str] = None) -> Dict:
         """Save via Connector API - practical solution"""
         try:
-            import time
-            import json
-            import requests
-            
             session_id = f"success-test-{int(time.time() * 1000)}"
             
             # 🎯 Follow official plugin method: generate random ID
-            import random
-            import string
-            
             # 生成8位随机字符串ID（模仿官方插件）
             random_item_id = ''.join(random.choices(string.ascii_letters + string.digits, k=8))
             
@@ -1263,19 +1575,11 @@ class ZoteroConnector:
                     comment_line = [line for line in clean_item['extra'].split('\n') if 'Comment:' in line][0]
                     logger.info(f"📝 Comment预览: {comment_line}")
             
-            # 生成item_id和headers（需要在PDF处理前定义）
+            # 生成item_id（需要在PDF处理前定义）
             item_id = f"item_{int(time.time() * 1000)}"
             clean_item["id"] = item_id
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Content-Type': 'application/json',
-                'X-Zotero-Version': '5.0.97',
-                'X-Zotero-Connector-API-Version': '3'
-            }
-            
-            session = requests.Session()
-            session.headers.update(headers)
+            session = self._save_session()
             
             # 🎯 最终策略：不在saveItems中包含附件，稍后手动触发下载
             pdf_url = zotero_item.get('pdf_url')
@@ -1285,8 +1589,6 @@ class ZoteroConnector:
                 logger.info("Will manually trigger PDF download after save")
             
             # Generate random ID for item
-            import random
-            import string
             item_id = ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(8))
             clean_item["id"] = item_id
             
@@ -1308,13 +1610,14 @@ class ZoteroConnector:
             }
             
             # Set target collection
+            tree_view_id = None
             if collection_key:
                 tree_view_id = self._get_collection_tree_view_id(collection_key)
                 if tree_view_id:
                     payload["target"] = tree_view_id
                     logger.info(f"🎯 使用treeViewID: {tree_view_id}")
             
-            # headers和session已经在上面定义了
+            # session已经在上面定义了
             
             # Save item
             response = session.post(f"{self.base_url}/connector/saveItems", json=payload, timeout=30)
@@ -1329,6 +1632,7 @@ class ZoteroConnector:
             
             # CORRECT: Use saveAttachment API for PDF
             pdf_attachment_success = False
+            attachment_metadata = None
             
             if pdf_url:
                 logger.info(f"Found PDF link: {pdf_url}")
@@ -1344,18 +1648,16 @@ class ZoteroConnector:
                     
                     if pdf_content:
                         # 🔍 诊断：检查下载内容的实际类型
-                        logger.info(f"📊 PDF内容大小: {len(pdf_content)} bytes")
+                        logger.info("📊 PDF内容大小: %d bytes", len(pdf_content))
                         
                         # 检查是否真的是PDF（前几个字节应该是%PDF）
                         if pdf_content[:4] != b'%PDF':
-                            logger.error(f"❌ 下载的内容不是PDF！前20字节: {pdf_content[:20]}")
+                            logger.error("❌ 下载的内容不是PDF！前20字节: %r", pdf_content[:20])
                             logger.warning("⚠️ 可能下载了HTML错误页面，跳过PDF保存")
                         else:
-                            logger.info(f"✅ 确认是PDF文件，版本标识: {pdf_content[:8]}")
+                            logger.info("✅ 确认是PDF文件，版本标识: %r", pdf_content[:8])
                         
                         # 准备附件元数据
-                        import random
-                        import string
                         attachment_id = ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(8))
                         
                         attachment_metadata = {
@@ -1365,81 +1667,16 @@ class ZoteroConnector:
                             "parentItemID": clean_item.get("id", ""),  # 使用item的ID
                             "title": "Full Text PDF"
                         }
-                        
-                        # 调用saveAttachment API
-                        attachment_headers = {
-                            "Content-Type": "application/pdf",
-                            "X-Metadata": json.dumps(attachment_metadata)
-                        }
-                        
-                        # 🔧 Windows兼容性：增加超时时间，对大文件更宽容
-                        timeout_value = 60 if len(pdf_content) > 500000 else 30
-                        logger.info(f"⏱️ 使用超时时间: {timeout_value}秒")
-                        
-                        attachment_response = session.post(
-                            f"{self.base_url}/connector/saveAttachment?sessionID={session_id}",
-                            data=pdf_content,
-                            headers=attachment_headers,
-                            timeout=timeout_value
-                        )
-                        
-                        if attachment_response.status_code in [200, 201]:
-                            pdf_attachment_success = True
-                            logger.info("✅ PDF附件保存成功！")
-                        else:
-                            logger.warning(f"⚠️ PDF附件保存失败: {attachment_response.status_code}")
-                            logger.warning(f"⚠️ 完整响应内容: {attachment_response.text}")
-                            logger.warning(f"⚠️ 响应Headers: {dict(attachment_response.headers)}")
-                            
-                            # 🔍 额外诊断信息
-                            logger.info(f"🔍 请求URL: {self.base_url}/connector/saveAttachment?sessionID={session_id}")
-                            logger.info(f"🔍 请求Headers: {attachment_headers}")
-                            logger.info(f"🔍 PDF大小: {len(pdf_content)} bytes")
-                            logger.info(f"🔍 PDF前8字节: {pdf_content[:8]}")
-                            
-                            # 🔧 Windows兼容性：尝试备用方法
-                            if attachment_response.status_code == 500:
-                                logger.info("🔄 尝试备用PDF保存方法...")
-                                try:
-                                    # 方法2：使用基础的文件上传方式
-                                    files = {
-                                        'file': ('document.pdf', pdf_content, 'application/pdf')
-                                    }
-                                    backup_response = session.post(
-                                        f"{self.base_url}/connector/saveAttachment?sessionID={session_id}",
-                                        files=files,
-                                        timeout=30
-                                    )
-                                    if backup_response.status_code in [200, 201]:
-                                        pdf_attachment_success = True
-                                        logger.info("✅ 备用方法PDF保存成功！")
-                                    else:
-                                        logger.warning(f"⚠️ 备用方法也失败: {backup_response.status_code}")
-                                        logger.warning(f"⚠️ 备用方法响应: {backup_response.text}")
-                                        logger.warning(f"⚠️ 备用方法Headers: {dict(backup_response.headers)}")
-                                except Exception as backup_e:
-                                    logger.warning(f"⚠️ 备用方法异常: {backup_e}")
                     else:
                         logger.warning("⚠️ PDF内容下载失败")
                         
                 except Exception as e:
                     logger.warning(f"⚠️ PDF处理异常: {e}")
-                
-
             
-            # 移动到指定集合
-            collection_move_success = False
-            if collection_key:
-                tree_view_id = self._get_collection_tree_view_id(collection_key)
-                if tree_view_id:
-                    try:
-                        update_data = {"sessionID": session_id, "target": tree_view_id}
-                        update_response = session.post(f"{self.base_url}/connector/updateSession", json=update_data, timeout=30)
-                        if update_response.status_code in [200, 201]:
-                            collection_move_success = True
-                            logger.info("✅ 成功移动到指定集合")
-                    except Exception as e:
-                        logger.warning(f"⚠️ 集合移动失败: {e}")
+            # 先上传附件，再移动到集合（与Zotero Connector的请求顺序一致）
+            if attachment_metadata:
+                pdf_attachment_success = self._post_attachment(session, session_id, pdf_content, attachment_metadata)
+            collection_move_success = self._post_collection_move(session, session_id, tree_view_id) if tree_view_id else False
             
             # 构建结果
             result = {
@@ -1458,20 +1695,91 @@ class ZoteroConnector:
                         
         except Exception as e:
             logger.error(f"❌ 实用方案保存异常: {e}")
-            import traceback
             logger.error(traceback.format_exc())
             return {
                 "success": False,
                 "message": f"保存失败: {e}"
             }
     
+    def _post_attachment(self, session: requests.Session, session_id: str,
+                         pdf_content: bytes, attachment_metadata: Dict) -> bool:
+        """通过saveAttachment API上传PDF内容，失败时尝试multipart备用方法"""
+        try:
+            # 调用saveAttachment API
+            attachment_headers = {
+                "Content-Type": "application/pdf",
+                "X-Metadata": json.dumps(attachment_metadata)
+            }
+            
+            # 🔧 Windows兼容性：增加超时时间，对大文件更宽容
+            timeout_value = 60 if len(pdf_content) > 500000 else 30
+            logger.info(f"⏱️ 使用超时时间: {timeout_value}秒")
+            
+            attachment_response = session.post(
+                f"{self.base_url}/connector/saveAttachment?sessionID={session_id}",
+                data=pdf_content,
+                headers=attachment_headers,
+                timeout=timeout_value
+            )
+            
+            if attachment_response.status_code in [200, 201]:
+                logger.info("✅ PDF附件保存成功！")
+                return True
+            
+            logger.warning("⚠️ PDF附件保存失败: %s", attachment_response.status_code)
+            logger.warning("⚠️ 完整响应内容: %s", attachment_response.text)
+            logger.warning("⚠️ 响应Headers: %s", attachment_response.headers)
+            
+            # 🔍 额外诊断信息
+            logger.info("🔍 请求URL: %s/connector/saveAttachment?sessionID=%s", self.base_url, session_id)
+            logger.info("🔍 请求Headers: %s", attachment_headers)
+            logger.info("🔍 PDF大小: %d bytes", len(pdf_content))
+            logger.info("🔍 PDF前8字节: %r", pdf_content[:8])
+            
+            # 🔧 Windows兼容性：尝试备用方法
+            if attachment_response.status_code == 500:
+                logger.info("🔄 尝试备用PDF保存方法...")
+                try:
+                    # 方法2：使用基础的文件上传方式
+                    files = {
+                        'file': ('document.pdf', pdf_content, 'application/pdf')
+                    }
+                    backup_response = session.post(
+                        f"{self.base_url}/connector/saveAttachment?sessionID={session_id}",
+                        files=files,
+                        timeout=30
+                    )
+                    if backup_response.status_code in [200, 201]:
+                        logger.info("✅ 备用方法PDF保存成功！")
+                        return True
+                    logger.warning("⚠️ 备用方法也失败: %s", backup_response.status_code)
+                    logger.warning("⚠️ 备用方法响应: %s", backup_response.text)
+                    logger.warning("⚠️ 备用方法Headers: %s", backup_response.headers)
+                except Exception as backup_e:
+                    logger.warning(f"⚠️ 备用方法异常: {backup_e}")
+            
+            return False
+            
+        except Exception as e:
+            logger.warning(f"⚠️ PDF处理异常: {e}")
+            return False
+    
+    def _post_collection_move(self, session: requests.Session, session_id: str,
+                              tree_view_id: str) -> bool:
+        """通过updateSession API将保存会话移动到指定集合"""
+        try:
+            update_data = {"sessionID": session_id, "target": tree_view_id}
+            update_response = session.post(f"{self.base_url}/connector/updateSession", json=update_data, timeout=30)
+            if update_response.status_code in [200, 201]:
+                logger.info("✅ 成功移动到指定集合")
+                return True
+        except Exception as e:
+            logger.warning(f"⚠️ 集合移动失败: {e}")
+        return False
+    
     def _download_arxiv_pdf(self, arxiv_id: str, title: str) -> Optional[str]:
         """下载arxiv PDF到临时目录"""
         try:
-            import tempfile
-            import urllib.request
-            from urllib.parse import quote
-            
             # 创建临时下载目录
             temp_dir = Path(tempfile.gettempdir()) / "zotero_pdfs"
             temp_dir.mkdir(exist_ok=True)
@@ -1525,33 +1833,49 @@ class ZoteroConnector:
                 "/attachments"
             ]
             
-            for endpoint in attachment_endpoints:
+            # 优先尝试上次成功的端点
+            cached_endpoint = self._attach_endpoint_cache.get(self.base_url)
+            if cached_endpoint in attachment_endpoints:
+                attachment_endpoints.remove(cached_endpoint)
+                attachment_endpoints.insert(0, cached_endpoint)
+            
+            # 只读取一次PDF：小文件读入内存，大文件使用mmap，每次重试前rewind
+            pdf_name = Path(pdf_path).name
+            data = {
+                'data': json.dumps(attachment_data)
+            }
+            with open(pdf_path, 'rb') as fh:
+                if os.path.getsize(pdf_path) > 1 << 20:
+                    buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    buf = io.BytesIO(fh.read())
+                
                 try:
-                    # 使用multipart/form-data上传文件
-                    import requests
-                    files = {
-                        'file': (Path(pdf_path).name, open(pdf_path, 'rb'), 'application/pdf')
-                    }
-                    data = {
-                        'data': json.dumps(attachment_data)
-                    }
-                    
-                    response = self.session.post(
-                        f"{self.base_url}{endpoint}",
-                        files=files,
-                        data=data,
-                        timeout=60
-                    )
-                    
-                    files['file'][1].close()  # 关闭文件
-                    
-                    if response.status_code in [200, 201]:
-                        logger.info(f"PDF附件上传成功: {endpoint}")
-                        return True
-                        
-                except Exception as e:
-                    logger.debug(f"使用端点{endpoint}上传附件失败: {e}")
-                    continue
+                    for endpoint in attachment_endpoints:
+                        try:
+                            # 使用multipart/form-data上传文件
+                            buf.seek(0)
+                            files = {
+                                'file': (pdf_name, buf, 'application/pdf')
+                            }
+                            
+                            response = self.session.post(
+                                f"{self.base_url}{endpoint}",
+                                files=files,
+                                data=data,
+                                timeout=60
+                            )
+                            
+                            if response.status_code in [200, 201]:
+                                logger.info(f"PDF附件上传成功: {endpoint}")
+                                self._attach_endpoint_cache[self.base_url] = endpoint
+                                return True
+                                
+                        except Exception as e:
+                            logger.debug(f"使用端点{endpoint}上传附件失败: {e}")
+                            continue
+                finally:
+                    buf.close()
             
             logger.warning("所有附件上传端点都失败了")
             return False
@@ -1639,12 +1963,9 @@ class ZoteroConnector:
         """根据collection key获取treeViewID格式"""
         try:
             # 从数据库中查找collection ID
-            if not self._zotero_db_path or not self._zotero_db_path.exists():
+            if not self._db_available(self._zotero_db_path):
                 return None
                 
-            import tempfile
-            import shutil
-            import sqlite3
             
             with tempfile.NamedTemporaryFile(suffix='.sqlite', delete=False) as temp_file:
                 shutil.copy2(self._zotero_db_path, temp_file.name)
@@ -1741,8 +2062,6 @@ class ZoteroConnector:
             return False
         
         try:
-            import requests
-            
             session = requests.Session()
             session.headers.update({
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -1898,9 +2217,6 @@ class ZoteroConnector:
         """
         在现有事件循环中运行异步提取的辅助方法
         """
-        import concurrent.futures
-        import threading
-        import asyncio
         
         try:
             # 创建新的事件循环在独立线程中运行
@@ -1983,15 +2299,18 @@ class ZoteroConnector:
                     "details": {"size": pdf_size, "html_indicators": found_html}
                 }
             
-            # 检查5: Nature特定的大小验证
-            if 'nature.com' in pdf_url.lower():
-                if pdf_size < 500000:  # Nature PDF通常至少500KB
-                    logger.warning(f"⚠️ Nature PDF大小异常: {pdf_size} bytes (通常应该>500KB)")
-                    return {
-                        "is_valid": False,
-                        "reason": f"Nature PDF大小异常: {pdf_size/1024:.1f}KB (通常应该>500KB)",
-                        "details": {"size": pdf_size, "expected_min_size": 500000, "url": pdf_url}
-                    }
+            # 检查5: 站点特定的大小验证（如Nature）
+            host = (urlsplit(pdf_url).hostname or '').lower()
+            for site_domain, (site_name, min_size) in _SITE_MIN_PDF_SIZE.items():
+                if host == site_domain or host.endswith('.' + site_domain):
+                    if pdf_size < min_size:
+                        logger.warning(f"⚠️ {site_name} PDF大小异常: {pdf_size} bytes (通常应该>{min_size // 1000}KB)")
+                        return {
+                            "is_valid": False,
+                            "reason": f"{site_name} PDF大小异常: {pdf_size/1024:.1f}KB (通常应该>{min_size // 1000}KB)",
+                            "details": {"size": pdf_size, "expected_min_size": min_size, "url": pdf_url}
+                        }
+                    break
             
             # 检查6: PDF结构基本验证
             if b'%%EOF' not in pdf_data[-1024:]:  # PDF文件应该以%%EOF结尾
@@ -2104,6 +2423,89 @@ class ZoteroConnector:
         
         return base_msg
     
+    def _cookies_json_path(self) -> Path:
+        """
+        解析cookies.json路径并缓存结果
+        优先级：用户配置目录 > 项目根目录；都不存在时使用推荐位置
+        """
+        if self._resolved_cookies_json_path is None:
+            user_config_dir = Path.home() / '.zotlink'
+            project_root = Path(__file__).parent.parent
+            
+            # 确保用户配置目录存在
+            user_config_dir.mkdir(exist_ok=True)
+            
+            json_config_paths = [
+                user_config_dir / "cookies.json",  # 推荐位置
+                project_root / "cookies.json"      # 向后兼容
+            ]
+            self._resolved_cookies_json_path = next(
+                (path for path in json_config_paths if path.exists()),
+                json_config_paths[0]
+            )
+        return self._resolved_cookies_json_path
+    
+    def _load_cookies_config(self, json_config_file: Path) -> Dict:
+        """
+        读取并解析cookies.json，按(mtime, size)缓存解析结果
+        
+        文件未变化时只需一次stat，无需重新解析JSON
+        """
+        st = json_config_file.stat()
+        cached = self._cookies_json_cache
+        if cached and cached[0] == json_config_file and cached[1] == st.st_mtime_ns and cached[2] == st.st_size:
+            return cached[3]
+        
+        config = _json_loads(json_config_file.read_bytes())
+        self._cookies_json_cache = (json_config_file, st.st_mtime_ns, st.st_size, config)
+        return config
+    
+    def _start_cookies_watcher(self, json_config_file: Path) -> None:
+        """在后台线程中监听cookies.json所在目录（仅在安装了watchdog时）"""
+        if self._cookies_watch_disabled or self._cookies_watch_path == json_config_file:
+            return
+        
+        with self._cookies_watch_lock:
+            if self._cookies_watch_path == json_config_file:
+                return
+            try:
+                observer = _WatchdogObserver()
+                observer.daemon = True
+                observer.schedule(_CookiesFileHandler(self, json_config_file),
+                                  str(json_config_file.parent), recursive=False)
+                observer.start()
+            except Exception as e:
+                logger.warning(f"⚠️ 无法监听cookies.json，回退到mtime检查: {e}")
+                self._cookies_watch_disabled = True
+                return
+            
+            if self._cookies_observer is not None:
+                self._cookies_observer.stop()
+            self._cookies_observer = observer
+            self._cookies_watch_path = json_config_file
+    
+    def _cookies_config_snapshot(self) -> Optional[Dict]:
+        """
+        返回cookies.json的解析结果，文件不存在时返回None
+        
+        有watchdog监听时，文件未变化直接返回内存中的快照，无需stat
+        """
+        json_config_file = self._cookies_json_path()
+        cached = self._cookies_json_cache
+        if (cached and cached[0] == json_config_file
+                and self._cookies_watch_path == json_config_file
+                and self._cookies_snapshot_generation == self._cookies_json_generation):
+            return cached[3]
+        
+        generation = self._cookies_json_generation
+        self._start_cookies_watcher(json_config_file)
+        if not json_config_file.exists():
+            return None
+        
+        config = self._load_cookies_config(json_config_file)
+        self._cookies_snapshot_generation = generation
+        return config
+    
     def load_cookies_from_files(self) -> Dict[str, bool]:
         """
         从文件加载所有可用的cookies
@@ -2116,38 +2518,21 @@ class ZoteroConnector:
         Returns:
             Dict[str, bool]: 每个数据库的加载状态
         """
-        import os
-        from pathlib import Path
-        import time
-        from datetime import datetime, timezone
         
         results = {}
         # 优先级：用户配置目录 > 项目根目录
         user_config_dir = Path.home() / '.zotlink'
         project_root = Path(__file__).parent.parent
         
-        # 确保用户配置目录存在
-        user_config_dir.mkdir(exist_ok=True)
-        
         logger.info("🔍 正在扫描cookie文件...")
         
         # 1. 优先加载cookies.json（主配置文件）- 优先从用户配置目录加载
-        json_config_paths = [
-            user_config_dir / "cookies.json",  # 推荐位置
-            project_root / "cookies.json"      # 向后兼容
-        ]
-        
-        json_config_file = None
-        for path in json_config_paths:
-            if path.exists():
-                json_config_file = path
-                break
+        json_config_file = self._cookies_json_path()
         
-        if json_config_file:
+        if json_config_file.exists():
             logger.info(f"📁 找到主Cookie配置文件: {json_config_file}")
             try:
-                with open(json_config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = self._load_cookies_config(json_config_file)
                 
                 databases = config.get('databases', {})
                 loaded_count = 0
@@ -2195,15 +2580,11 @@ class ZoteroConnector:
         if txt_cookie_file:
             logger.info(f"📁 找到兼容性TXT文件: {txt_cookie_file}")
             try:
-                with open(txt_cookie_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                
-                # 过滤注释和空行
-                lines = [line.strip() for line in content.split('\n') 
-                        if line.strip() and not line.strip().startswith('#')]
+                # 过滤注释和空行（直接在bytes上匹配，最后统一解码）
+                lines = _COOKIE_LINE_RE.findall(txt_cookie_file.read_bytes())
                 
                 if lines:
-                    cookies_str = ' '.join(lines).strip()
+                    cookies_str = b' '.join(lines).decode('utf-8')
                     cookie_count = len(cookies_str.split(';'))
                     
                     # 设置到Nature数据库
@@ -2223,7 +2604,14 @@ class ZoteroConnector:
                 results['nature_txt'] = False
         
         # 3. 查找所有shared_cookies_*.json文件（书签同步格式）
-        cookie_files = list(project_root.glob("shared_cookies_*.json"))
+        try:
+            with os.scandir(project_root) as entries:
+                cookie_files = [
+                    (Path(entry.path), entry.stat().st_mtime) for entry in entries
+                    if entry.name.startswith("shared_cookies_") and entry.name.endswith(".json") and entry.is_file()
+                ]
+        except OSError:
+            cookie_files = []
         if not cookie_files:
             if not results:
                 logger.info("📄 没有找到任何cookie文件")
@@ -2231,17 +2619,24 @@ class ZoteroConnector:
         
         logger.info(f"📁 找到 {len(cookie_files)} 个cookie文件")
         
-        for file_path in cookie_files:
+        # 文件修改时间早于24小时的直接跳过，无需读取解析
+        cutoff = time.time() - 24 * 3600
+        
+        for file_path, mtime in cookie_files:
+            if mtime < cutoff:
+                logger.warning(f"⚠️ {file_path.name} 已超过24小时未更新，跳过")
+                results[file_path.stem] = False
+                continue
+            
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    cookie_data = json.load(f)
+                cookie_data = _json_loads(file_path.read_bytes())
                 
                 site_name = cookie_data.get('siteName', 'Unknown')
                 cookies = cookie_data.get('cookies', '')
                 timestamp = cookie_data.get('timestamp', '')
                 cookies_count = cookie_data.get('cookies_count', 0)
                 
-                # 检查文件是否过期（24小时）
+                # 检查文件内记录的更新时间是否过期（24小时）
                 last_updated = cookie_data.get('last_updated', 0)
                 if time.time() - last_updated > 24 * 3600:
                     logger.warning(f"⚠️ {site_name} cookies已过期（{timestamp}）")
@@ -2269,15 +2664,7 @@ class ZoteroConnector:
     
     def _map_site_to_database(self, site_name: str) -> str:
         """将站点名映射到数据库名"""
-        mapping = {
-            'www.nature.com': 'nature',
-            'nature.com': 'nature', 
-            'www.science.org': 'science',
-            'science.org': 'science',
-            'ieeexplore.ieee.org': 'ieee',
-            'link.springer.com': 'springer'
-        }
-        return mapping.get(site_name.lower(), '')
+        return _SITE_TO_DB.get(site_name.lower(), '')
     
     def update_database_cookies(self, database_key: str, cookies_str: str) -> bool:
         """
@@ -2290,35 +2677,13 @@ class ZoteroConnector:
         Returns:
             bool: 更新是否成功
         """
-        import json
-        from pathlib import Path
-        from datetime import datetime, timezone
         
-        # 优先级：用户配置目录 > 项目根目录
-        user_config_dir = Path.home() / '.zotlink'
-        project_root = Path(__file__).parent.parent
-        
-        json_config_paths = [
-            user_config_dir / "cookies.json",  # 推荐位置
-            project_root / "cookies.json"      # 向后兼容
-        ]
-        
-        json_config_file = None
-        for path in json_config_paths:
-            if path.exists():
-                json_config_file = path
-                break
-        
-        # 如果都不存在，使用推荐位置创建新文件
-        if not json_config_file:
-            user_config_dir.mkdir(exist_ok=True)
-            json_config_file = user_config_dir / "cookies.json"
+        json_config_file = self._cookies_json_path()
         
         try:
             # 读取现有配置
             if json_config_file.exists():
-                with open(json_config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = self._load_cookies_config(json_config_file)
             else:
                 logger.error("❌ cookies.json文件不存在")
                 return False
@@ -2340,9 +2705,22 @@ class ZoteroConnector:
                 'status': 'active' if cookies_str else 'inactive'
             })
             
-            # 保存更新的配置
-            with open(json_config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # 保存更新的配置：先写入同目录临时文件，再原子替换，避免写入中途失败损坏配置
+            tmp_file = json_config_file.with_suffix('.json.tmp')
+            try:
+                with open(tmp_file, 'wb', buffering=64 * 1024) as f:
+                    f.write(_json_dumps(config))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, json_config_file)
+            except Exception:
+                self._cookies_json_cache = None
+                tmp_file.unlink(missing_ok=True)
+                raise
+            
+            # 写入后刷新缓存的stat，避免下次读取重复解析
+            st = json_config_file.stat()
+            self._cookies_json_cache = (json_config_file, st.st_mtime_ns, st.st_size, config)
             
             # 同时设置到ExtractorManager
             success = self.set_database_cookies(database_key, cookies_str)
@@ -2366,35 +2744,11 @@ class ZoteroConnector:
         Returns:
             Dict[str, Dict]: 数据库状态信息
         """
-        import json
-        from pathlib import Path
-        
-        # 优先级：用户配置目录 > 项目根目录
-        user_config_dir = Path.home() / '.zotlink'
-        project_root = Path(__file__).parent.parent
-        
-        json_config_paths = [
-            user_config_dir / "cookies.json",  # 推荐位置
-            project_root / "cookies.json"      # 向后兼容
-        ]
-        
-        json_config_file = None
-        for path in json_config_paths:
-            if path.exists():
-                json_config_file = path
-                break
-        
-        # 如果都不存在，使用推荐位置创建新文件
-        if not json_config_file:
-            user_config_dir.mkdir(exist_ok=True)
-            json_config_file = user_config_dir / "cookies.json"
         
         try:
-            if not json_config_file.exists():
+            config = self._cookies_config_snapshot()
+            if config is None:
                 return {}
-                
-            with open(json_config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
             
             databases = config.get('databases', {})
             status_info = {}
@@ -2433,119 +2787,115 @@ class ZoteroConnector:
             if not self.is_running():
                 return {"success": False, "error": "Zotero is not running"}
 
+            cache_key = self._read_cache_key(limit, offset, include_details)
+            cached = self._read_cache_get(self._items_cache, cache_key)
+            if cached is not None:
+                return cached
+
             items = self._get_items_from_database(limit, offset, include_details)
-            return {"success": True, "items": items}
+            if items is None:
+                # 读取失败（如数据库被锁定）不缓存，下次重新查询
+                return {"success": True, "items": []}
+            result = {"success": True, "items": items}
+            self._read_cache_put(self._items_cache, cache_key, result)
+            return result
 
         except Exception as e:
             logger.error(f"Failed to get library items: {e}")
             return {"success": False, "error": str(e)}
 
-    def _get_items_from_database(self, limit: int = 50, offset: int = 0, include_details: bool = False) -> List[Dict]:
-        """Get items directly from the Zotero SQLite database"""
+    def _get_items_from_database(self, limit: int = 50, offset: int = 0, include_details: bool = False) -> Optional[List[Dict]]:
+        """Get items directly from the Zotero SQLite database; None when the query fails"""
         items = []
         
         db_path = self._get_zotero_db_path()
-        if not db_path or not db_path.exists():
+        if not self._db_available(db_path):
             return items
         
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self._ro()
             cursor = conn.cursor()
             
+            # Fetch the title in the same query instead of one lookup per item
             cursor.execute("""
                 SELECT i.itemID, i.key, i.itemTypeID, i.dateAdded, i.dateModified,
-                       t.typeName
+                       t.typeName, v.value AS title
                 FROM items i
                 JOIN itemTypes t ON i.itemTypeID = t.itemTypeID
-                WHERE i.libraryID = 1 AND i.itemTypeID NOT IN (2, 14)
+                LEFT JOIN fields f ON f.fieldName = 'title'
+                LEFT JOIN itemData d ON d.itemID = i.itemID AND d.fieldID = f.fieldID
+                LEFT JOIN itemDataValues v ON v.valueID = d.valueID
+                WHERE i.libraryID = ? AND i.itemTypeID NOT IN (2, 14)
                 ORDER BY i.dateAdded DESC
                 LIMIT ? OFFSET ?
-            """, (limit, offset))
+            """, (self._library_id, limit, offset))
             
-            for row in cursor:
-                item = {
-                    "itemKey": row["key"],
-                    "itemID": row["itemID"],
-                    "itemType": row["typeName"],
-                    "dateAdded": row["dateAdded"],
-                    "dateModified": row["dateModified"]
-                }
-                
-                title_cursor = conn.cursor()
-                title_cursor.execute("""
-                    SELECT v.value FROM itemData d
-                    JOIN fields f ON d.fieldID = f.fieldID
-                    JOIN itemDataValues v ON d.valueID = v.valueID
-                    WHERE d.itemID = ? AND f.fieldName = 'title'
-                """, (row["itemID"],))
-                title_row = title_cursor.fetchone()
-                if title_row:
-                    item["title"] = title_row["value"]
-                else:
-                    item["title"] = "Untitled"
-                
-                if include_details:
-                    item["attachment_count"] = len(self._get_item_attachments(row["itemID"]))
-                    item["note_count"] = len(self._get_item_notes(row["itemID"]))
-                    raw_tags = self._get_item_tags(row["itemID"])
-                    item["tag_count"] = len(raw_tags)
-                    item["tags"] = [t["name"] for t in raw_tags[:5]]
-                
-                items.append(item)
+            rows = cursor.fetchall()
+            details = self._get_items_details_batch(conn, [row["itemID"] for row in rows]) if include_details else {}
+            
+            items = [
+                dict(zip(_ITEM_KEYS, (row["key"], row["itemID"], row["typeName"],
+                                      row["dateAdded"], row["dateModified"],
+                                      row["title"] or "Untitled")))
+                for row in rows
+            ]
             
-            conn.close()
+            if include_details:
+                for item in items:
+                    item_details = details.get(item["itemID"], {})
+                    tag_names = item_details.get("tags", [])
+                    item["attachment_count"] = item_details.get("attachment_count", 0)
+                    item["note_count"] = item_details.get("note_count", 0)
+                    item["tag_count"] = len(tag_names)
+                    item["tags"] = tag_names[:5]
             
         except Exception as e:
             logger.error(f"Database query failed: {e}")
+            self._close_ro_connection()
+            return None
         
         return items
+
+    def _get_items_details_batch(self, conn: sqlite3.Connection, item_ids: List[int]) -> Dict[int, Dict]:
+        """Get attachment/note counts and tag names for many items with one query per table"""
+        details: Dict[int, Dict] = {item_id: {} for item_id in item_ids}
+        if not item_ids:
+            return details
+        
+        placeholders = ",".join("?" * len(item_ids))
+        count_queries = {
+            "attachment_count": f"""
+                SELECT a.parentItemID, COUNT(*) FROM attachments a
+                JOIN items i ON a.itemID = i.itemID
+                WHERE a.parentItemID IN ({placeholders})
+                GROUP BY a.parentItemID
+            """,
+            "note_count": f"""
+                SELECT n.parentItemID, COUNT(*) FROM notes n
+                JOIN items i ON n.itemID = i.itemID
+                WHERE n.parentItemID IN ({placeholders})
+                GROUP BY n.parentItemID
+            """,
+        }
+        
+        for key, sql in count_queries.items():
+            try:
+                for parent_id, count in conn.execute(sql, item_ids):
+                    details[parent_id][key] = count
+            except sqlite3.Error as e:
+                logger.error(f"Failed to count {key}: {e}")
         
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT i.itemID, i.key, i.itemTypeID, i.dateAdded, i.dateModified,
-                       t.typeName
-                FROM items i
-                JOIN itemTypes t ON i.itemTypeID = t.itemTypeID
-                WHERE i.libraryID = 1
-                ORDER BY i.dateAdded DESC
-                LIMIT ? OFFSET ?
-            """, (limit, offset))
-            
-            for row in cursor:
-                item = {
-                    "itemKey": row["key"],
-                    "itemID": row["itemID"],
-                    "itemType": row["typeName"],
-                    "dateAdded": row["dateAdded"],
-                    "dateModified": row["dateModified"]
-                }
-                
-                # Get title
-                cursor.execute("""
-                    SELECT v.value FROM itemData d
-                    JOIN fields f ON d.fieldID = f.fieldID
-                    JOIN itemDataValues v ON d.valueID = v.valueID
-                    WHERE d.itemID = ? AND f.fieldName = 'title'
-                """, (row["itemID"],))
-                title_row = cursor.fetchone()
-                if title_row:
-                    item["title"] = title_row["value"]
-                else:
-                    item["title"] = "Untitled"
-                
-                items.append(item)
-            
-            conn.close()
-            
-        except Exception as e:
-            logger.error(f"Database query failed: {e}")
+            for item_id, name in conn.execute(f"""
+                SELECT it.itemID, t.name FROM itemTags it
+                JOIN tags t ON t.tagID = it.tagID
+                WHERE it.itemID IN ({placeholders})
+            """, item_ids):
+                details[item_id].setdefault("tags", []).append(name)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to get tags: {e}")
         
-        return items
+        return details
 
     def search_items(self, query: str) -> Dict:
         """
@@ -2573,58 +2923,89 @@ class ZoteroConnector:
         items = []
         
         db_path = self._get_zotero_db_path()
-        if not db_path or not db_path.exists():
+        if not self._db_available(db_path):
             return items
         
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            conn = self._ro()
             
-            cursor.execute("""
+            rows = conn.execute("""
                 SELECT DISTINCT i.itemID, i.key, i.itemTypeID, i.dateAdded, i.dateModified,
-                       t.typeName
+                       t.typeName, v.value AS title
                 FROM items i
                 JOIN itemTypes t ON i.itemTypeID = t.itemTypeID
                 JOIN itemData d ON i.itemID = d.itemID
                 JOIN itemDataValues v ON d.valueID = v.valueID
                 JOIN fields f ON d.fieldID = f.fieldID
-                WHERE i.libraryID = 1
+                WHERE i.libraryID = ?
                   AND (f.fieldName = 'title' AND v.value LIKE ?)
                 ORDER BY i.dateAdded DESC
                 LIMIT 50
-            """, (f"%{query}%",))
+            """, (self._library_id, f"%{query}%")).fetchall()
             
-            for row in cursor:
+            for row in rows:
                 item = {
                     "itemKey": row["key"],
                     "itemID": row["itemID"],
                     "itemType": row["typeName"],
                     "dateAdded": row["dateAdded"],
-                    "dateModified": row["dateModified"]
+                    "dateModified": row["dateModified"],
+                    "title": row["title"] or "Untitled"
                 }
                 
-                cursor.execute("""
-                    SELECT v.value FROM itemData d
-                    JOIN fields f ON d.fieldID = f.fieldID
-                    JOIN itemDataValues v ON d.valueID = v.valueID
-                    WHERE d.itemID = ? AND f.fieldName = 'title'
-                """, (row["itemID"],))
-                title_row = cursor.fetchone()
-                if title_row:
-                    item["title"] = title_row["value"]
-                else:
-                    item["title"] = "Untitled"
-                
                 items.append(item)
             
-            conn.close()
-            
         except Exception as e:
             logger.error(f"Database search failed: {e}")
+            self._close_ro_connection()
         
         return items
 
+    def _db_signature(self, db_path: Path) -> tuple:
+        """Cheap change marker for the database (main file plus WAL, if any)"""
+        signature = [str(db_path)]
+        for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+            try:
+                st = path.stat()
+                signature.extend((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.extend((None, None))
+        return tuple(signature)
+
+    def _read_cache_key(self, *args) -> Optional[tuple]:
+        """Cache key for a read call; None when there is no database to key on"""
+        db_path = self._get_zotero_db_path()
+        if not db_path:
+            return None
+        return args + self._db_signature(db_path)
+
+    def _read_cache_get(self, cache: "OrderedDict[tuple, Dict]", key: Optional[tuple]) -> Optional[Dict]:
+        """Return a copy of a cached result, refreshing its LRU position"""
+        if key is None:
+            return None
+        with self._read_cache_lock:
+            result = cache.get(key)
+            if result is None:
+                return None
+            cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _read_cache_put(self, cache: "OrderedDict[tuple, Dict]", key: Optional[tuple], result: Dict) -> None:
+        """Store a copy of a result, evicting the least recently used entries"""
+        if key is None:
+            return
+        with self._read_cache_lock:
+            cache[key] = copy.deepcopy(result)
+            cache.move_to_end(key)
+            while len(cache) > _READ_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _invalidate_read_cache(self) -> None:
+        """Drop cached reads after this connector writes to the database"""
+        with self._read_cache_lock:
+            self._item_cache.clear()
+            self._items_cache.clear()
+
     def get_item(self, item_key: str, include_attachments: bool = True) -> Dict:
         """
         Get a specific item by its key.
@@ -2640,19 +3021,25 @@ class ZoteroConnector:
             if not self.is_running():
                 return {"success": False, "error": "Zotero is not running"}
 
+            cache_key = self._read_cache_key(item_key, include_attachments)
+            cached = self._read_cache_get(self._item_cache, cache_key)
+            if cached is not None:
+                return cached
+
             item = self._get_item_from_database(item_key)
             if not item:
                 return {"success": False, "error": "Item not found"}
 
             if include_attachments:
                 item_id = item.get("itemID")
-                item["attachments"] = self._get_item_attachments(item_id)
-                item["notes"] = self._get_item_notes(item_id)
-                raw_tags = self._get_item_tags(item_id)
-                item["tags"] = [t["name"] for t in raw_tags]
-                item["tags_detail"] = raw_tags
+                conn = self._ro()
+                item["attachments"] = self._get_item_attachments(item_id, conn)
+                item["notes"] = self._get_item_notes(item_id, conn)
+                item["tags"], item["tags_detail"] = self._get_item_tag_views(item_id, conn)
 
-            return {"success": True, "item": item}
+            result = {"success": True, "item": item}
+            self._read_cache_put(self._item_cache, cache_key, result)
+            return result
 
         except Exception as e:
             logger.error(f"Failed to get item: {e}")
@@ -2661,21 +3048,23 @@ class ZoteroConnector:
     def _get_item_from_database(self, item_key: str) -> Optional[Dict]:
         """Get a single item from the Zotero SQLite database"""
         db_path = self._get_zotero_db_path()
-        if not db_path or not db_path.exists():
+        if not self._db_available(db_path):
             return None
         
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self._ro()
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT i.itemID, i.key, i.itemTypeID, i.dateAdded, i.dateModified,
-                       t.typeName
-                FROM items i
-                JOIN itemTypes t ON i.itemTypeID = t.itemTypeID
-                WHERE i.key = ? AND i.libraryID = 1
-            """, (item_key,))
+            # Fields and creators are folded into the item row with JSON
+            # aggregates so a lookup is a single round-trip
+            try:
+                cursor.execute(_ITEM_FULL_SQL.format(creators=_ITEM_CREATORS_SQL), (item_key, self._library_id))
+            except sqlite3.OperationalError as e:
+                # Minimal databases without creator tables; anything else (e.g. a
+                # locked database) is a real failure
+                if not str(e).startswith(("no such table", "no such column")):
+                    raise
+                cursor.execute(_ITEM_FULL_SQL.format(creators="NULL"), (item_key, self._library_id))
             
             row = cursor.fetchone()
             if not row:
@@ -2688,41 +3077,21 @@ class ZoteroConnector:
                 "dateAdded": row["dateAdded"],
                 "dateModified": row["dateModified"]
             }
+            item.update(_json_loads(row["fields_json"] or "{}"))
+            item["creators"] = [
+                {
+                    "firstName": c["firstName"] or "",
+                    "lastName": c["lastName"] or "",
+                    "creatorType": c["creatorType"]
+                }
+                for c in _json_loads(row["creators_json"] or "[]")
+            ]
             
-            # Get all item data fields
-            cursor.execute("""
-                SELECT f.fieldName, v.value FROM itemData d
-                JOIN fields f ON d.fieldID = f.fieldID
-                JOIN itemDataValues v ON d.valueID = v.valueID
-                WHERE d.itemID = ?
-            """, (row["itemID"],))
-            
-            for field_row in cursor:
-                item[field_row["fieldName"]] = field_row["value"]
-            
-            # Get creators
-            cursor.execute("""
-                SELECT c.firstName, c.lastName, ct.creatorType
-                FROM creators c
-                JOIN itemCreators ic ON c.creatorID = ic.creatorID
-                JOIN creatorTypes ct ON ic.creatorTypeID = ct.creatorTypeID
-                WHERE ic.itemID = ?
-            """, (row["itemID"],))
-            
-            creators = []
-            for creator_row in cursor:
-                creators.append({
-                    "firstName": creator_row["firstName"] or "",
-                    "lastName": creator_row["lastName"] or "",
-                    "creatorType": creator_row["creatorType"]
-                })
-            item["creators"] = creators
-            
-            conn.close()
             return item
             
         except Exception as e:
             logger.error(f"Database query failed: {e}")
+            self._close_ro_connection()
             return None
 
     def _get_zotero_db_path(self) -> Optional[Path]:
@@ -2745,70 +3114,67 @@ class ZoteroConnector:
                 return {"success": False, "error": "Zotero is not running"}
 
             db_path = self._get_zotero_db_path()
-            if not db_path or not db_path.exists():
+            if not self._db_available(db_path):
                 return {"success": False, "error": "Zotero database not found"}
 
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-
-            # Get item ID
-            cursor.execute("SELECT itemID FROM items WHERE key = ? AND libraryID = 1", (item_key,))
-            row = cursor.fetchone()
-            if not row:
-                conn.close()
-                return {"success": False, "error": "Item not found"}
-
-            item_id = row[0]
+            conn = self._rw()
+            try:
+                cursor = conn.cursor()
+                # All field writes land in a single transaction
+                cursor.execute("BEGIN IMMEDIATE")
+
+                item_id = self._resolve_item_id(cursor, item_key)
+                if item_id is None:
+                    conn.execute("ROLLBACK")
+                    return {"success": False, "error": "Item not found"}
+
+                # Map field names to field IDs
+                field_name_to_id = {
+                    "title": "title",
+                    "abstractNote": "abstractNote",
+                    "date": "date",
+                    "url": "url",
+                    "publicationTitle": "publicationTitle",
+                    "DOI": "DOI",
+                }
 
-            # Map field names to field IDs
-            field_name_to_id = {
-                "title": "title",
-                "abstractNote": "abstractNote",
-                "date": "date",
-                "url": "url",
-                "publicationTitle": "publicationTitle",
-                "DOI": "DOI",
-            }
+                field_ids = self._get_field_ids(cursor, db_path)
 
-            updated_fields = []
-            for field_name, field_value in updates.items():
-                if field_name in field_name_to_id:
-                    db_field_name = field_name_to_id[field_name]
-                    
-                    # Get field ID
-                    cursor.execute("SELECT fieldID FROM fields WHERE fieldName = ?", (db_field_name,))
-                    field_row = cursor.fetchone()
-                    if not field_row:
-                        continue
-                    field_id = field_row[0]
-                    
-                    # Check if value exists, if not add it
-                    cursor.execute("SELECT valueID FROM itemData WHERE itemID = ? AND fieldID = ?", (item_id, field_id))
-                    value_row = cursor.fetchone()
-                    
-                    if value_row:
-                        # Update existing value
-                        cursor.execute("""
-                            UPDATE itemDataValues SET value = ? 
-                            WHERE valueID = (SELECT valueID FROM itemData WHERE itemID = ? AND fieldID = ?)
-                        """, (field_value, item_id, field_id))
-                    else:
-                        # Get max valueID
-                        cursor.execute("SELECT MAX(valueID) FROM itemDataValues")
-                        max_value_id = cursor.fetchone()[0] or 0
+                updated_fields = []
+                for field_name, field_value in updates.items():
+                    if field_name in field_name_to_id:
+                        db_field_name = field_name_to_id[field_name]
                         
-                        # Insert new value
-                        cursor.execute("INSERT INTO itemDataValues (valueID, value) VALUES (?, ?)", 
-                                       (max_value_id + 1, field_value))
+                        field_id = field_ids.get(db_field_name)
+                        if field_id is None:
+                            continue
                         
-                        # Insert item data reference
-                        cursor.execute("INSERT INTO itemData (itemID, fieldID, valueID) VALUES (?, ?, ?)",
-                                       (item_id, field_id, max_value_id + 1))
-                    
-                    updated_fields.append(field_name)
+                        # Check if value exists, if not add it
+                        cursor.execute("SELECT valueID FROM itemData WHERE itemID = ? AND fieldID = ?", (item_id, field_id))
+                        value_row = cursor.fetchone()
+                        
+                        if value_row:
+                            # Update existing value
+                            cursor.execute("""
+                                UPDATE itemDataValues SET value = ? 
+                                WHERE valueID = (SELECT valueID FROM itemData WHERE itemID = ? AND fieldID = ?)
+                            """, (field_value, item_id, field_id))
+                        else:
+                            # Insert new value and let SQLite assign the valueID
+                            cursor.execute("INSERT INTO itemDataValues (value) VALUES (?)", (field_value,))
+                            
+                            # Insert item data reference
+                            cursor.execute("INSERT INTO itemData (itemID, fieldID, valueID) VALUES (?, ?, ?)",
+                                           (item_id, field_id, cursor.lastrowid))
+                        
+                        updated_fields.append(field_name)
 
-            conn.commit()
-            conn.close()
+                conn.execute("COMMIT")
+                self._invalidate_read_cache()
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
 
             if updated_fields:
                 logger.info(f"Successfully updated item {item_key}: {updated_fields}")
@@ -2820,6 +3186,13 @@ class ZoteroConnector:
             logger.error(f"Failed to update item: {e}")
             return {"success": False, "error": str(e)}
 
+    def _get_field_ids(self, cursor: sqlite3.Cursor, db_path: Path) -> Dict[str, int]:
+        """Return the fieldName -> fieldID map, loaded once per database"""
+        if self._field_id_cache is None or self._field_id_cache[0] != db_path:
+            cursor.execute("SELECT fieldName, fieldID FROM fields")
+            self._field_id_cache = (db_path, dict(cursor.fetchall()))
+        return self._field_id_cache[1]
+
     def update_item_tags(self, item_key: str, tags: List[str]) -> Dict:
         """
         Update the tags on an existing item.
@@ -2836,43 +3209,54 @@ class ZoteroConnector:
                 return {"success": False, "error": "Zotero is not running"}
 
             db_path = self._get_zotero_db_path()
-            if not db_path or not db_path.exists():
+            if not self._db_available(db_path):
                 return {"success": False, "error": "Zotero database not found"}
 
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-
-            # Get item ID
-            cursor.execute("SELECT itemID FROM items WHERE key = ? AND libraryID = 1", (item_key,))
-            row = cursor.fetchone()
-            if not row:
-                conn.close()
-                return {"success": False, "error": "Item not found"}
-
-            item_id = row[0]
-
-            # Delete existing tags
-            cursor.execute("DELETE FROM itemTags WHERE itemID = ?", (item_id,))
-
-            # Add new tags
-            for tag in tags:
-                # Get or create tag
-                cursor.execute("SELECT tagID FROM tags WHERE name = ?", (tag,))
-                tag_row = cursor.fetchone()
+            conn = self._rw()
+            try:
+                cursor = conn.cursor()
+                # Replace the tag set in a single transaction
+                cursor.execute("BEGIN IMMEDIATE")
+
+                item_id = self._resolve_item_id(cursor, item_key)
+                if item_id is None:
+                    conn.execute("ROLLBACK")
+                    return {"success": False, "error": "Item not found"}
+
+                # Delete existing tags
+                cursor.execute("DELETE FROM itemTags WHERE itemID = ?", (item_id,))
+
+                # Add new tags: look up existing tag IDs in one query, create the rest in bulk
+                unique_tags = list(dict.fromkeys(tags))
+                if unique_tags:
+                    cursor.execute(
+                        f"SELECT name, tagID FROM tags WHERE name IN ({','.join('?' * len(unique_tags))})",
+                        unique_tags
+                    )
+                    tag_ids = dict(cursor.fetchall())
                 
-                if tag_row:
-                    tag_id = tag_row[0]
-                else:
-                    cursor.execute("SELECT MAX(tagID) FROM tags")
-                    max_tag_id = cursor.fetchone()[0] or 0
-                    cursor.execute("INSERT INTO tags (tagID, name) VALUES (?, ?)", (max_tag_id + 1, tag))
-                    tag_id = max_tag_id + 1
+                    missing = [tag for tag in unique_tags if tag not in tag_ids]
+                    if missing:
+                        # Let SQLite assign tagIDs, then read them back in one query
+                        cursor.executemany("INSERT INTO tags (name) VALUES (?)", [(tag,) for tag in missing])
+                        cursor.execute(
+                            f"SELECT name, tagID FROM tags WHERE name IN ({','.join('?' * len(missing))})",
+                            missing
+                        )
+                        tag_ids.update(cursor.fetchall())
                 
-                # Link tag to item (type=0 for manual tags)
-                cursor.execute("INSERT INTO itemTags (itemID, tagID, type) VALUES (?, ?, 0)", (item_id, tag_id))
+                    # Link tags to item (type=0 for manual tags)
+                    cursor.executemany(
+                        "INSERT INTO itemTags (itemID, tagID, type) VALUES (?, ?, 0)",
+                        [(item_id, tag_ids[tag]) for tag in unique_tags]
+                    )
 
-            conn.commit()
-            conn.close()
+                conn.execute("COMMIT")
+                self._invalidate_read_cache()
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
 
             logger.info(f"Successfully updated tags for item: {item_key}")
             return {"success": True, "message": f"Tags updated: {', '.join(tags)}", "item_key": item_key, "tags": tags}
@@ -2891,40 +3275,91 @@ class ZoteroConnector:
         Returns:
             Dict containing the deletion result
         """
+        result = self.delete_items([item_key])
+        if not result["success"]:
+            return {"success": False, "error": result.get("error", "Item not found")}
+
+        return {"success": True, "message": "Item deleted successfully", "item_key": item_key}
+
+    def _resolve_item_id(self, cursor: sqlite3.Cursor, item_key: str) -> Optional[int]:
+        """itemID for a key in the configured library, or None"""
+        row = cursor.execute(_ITEM_ID_SQL, (item_key, self._library_id)).fetchone()
+        return row[0] if row else None
+
+    def _resolve_collection_id(self, cursor: sqlite3.Cursor, collection_key: str) -> Optional[int]:
+        """collectionID for a key in the configured library, or None"""
+        row = cursor.execute(_COLLECTION_ID_SQL, (self._library_id, collection_key)).fetchone()
+        return row[0] if row else None
+
+    def _resolve_item_ids(self, cursor: sqlite3.Cursor, item_keys: List[str]) -> Dict[str, int]:
+        """Map item keys to itemIDs with one IN query per chunk of keys"""
+        item_ids: Dict[str, int] = {}
+        for start in range(0, len(item_keys), _SQL_IN_CHUNK):
+            chunk = item_keys[start:start + _SQL_IN_CHUNK]
+            cursor.execute(
+                f"SELECT key, itemID FROM items WHERE libraryID = ? AND key IN ({','.join('?' * len(chunk))})",
+                [self._library_id, *chunk]
+            )
+            item_ids.update(cursor.fetchall())
+        return item_ids
+
+    def delete_items(self, item_keys: List[str]) -> Dict:
+        """
+        Delete several items from the Zotero library in one transaction.
+
+        Args:
+            item_keys: The Zotero item keys to delete
+
+        Returns:
+            Dict containing the deleted keys and the keys that were not found
+        """
         try:
             if not self.is_running():
                 return {"success": False, "error": "Zotero is not running"}
 
             db_path = self._get_zotero_db_path()
-            if not db_path or not db_path.exists():
+            if not self._db_available(db_path):
                 return {"success": False, "error": "Zotero database not found"}
 
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
+            unique_keys = list(dict.fromkeys(item_keys))
+            conn = self._rw()
+            try:
+                cursor = conn.cursor()
+                # Hold the write lock once for the whole batch
+                cursor.execute("BEGIN IMMEDIATE")
 
-            # Get item ID
-            cursor.execute("SELECT itemID FROM items WHERE key = ? AND libraryID = 1", (item_key,))
-            row = cursor.fetchone()
-            if not row:
-                conn.close()
-                return {"success": False, "error": "Item not found"}
+                item_ids = self._resolve_item_ids(cursor, unique_keys)
+                ids = list(item_ids.values())
 
-            item_id = row[0]
+                for start in range(0, len(ids), _SQL_IN_CHUNK):
+                    chunk = ids[start:start + _SQL_IN_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    for sql in _DELETE_ITEM_SQL:
+                        cursor.execute(sql.format(placeholders), chunk)
 
-            # Delete in correct order (respect foreign keys)
-            cursor.execute("DELETE FROM itemTags WHERE itemID = ?", (item_id,))
-            cursor.execute("DELETE FROM itemCreators WHERE itemID = ?", (item_id,))
-            cursor.execute("DELETE FROM itemData WHERE itemID = ?", (item_id,))
-            cursor.execute("DELETE FROM items WHERE itemID = ?", (item_id,))
+                conn.execute("COMMIT")
+                if ids:
+                    self._invalidate_read_cache()
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
 
-            conn.commit()
-            conn.close()
+            deleted = [key for key in unique_keys if key in item_ids]
+            not_found = [key for key in unique_keys if key not in item_ids]
+            if not deleted:
+                return {"success": False, "error": "Item not found", "not_found": not_found}
 
-            logger.info(f"Successfully deleted item: {item_key}")
-            return {"success": True, "message": "Item deleted successfully", "item_key": item_key}
+            logger.info(f"Successfully deleted items: {deleted}")
+            return {
+                "success": True,
+                "message": f"Deleted {len(deleted)} item(s)",
+                "deleted": deleted,
+                "not_found": not_found
+            }
 
         except Exception as e:
-            logger.error(f"Failed to delete item: {e}")
+            logger.error(f"Failed to delete items: {e}")
             return {"success": False, "error": str(e)}
 
     def move_item_to_collection(self, item_key: str, collection_key: str) -> Dict:
@@ -2943,41 +3378,43 @@ class ZoteroConnector:
                 return {"success": False, "error": "Zotero is not running"}
 
             db_path = self._get_zotero_db_path()
-            if not db_path or not db_path.exists():
+            if not self._db_available(db_path):
                 return {"success": False, "error": "Zotero database not found"}
 
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-
-            # Get item ID
-            cursor.execute("SELECT itemID FROM items WHERE key = ? AND libraryID = 1", (item_key,))
-            item_row = cursor.fetchone()
-            if not item_row:
-                conn.close()
-                return {"success": False, "error": "Item not found"}
-
-            item_id = item_row[0]
-
-            # Get collection ID
-            cursor.execute("SELECT collectionID FROM collections WHERE libraryID = 1 AND collectionKey = ?", (collection_key,))
-            coll_row = cursor.fetchone()
-            if not coll_row:
-                conn.close()
-                return {"success": False, "error": "Collection not found"}
-
-            collection_id = coll_row[0]
-
-            # Check if item is already in collection
-            cursor.execute("SELECT * FROM collectionItems WHERE collectionID = ? AND itemID = ?", (collection_id, item_id))
-            if cursor.fetchone():
-                conn.close()
-                return {"success": True, "message": "Item already in collection", "item_key": item_key}
-
-            # Add item to collection
-            cursor.execute("INSERT INTO collectionItems (collectionID, itemID) VALUES (?, ?)", (collection_id, item_id))
+            conn = self._rw()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
 
-            conn.commit()
-            conn.close()
+                # Resolve both keys and link them in one statement; the NOT EXISTS
+                # guard (and the table's primary key) skips existing memberships
+                cursor.execute("""
+                    INSERT OR IGNORE INTO collectionItems (collectionID, itemID)
+                    SELECT c.collectionID, i.itemID
+                    FROM collections c, items i
+                    WHERE c.libraryID = ? AND c.collectionKey = ?
+                      AND i.libraryID = ? AND i.key = ?
+                      AND NOT EXISTS (
+                          SELECT 1 FROM collectionItems ci
+                          WHERE ci.collectionID = c.collectionID AND ci.itemID = i.itemID
+                      )
+                """, (self._library_id, collection_key, self._library_id, item_key))
+
+                if cursor.rowcount == 0:
+                    conn.execute("ROLLBACK")
+                    # Nothing inserted: work out whether a key was wrong or the item was already there
+                    if self._resolve_item_id(cursor, item_key) is None:
+                        return {"success": False, "error": "Item not found"}
+                    if self._resolve_collection_id(cursor, collection_key) is None:
+                        return {"success": False, "error": "Collection not found"}
+                    return {"success": True, "message": "Item already in collection", "item_key": item_key}
+
+                conn.execute("COMMIT")
+                self._invalidate_read_cache()
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
 
             logger.info(f"Successfully moved item {item_key} to collection {collection_key}")
             return {"success": True, "message": "Item moved successfully", "item_key": item_key}
@@ -3003,16 +3440,19 @@ class ZoteroConnector:
             if not self.is_running():
                 return {"success": False, "error": "Zotero is not running"}
 
-            result = self.get_item(item_key)
-            if not result.get("success"):
-                return {"success": False, "error": f"Could not get item: {result.get('error')}"}
+            # Cheap DOI probe first: non-arXiv DOIs need neither the full item nor the API
+            doi = self._get_item_doi(item_key)
+            if doi and not self._get_arxiv_url_from_doi(doi):
+                return {
+                    "success": False,
+                    "error": "Could not find arXiv URL from DOI",
+                    "item_key": item_key,
+                    "doi": doi
+                }
 
-            item_data = result.get("item", {})
-            if isinstance(item_data, str):
-                try:
-                    item_data = json.loads(item_data)
-                except json.JSONDecodeError:
-                    pass
+            item_data = self._get_item_from_database(item_key)
+            if not item_data:
+                return {"success": False, "error": "Could not get item: Item not found"}
 
             zotero_metadata = {
                 "title": item_data.get("title", ""),
@@ -3043,9 +3483,7 @@ class ZoteroConnector:
                     "doi": doi
                 }
 
-            from .extractors.arxiv_extractor import ArxivAPIExtractor
-            arxiv_extractor = ArxivAPIExtractor()
-            arxiv_metadata = arxiv_extractor.extract_metadata(arxiv_url)
+            arxiv_metadata = _fetch_arxiv_metadata(arxiv_url)
 
             if "error" in arxiv_metadata:
                 return {
@@ -3073,6 +3511,25 @@ class ZoteroConnector:
             logger.error(f"Failed to validate item: {e}")
             return {"success": False, "error": str(e)}
 
+    def _get_item_doi(self, item_key: str) -> Optional[str]:
+        """Read just the DOI field of an item; None if it has none or the lookup fails"""
+        if not self._db_available(self._get_zotero_db_path()):
+            return None
+
+        try:
+            row = self._ro().execute("""
+                SELECT v.value FROM itemData d
+                JOIN fields f ON d.fieldID = f.fieldID
+                JOIN itemDataValues v ON d.valueID = v.valueID
+                WHERE d.itemID = (SELECT itemID FROM items WHERE key = ? AND libraryID = ?)
+                  AND f.fieldName = 'DOI'
+            """, (item_key, self._library_id)).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"DOI lookup failed for {item_key}: {e}")
+            return None
+
+        return row[0] if row else None
+
     def _get_arxiv_url_from_doi(self, doi: str) -> Optional[str]:
         """Extract arXiv URL from DOI if it points to arXiv"""
         if not doi:
@@ -3081,12 +3538,12 @@ class ZoteroConnector:
         doi_lower = doi.lower()
 
         if "arxiv.org" in doi_lower:
-            arxiv_id_match = re.search(r'(\d+\.\d+)', doi)
+            arxiv_id_match = _RE_ARXIV_NUM.search(doi)
             if arxiv_id_match:
                 return f"https://arxiv.org/abs/{arxiv_id_match.group(1)}"
 
         if "10.48550/arxiv" in doi_lower or "arxiv." in doi_lower:
-            arxiv_id_match = re.search(r'arxiv[\.:]*(\d+\.\d+)', doi, re.IGNORECASE)
+            arxiv_id_match = _RE_ARXIV_ID.search(doi)
             if arxiv_id_match:
                 return f"https://arxiv.org/abs/{arxiv_id_match.group(1)}"
 
@@ -3120,12 +3577,21 @@ class ZoteroConnector:
                 {"source": "arXiv", "value": date_arxiv}
             ]
 
-        zotero_authors = self._extract_last_names(zotero.get("creators", []))
-        arxiv_authors = [a.get("lastName", "") for a in arxiv.get("authors", [])]
-        if zotero_authors and arxiv_authors and set(zotero_authors) != set(arxiv_authors):
+        # Compare as sets (set inequality short-circuits on size); the ordered
+        # author strings are only built when there is a difference to report
+        zotero_creators = zotero.get("creators", [])
+        arxiv_author_list = arxiv.get("authors", [])
+        zotero_authors = {
+            last_name for last_name in (
+                (c.get("lastName") or "").strip() for c in zotero_creators
+                if c.get("creatorType") in _AUTHOR_TYPES
+            ) if last_name
+        }
+        arxiv_authors = {a.get("lastName", "") for a in arxiv_author_list}
+        if zotero_authors and arxiv_authors and zotero_authors != arxiv_authors:
             differences["authors"] = [
-                {"source": "Zotero", "value": ", ".join(zotero_authors)},
-                {"source": "arXiv", "value": ", ".join(arxiv_authors)}
+                {"source": "Zotero", "value": ", ".join(self._extract_last_names(zotero_creators))},
+                {"source": "arXiv", "value": ", ".join(a.get("lastName", "") for a in arxiv_author_list)}
             ]
 
         doi_zotero = (zotero.get("doi") or "").strip()
@@ -3142,8 +3608,7 @@ class ZoteroConnector:
         """Normalize abstract for comparison"""
         if not abstract:
             return ""
-        normalized = re.sub(r'\s+', ' ', abstract.strip())
-        return normalized
+        return _RE_WS.sub(' ', abstract.strip())
 
     def _normalize_date(self, date: str) -> str:
         """Normalize date for comparison"""
@@ -3158,7 +3623,7 @@ class ZoteroConnector:
         """Extract last names from Zotero creators"""
         last_names = []
         for creator in creators:
-            if creator.get("creatorType") in ["author", "coauthor"]:
+            if creator.get("creatorType") in _AUTHOR_TYPES:
                 last_name = creator.get("lastName", "").strip()
                 if last_name:
                     last_names.append(last_name)
@@ -3209,84 +3674,75 @@ class ZoteroConnector:
 
         return validation
 
-    def _get_item_attachments(self, item_id: int) -> List[Dict]:
-        """Get attachments for an item from the database"""
+    def _get_item_attachments(self, item_id: int, conn: Optional[sqlite3.Connection] = None) -> List[Dict]:
+        """Get attachments for an item from the database (reusing ``conn`` when given)"""
         attachments = []
-        db_path = self._get_zotero_db_path()
-        if not db_path or not db_path.exists():
-            return attachments
+        if conn is None:
+            if not self._db_available(self._get_zotero_db_path()):
+                return attachments
+            conn = self._ro()
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
+            # Columns are selected in _ATTACHMENT_KEYS order
             cursor.execute("""
-                SELECT a.itemID, a.path, a.filename, a.contentType, a.storagePath,
-                       i.key, i.itemType
+                SELECT a.itemID, i.key, a.filename, a.contentType, a.path, a.storagePath
                 FROM attachments a
                 JOIN items i ON a.itemID = i.itemID
                 WHERE a.parentItemID = ?
             """, (item_id,))
 
-            for row in cursor:
-                attachments.append({
-                    "attachmentItemID": row["itemID"],
-                    "key": row["key"],
-                    "filename": row["filename"],
-                    "contentType": row["contentType"],
-                    "path": row["path"],
-                    "storagePath": row["storagePath"]
-                })
+            attachments = [dict(zip(_ATTACHMENT_KEYS, row)) for row in cursor]
 
-            conn.close()
         except Exception as e:
             logger.error(f"Failed to get attachments: {e}")
+            self._close_ro_connection()
 
         return attachments
 
-    def _get_item_notes(self, item_id: int) -> List[Dict]:
-        """Get notes for an item from the database"""
+    def _get_item_notes(self, item_id: int, conn: Optional[sqlite3.Connection] = None) -> List[Dict]:
+        """Get notes for an item from the database (reusing ``conn`` when given)"""
         notes = []
-        db_path = self._get_zotero_db_path()
-        if not db_path or not db_path.exists():
-            return notes
+        if conn is None:
+            if not self._db_available(self._get_zotero_db_path()):
+                return notes
+            conn = self._ro()
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
+            # Columns are selected in _NOTE_KEYS order
             cursor.execute("""
-                SELECT n.itemID, n.note, i.key
+                SELECT n.itemID, i.key, n.note
                 FROM notes n
                 JOIN items i ON n.itemID = i.itemID
                 WHERE n.parentItemID = ?
             """, (item_id,))
 
-            for row in cursor:
-                notes.append({
-                    "noteItemID": row["itemID"],
-                    "key": row["key"],
-                    "note": row["note"]
-                })
+            notes = [dict(zip(_NOTE_KEYS, row)) for row in cursor]
 
-            conn.close()
         except Exception as e:
             logger.error(f"Failed to get notes: {e}")
+            self._close_ro_connection()
 
         return notes
 
-    def _get_item_tags(self, item_id: int) -> List[Dict]:
-        """Get tags for an item from the database"""
-        tags = []
-        db_path = self._get_zotero_db_path()
-        if not db_path or not db_path.exists():
-            return tags
+    def _get_item_tags(self, item_id: int, conn: Optional[sqlite3.Connection] = None) -> List[Dict]:
+        """Get tags for an item from the database (reusing ``conn`` when given)"""
+        return self._get_item_tag_views(item_id, conn)[1]
+
+    def _get_item_tag_views(self, item_id: int,
+                            conn: Optional[sqlite3.Connection] = None) -> Tuple[List[str], List[Dict]]:
+        """Get an item's tag names and tag details, both built in one pass over the rows"""
+        names: List[str] = []
+        tags: List[Dict] = []
+        if conn is None:
+            if not self._db_available(self._get_zotero_db_path()):
+                return names, tags
+            conn = self._ro()
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -3297,38 +3753,101 @@ class ZoteroConnector:
             """, (item_id,))
 
             for row in cursor:
+                names.append(row["name"])
                 tags.append({
                     "tagID": row["tagID"],
                     "name": row["name"],
                     "type": row["type"]
                 })
 
-            conn.close()
         except Exception as e:
             logger.error(f"Failed to get tags: {e}")
+            self._close_ro_connection()
 
-        return tags
+        return names, tags
+
+    def _get_storage_index(self, storage_dir: Path, refresh: bool = False) -> Dict[str, Path]:
+        """
+        Map attachment keys to files under storage/, rebuilt when the directory changes.
+
+        The storage/ mtime only moves when a key folder is added or removed, not
+        when files inside a folder change, so callers pass ``refresh`` on a miss.
+        """
+        mtime = storage_dir.stat().st_mtime_ns
+        cached = self._storage_index
+        if not refresh and cached and cached[0] == storage_dir and cached[1] == mtime:
+            return cached[2]
+
+        index: Dict[str, Path] = {}
+        with os.scandir(storage_dir) as folders:
+            for folder in folders:
+                if not folder.is_dir():
+                    continue
+                try:
+                    with os.scandir(folder.path) as files:
+                        for entry in files:
+                            # "{key}.pdf" wins over a bare "{key}" file
+                            if entry.name.endswith(".pdf"):
+                                index[entry.name[:-4]] = Path(entry.path)
+                            else:
+                                index.setdefault(entry.name, Path(entry.path))
+                except OSError:
+                    continue
+
+        self._storage_index = (storage_dir, mtime, index)
+        return index
+
+    def _attachment_file_path(self, attachment_key: str, attachment_path: Optional[str]) -> Optional[Path]:
+        """
+        Locate a stored attachment file.
+
+        Zotero records stored files as ``storage:<filename>`` inside
+        ``storage/<key>/``, so that path is built directly; anything else falls
+        back to searching the storage directory.
+        """
+        storage_dir = self._zotero_storage_dir
+        if storage_dir and attachment_path and attachment_path.startswith("storage:"):
+            candidate = storage_dir / attachment_key / attachment_path[len("storage:"):]
+            if candidate.is_file():
+                return candidate
+
+        return self._find_attachment_storage_path(attachment_key)
 
     def _find_attachment_storage_path(self, attachment_key: str) -> Optional[Path]:
         """Find the actual storage path for an attachment"""
         storage_dir = self._zotero_storage_dir
-        if not storage_dir or not storage_dir.exists():
+        if not storage_dir:
             return None
 
         try:
-            for item_folder in storage_dir.iterdir():
-                if item_folder.is_dir():
-                    attachment_path = item_folder / f"{attachment_key}.pdf"
-                    if attachment_path.exists():
-                        return attachment_path
-                    attachment_path = item_folder / f"{attachment_key}"
-                    if attachment_path.exists():
-                        return attachment_path
+            # Zotero keeps each attachment in storage/<key>/: read that folder once
+            # before falling back to the index over every folder
+            candidates = {}
+            try:
+                with os.scandir(storage_dir / attachment_key) as files:
+                    candidates = {entry.name: entry.path for entry in files if entry.is_file()}
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+            for name in (f"{attachment_key}.pdf", attachment_key):
+                if name in candidates:
+                    return Path(candidates[name])
+
+            path = self._get_storage_index(storage_dir).get(attachment_key)
+            if path is None or not path.is_file():
+                # Stale index: rebuild once before giving up
+                path = self._get_storage_index(storage_dir, refresh=True).get(attachment_key)
+            return path
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to find attachment storage path: {e}")
 
         return None
 
+    def _extract_pdf_text(self, reader: Any) -> List[str]:
+        """Extract page texts in-process (repeat reads hit the PDF text cache)"""
+        return [_pdf_page_text(page) for page in reader.pages]
+
     def get_item_pdf_content(self, item_key: str) -> Dict:
         """
         Get the PDF content of an item's attachment for text extraction.
@@ -3344,56 +3863,39 @@ class ZoteroConnector:
                 return {"success": False, "error": "Zotero is not running"}
 
             db_path = self._get_zotero_db_path()
-            if not db_path or not db_path.exists():
+            if not self._db_available(db_path):
                 return {"success": False, "error": "Zotero database not found"}
 
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT itemID FROM items WHERE key = ? AND libraryID = 1", (item_key,))
-            row = cursor.fetchone()
-            if not row:
-                conn.close()
-                return {"success": False, "error": "Item not found"}
-
-            item_id = row[0]
+            cursor = self._ro().cursor()
 
+            # Resolve the item and its first PDF attachment in one query
             cursor.execute("""
-                SELECT a.itemID, i.key, a.path, a.filename
-                FROM attachments a
-                JOIN items i ON a.itemID = i.itemID
-                WHERE a.parentItemID = ? AND a.contentType = 'application/pdf'
+                SELECT ai.key, a.path
+                FROM items i
+                JOIN attachments a ON a.parentItemID = i.itemID
+                JOIN items ai ON ai.itemID = a.itemID
+                WHERE i.key = ? AND i.libraryID = ? AND a.contentType = 'application/pdf'
                 LIMIT 1
-            """, (item_id,))
+            """, (item_key, self._library_id))
 
             attachment_row = cursor.fetchone()
-            conn.close()
 
             if not attachment_row:
+                if self._resolve_item_id(cursor, item_key) is None:
+                    return {"success": False, "error": "Item not found"}
                 return {"success": False, "error": "No PDF attachment found", "item_key": item_key}
 
-            attachment_key = attachment_row[1]
-            storage_path = self._find_attachment_storage_path(attachment_key)
+            attachment_key, attachment_path = attachment_row
+            storage_path = self._attachment_file_path(attachment_key, attachment_path)
 
             if storage_path and storage_path.exists():
                 try:
-                    from pypdf import PdfReader
-                    reader = PdfReader(str(storage_path))
-                    text_content = []
-                    for page in reader.pages:
-                        text = page.extract_text()
-                        if text:
-                            text_content.append(text)
-                    full_text = "\n\n".join(text_content)
-
                     return {
                         "success": True,
                         "item_key": item_key,
                         "attachment_key": attachment_key,
                         "pdf_path": str(storage_path),
-                        "text": full_text,
-                        "page_count": len(reader.pages),
-                        "character_count": len(full_text)
+                        **self._read_pdf_text(storage_path)
                     }
                 except Exception as e:
                     return {"success": False, "error": f"PDF read failed: {e}", "item_key": item_key}
@@ -3410,6 +3912,32 @@ class ZoteroConnector:
             logger.error(f"Failed to get item PDF content: {e}")
             return {"success": False, "error": str(e)}
 
+    def _read_pdf_text(self, pdf_path: Path) -> Dict:
+        """Text and page count of a PDF, reused while the file is unchanged"""
+        st = pdf_path.stat()
+        fingerprint = (str(pdf_path), st.st_size, st.st_mtime_ns)
+        with self._read_cache_lock:
+            cached = self._pdf_text_cache.get(fingerprint)
+            if cached is not None:
+                self._pdf_text_cache.move_to_end(fingerprint)
+                return dict(cached)
+
+        from pypdf import PdfReader
+        reader = PdfReader(str(pdf_path), strict=False)
+        page_texts = self._extract_pdf_text(reader)
+        full_text = "\n\n".join(text for text in page_texts if text)
+
+        result = {
+            "text": full_text,
+            "page_count": len(reader.pages),
+            "character_count": len(full_text)
+        }
+        with self._read_cache_lock:
+            self._pdf_text_cache[fingerprint] = result
+            while len(self._pdf_text_cache) > _PDF_TEXT_CACHE_SIZE:
+                self._pdf_text_cache.popitem(last=False)
+        return dict(result)
+
     def get_item_full_data(self, item_key: str, include_attachments: bool = True) -> Dict:
         """
         Get full item data including attachments, notes, and tags.
@@ -3431,14 +3959,14 @@ class ZoteroConnector:
 
             item_id = item.get("itemID")
 
+            # One pooled connection serves all three child queries
+            conn = self._ro()
             if include_attachments:
-                item["attachments"] = self._get_item_attachments(item_id)
+                item["attachments"] = self._get_item_attachments(item_id, conn)
 
-            item["notes"] = self._get_item_notes(item_id)
+            item["notes"] = self._get_item_notes(item_id, conn)
 
-            raw_tags = self._get_item_tags(item_id)
-            item["tags"] = [t["name"] for t in raw_tags]
-            item["tags_detail"] = raw_tags
+            item["tags"], item["tags_detail"] = self._get_item_tag_views(item_id, conn)
 
             return {"success": True, "item": item}
 
@@ -18,10 +18,17 @@ Technical features:
 """
 
 import asyncio
+import copy
+import functools
 import logging
 import json
+import re
 import sys
-from typing import Any, Optional
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Awaitable, Callable, Optional
 from pathlib import Path
 
 # MCP imports
@@ -32,7 +39,7 @@ from mcp import ClientSession
 from mcp.server.stdio import stdio_server
 
 # Local imports
-from .zotero_integration import ZoteroConnector
+from .zotero_integration import ArxivMetadataError, ZoteroConnector
 from .cookie_sync import CookieSyncManager
 
 # Configure logging - write to user directory to avoid read-only install paths
@@ -40,1370 +47,1551 @@ log_dir = Path.home() / '.zotlink'
 log_dir.mkdir(parents=True, exist_ok=True)
 log_file = log_dir / 'zotlink.log'
 
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+file_handler = logging.FileHandler(log_file, encoding='utf-8')
+file_handler.setFormatter(log_formatter)
+handlers = [file_handler]
+
 # Windows console common GBK encoding issues: only write to file to avoid emoji encoding errors
-handlers = [logging.FileHandler(log_file, encoding='utf-8')]
 if sys.platform != 'win32':
-    handlers.append(logging.StreamHandler(sys.stderr))
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(log_formatter)
+    handlers.append(stream_handler)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=handlers
-)
+# Same effect as logging.basicConfig: leave an already configured root logger alone
+root_logger = logging.getLogger()
+if not root_logger.handlers:
+    root_logger.setLevel(logging.INFO)
+    for handler in handlers:
+        root_logger.addHandler(handler)
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for blocking Zotero/network calls made from tool handlers
+_SYNC_WORKERS = 8
+
+# URL patterns used when describing saved papers
+_ARXIV_HOST = 'arxiv.org'
+_ARXIV_RE = re.compile(r'arxiv\.org/(abs|pdf)/([^/?]+)')
+_BIORXIV_SUB = 'biorxiv.org'
+_MEDRXIV_SUB = 'medrxiv.org'
+_CHEMRXIV_SUB = 'chemrxiv.org'
+# DataCite arXiv DOI prefix, lowercased (DOIs are case-insensitive)
+_ARXIV_DOI_PREFIX = '10.48550/arxiv.'
+
+# Preprint servers reported by name, checked in this order
+_PREPRINT_SOURCES = {
+    _BIORXIV_SUB: 'bioRxiv',
+    _MEDRXIV_SUB: 'medRxiv',
+    _CHEMRXIV_SUB: 'ChemRxiv',
+}
+
 # Global Zotero connector
 zotero_connector = ZoteroConnector()
 
-# Auto-load available cookies from files
-logger.info("Loading shared cookies...")
-cookie_results = zotero_connector.load_cookies_from_files()
-if cookie_results:
-    success_count = sum(1 for v in cookie_results.values() if v)
-    total_count = len(cookie_results)
-    logger.info(f"Cookie loading complete: {success_count}/{total_count} databases")
-else:
-    logger.info("No shared cookies available")
-
-# Initialize cookie sync manager
-cookie_sync_manager = CookieSyncManager(zotero_connector=zotero_connector)
-
-# Sync loaded cookies to CookieSyncManager
-logger.info("Syncing loaded cookies status...")
-if zotero_connector.extractor_manager and zotero_connector.extractor_manager.cookies_store:
-    for db_name, cookies in zotero_connector.extractor_manager.cookies_store.items():
-        if cookies and cookies.strip():
-            cookie_sync_manager.database_registry.update_cookie_status(db_name, cookies)
-            logger.info(f"Synced {db_name} cookies status to auth manager")
-
-cookie_sync_manager.start()
+# Cookie loading and the cookie sync service start with the server (see
+# _startup), so importing this module stays cheap
+cookie_sync_manager: Optional[CookieSyncManager] = None
+_startup_done = False
+
+def _start_cookie_services() -> None:
+    """Load shared cookies and start the cookie sync service"""
+    global cookie_sync_manager
+    
+    # Auto-load available cookies from files
+    logger.info("Loading shared cookies...")
+    cookie_results = zotero_connector.load_cookies_from_files()
+    if cookie_results:
+        success_count = sum(map(bool, cookie_results.values()))
+        total_count = len(cookie_results)
+        logger.info("Cookie loading complete: %d/%d databases", success_count, total_count)
+    else:
+        logger.info("No shared cookies available")
+
+    # Initialize cookie sync manager
+    cookie_sync_manager = CookieSyncManager(zotero_connector=zotero_connector)
+
+    # Sync loaded cookies to CookieSyncManager
+    logger.info("Syncing loaded cookies status...")
+    if zotero_connector.extractor_manager and zotero_connector.extractor_manager.cookies_store:
+        updates = {
+            db_name: cookies
+            for db_name, cookies in zotero_connector.extractor_manager.cookies_store.items()
+            if cookies and cookies.strip()
+        }
+        synced = cookie_sync_manager.database_registry.bulk_update_cookie_status(updates)
+        logger.info("Synced cookies status of %d database(s) to auth manager", synced)
+
+    cookie_sync_manager.start()
+
+async def _startup() -> None:
+    """One-time server startup, run off the event loop"""
+    global _startup_done
+    if _startup_done:
+        return
+    _startup_done = True
+    await _sync(_start_cookie_services)
 
 # Create MCP server
 server = Server("zotlink")
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List all available Zotero tools"""
-    return [
-        types.Tool(
-            name="check_zotero_status",
-            description="Check connection status and version info for Zotero desktop app",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="get_zotero_collections",
-            description="Get all collections/folders from your Zotero library (tree structure)",
-            inputSchema={
-                "type": "object", 
-                "properties": {},
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="save_paper_to_zotero",
-            description="Save a paper to Zotero from a URL (arXiv, DOI, etc.). Automatically fetches metadata and PDF",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "paper_url": {
-                        "type": "string",
-                        "description": "Paper URL (supports arXiv, DOI links, etc.)"
-                    },
-                    "paper_title": {
-                        "type": "string", 
-                        "description": "Paper title (optional, will be auto-extracted)"
-                    },
-                    "collection_key": {
-                        "type": "string",
-                        "description": "Target collection key (optional, saves to default location)"
-                    }
-                },
-                "required": ["paper_url"]
-            }
-        ),
-        types.Tool(
-            name="save_paper_by_doi",
-            description="Save a paper to Zotero by DOI. Supports arXiv DOIs (10.48550/arXiv.XXX) and published DOIs",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "doi": {
-                        "type": "string",
-                        "description": "DOI string (e.g., '10.48550/arXiv.2301.00001' or '10.1038/s41586-023-03758-y')"
-                    },
-                    "collection_key": {
-                        "type": "string",
-                        "description": "Target collection key (optional, saves to default location)"
-                    }
-                },
-                "required": ["doi"]
-            }
-        ),
-        types.Tool(
-            name="create_zotero_collection",
-            description="Create a new collection/folder in Zotero for organizing papers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Collection name"
-                    },
-                    "parent_key": {
-                        "type": "string",
-                        "description": "Parent collection key (optional, for nested collections)"
-                    }
-                },
-                "required": ["name"]
-            }
-        ),
-        types.Tool(
-            name="extract_arxiv_metadata",
-            description="Extract complete metadata from an arXiv URL (title, authors, abstract, subjects, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "arxiv_url": {
-                        "type": "string",
-                        "description": "arXiv URL (abs or pdf page)"
-                    }
+# Tool and resource definitions are static, so build them once at import.
+# Schema fragments repeated across tools are shared; treat them as read-only.
+_NO_ARGS_SCHEMA = {"type": "object", "properties": {}, "required": []}
+_ITEM_KEY_PROP = {"type": "string", "description": "The Zotero item key"}
+_TARGET_COLLECTION_PROP = {
+    "type": "string",
+    "description": "Target collection key (optional, saves to default location)"
+}
+
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="check_zotero_status",
+        description="Check connection status and version info for Zotero desktop app",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    types.Tool(
+        name="get_zotero_collections",
+        description="Get all collections/folders from your Zotero library (tree structure)",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    types.Tool(
+        name="save_paper_to_zotero",
+        description="Save a paper to Zotero from a URL (arXiv, DOI, etc.). Automatically fetches metadata and PDF",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "paper_url": {
+                    "type": "string",
+                    "description": "Paper URL (supports arXiv, DOI links, etc.)"
                 },
-                "required": ["arxiv_url"]
-            }
-        ),
-        types.Tool(
-            name="get_library_items",
-            description="Get items from your Zotero library with pagination support. Optionally includes attachments, notes, and tags.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of items to return (default: 50)"
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Offset for pagination (default: 0)"
-                    },
-                    "include_details": {
-                        "type": "boolean",
-                        "description": "Include attachment count, note count, and tags for each item (default: false)"
-                    }
+                "paper_title": {
+                    "type": "string", 
+                    "description": "Paper title (optional, will be auto-extracted)"
                 },
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="search_zotero_items",
-            description="Search for items in your Zotero library by keyword or phrase",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query string"
-                    }
+                "collection_key": _TARGET_COLLECTION_PROP
+            },
+            "required": ["paper_url"]
+        }
+    ),
+    types.Tool(
+        name="save_paper_by_doi",
+        description="Save a paper to Zotero by DOI. Supports arXiv DOIs (10.48550/arXiv.XXX) and published DOIs",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "doi": {
+                    "type": "string",
+                    "description": "DOI string (e.g., '10.48550/arXiv.2301.00001' or '10.1038/s41586-023-03758-y')"
                 },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="get_zotero_item",
-            description="Get detailed information about a specific Zotero item by its key. Optionally includes attachments, notes, and tags.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_key": {
-                        "type": "string",
-                        "description": "The Zotero item key"
-                    },
-                    "include_attachments": {
-                        "type": "boolean",
-                        "description": "Include attachments, notes, and tags in response (default: true)"
-                    }
+                "collection_key": _TARGET_COLLECTION_PROP
+            },
+            "required": ["doi"]
+        }
+    ),
+    types.Tool(
+        name="create_zotero_collection",
+        description="Create a new collection/folder in Zotero for organizing papers",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Collection name"
                 },
-                "required": ["item_key"]
-            }
-        ),
-        types.Tool(
-            name="update_zotero_item",
-            description="Update an existing Zotero item's metadata (title, abstract, date, URL, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_key": {
-                        "type": "string",
-                        "description": "The Zotero item key to update"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New title (optional)"
-                    },
-                    "abstract": {
-                        "type": "string",
-                        "description": "New abstract note (optional)"
-                    },
-                    "date": {
-                        "type": "string",
-                        "description": "New date (optional)"
-                    },
-                    "url": {
-                        "type": "string",
-                        "description": "New URL (optional)"
-                    }
+                "parent_key": {
+                    "type": "string",
+                    "description": "Parent collection key (optional, for nested collections)"
+                }
+            },
+            "required": ["name"]
+        }
+    ),
+    types.Tool(
+        name="extract_arxiv_metadata",
+        description="Extract complete metadata from an arXiv URL (title, authors, abstract, subjects, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "arxiv_url": {
+                    "type": "string",
+                    "description": "arXiv URL (abs or pdf page)"
+                }
+            },
+            "required": ["arxiv_url"]
+        }
+    ),
+    types.Tool(
+        name="get_library_items",
+        description="Get items from your Zotero library with pagination support. Optionally includes attachments, notes, and tags.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of items to return (default: 50)"
                 },
-                "required": ["item_key"]
-            }
-        ),
-        types.Tool(
-            name="update_zotero_item_tags",
-            description="Update or replace tags on an existing Zotero item",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_key": {
-                        "type": "string",
-                        "description": "The Zotero item key"
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of tag strings to set"
-                    }
+                "offset": {
+                    "type": "integer",
+                    "description": "Offset for pagination (default: 0)"
                 },
-                "required": ["item_key", "tags"]
-            }
-        ),
-        types.Tool(
-            name="delete_zotero_item",
-            description="Delete an item from your Zotero library",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_key": {
-                        "type": "string",
-                        "description": "The Zotero item key to delete"
-                    }
+                "include_details": {
+                    "type": "boolean",
+                    "description": "Include attachment count, note count, and tags for each item (default: false)"
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="search_zotero_items",
+        description="Search for items in your Zotero library by keyword or phrase",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query string"
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    types.Tool(
+        name="get_zotero_item",
+        description="Get detailed information about a specific Zotero item by its key. Optionally includes attachments, notes, and tags.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_key": _ITEM_KEY_PROP,
+                "include_attachments": {
+                    "type": "boolean",
+                    "description": "Include attachments, notes, and tags in response (default: true)"
+                }
+            },
+            "required": ["item_key"]
+        }
+    ),
+    types.Tool(
+        name="update_zotero_item",
+        description="Update an existing Zotero item's metadata (title, abstract, date, URL, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_key": {
+                    "type": "string",
+                    "description": "The Zotero item key to update"
                 },
-                "required": ["item_key"]
-            }
-        ),
-        types.Tool(
-            name="move_zotero_item",
-            description="Move a Zotero item to a different collection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_key": {
-                        "type": "string",
-                        "description": "The Zotero item key"
-                    },
-                    "collection_key": {
-                        "type": "string",
-                        "description": "The target collection key"
-                    }
+                "title": {
+                    "type": "string",
+                    "description": "New title (optional)"
                 },
-                "required": ["item_key", "collection_key"]
-            }
-        ),
-        types.Tool(
-            name="search_arxiv_api",
-            description="Search arXiv using the official API. Use prefixes: ti: (title), au: (author), abs: (abstract)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (e.g., 'ti:transformer', 'au:hinton', 'abs:neural networks')"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum results to return (default: 5, max: 50)"
-                    }
+                "abstract": {
+                    "type": "string",
+                    "description": "New abstract note (optional)"
                 },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="validate_zotero_item",
-            description="Validate a Zotero item against arXiv metadata. Shows differences between Zotero entry and arXiv data",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_key": {
-                        "type": "string",
-                        "description": "The Zotero item key to validate"
-                    }
+                "date": {
+                    "type": "string",
+                    "description": "New date (optional)"
                 },
-                "required": ["item_key"]
-            }
-        ),
-        types.Tool(
-            name="validate_and_update_item",
-            description="Validate a Zotero item against arXiv and optionally update it with corrected metadata",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_key": {
-                        "type": "string",
-                        "description": "The Zotero item key"
-                    },
-                    "apply_updates": {
-                        "type": "boolean",
-                        "description": "If True, automatically update Zotero with arXiv data where differences exist (default: False)"
-                    }
+                "url": {
+                    "type": "string",
+                    "description": "New URL (optional)"
+                }
+            },
+            "required": ["item_key"]
+        }
+    ),
+    types.Tool(
+        name="update_zotero_item_tags",
+        description="Update or replace tags on an existing Zotero item",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_key": _ITEM_KEY_PROP,
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of tag strings to set"
+                }
+            },
+            "required": ["item_key", "tags"]
+        }
+    ),
+    types.Tool(
+        name="delete_zotero_item",
+        description="Delete an item from your Zotero library",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_key": {
+                    "type": "string",
+                    "description": "The Zotero item key to delete"
+                }
+            },
+            "required": ["item_key"]
+        }
+    ),
+    types.Tool(
+        name="move_zotero_item",
+        description="Move a Zotero item to a different collection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_key": _ITEM_KEY_PROP,
+                "collection_key": {
+                    "type": "string",
+                    "description": "The target collection key"
+                }
+            },
+            "required": ["item_key", "collection_key"]
+        }
+    ),
+    types.Tool(
+        name="search_arxiv_api",
+        description="Search arXiv using the official API. Use prefixes: ti: (title), au: (author), abs: (abstract)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g., 'ti:transformer', 'au:hinton', 'abs:neural networks')"
                 },
-                "required": ["item_key"]
-            }
-        ),
-        types.Tool(
-            name="fetch_pdf",
-            description="Fetch PDF for a Zotero item from open access sources (arXiv, PubMed, DOAJ, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_key": {
-                        "type": "string",
-                        "description": "The Zotero item key to fetch PDF for"
-                    },
-                    "source": {
-                        "type": "string",
-                        "enum": ["auto", "arxiv", "open_access", "scihub", "annas_archive"],
-                        "description": "Preferred source: auto (try all), arxiv, open_access, scihub, annas_archive"
-                    },
-                    "save_to_zotero": {
-                        "type": "boolean",
-                        "description": "If True, save the fetched PDF as an attachment to the Zotero item (default: True)"
-                    }
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum results to return (default: 5, max: 50)"
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    types.Tool(
+        name="validate_zotero_item",
+        description="Validate a Zotero item against arXiv metadata. Shows differences between Zotero entry and arXiv data",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_key": {
+                    "type": "string",
+                    "description": "The Zotero item key to validate"
+                }
+            },
+            "required": ["item_key"]
+        }
+    ),
+    types.Tool(
+        name="validate_and_update_item",
+        description="Validate a Zotero item against arXiv and optionally update it with corrected metadata",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_key": _ITEM_KEY_PROP,
+                "apply_updates": {
+                    "type": "boolean",
+                    "description": "If True, automatically update Zotero with arXiv data where differences exist (default: False)"
+                }
+            },
+            "required": ["item_key"]
+        }
+    ),
+    types.Tool(
+        name="fetch_pdf",
+        description="Fetch PDF for a Zotero item from open access sources (arXiv, PubMed, DOAJ, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_key": {
+                    "type": "string",
+                    "description": "The Zotero item key to fetch PDF for"
                 },
-                "required": ["item_key"]
-            }
-        ),
-        types.Tool(
-            name="get_item_pdf_text",
-            description="Extract text from an attached PDF in Zotero for full-text search and analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_key": {
-                        "type": "string",
-                        "description": "The Zotero item key to extract PDF text from"
-                    }
+                "source": {
+                    "type": "string",
+                    "enum": ["auto", "arxiv", "open_access", "scihub", "annas_archive"],
+                    "description": "Preferred source: auto (try all), arxiv, open_access, scihub, annas_archive"
                 },
-                "required": ["item_key"]
-            }
-        )
-    ]
+                "save_to_zotero": {
+                    "type": "boolean",
+                    "description": "If True, save the fetched PDF as an attachment to the Zotero item (default: True)"
+                }
+            },
+            "required": ["item_key"]
+        }
+    ),
+    types.Tool(
+        name="get_item_pdf_text",
+        description="Extract text from an attached PDF in Zotero for full-text search and analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_key": {
+                    "type": "string",
+                    "description": "The Zotero item key to extract PDF text from"
+                }
+            },
+            "required": ["item_key"]
+        }
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List all available Zotero tools"""
+    return _TOOLS
+
+_RESOURCES: list[types.Resource] = [
+    types.Resource(
+        uri="zotero://status",
+        name="Zotero Connection Status",
+        description="Current Zotero desktop app connection status",
+        mimeType="application/json"
+    ),
+    types.Resource(
+        uri="zotero://collections",
+        name="Zotero Collection List", 
+        description="All collections in your Zotero library",
+        mimeType="application/json"
+    )
+]
 
 @server.list_resources()
 async def handle_list_resources() -> list[types.Resource]:
     """List available resources"""
-    return [
-        types.Resource(
-            uri="zotero://status",
-            name="Zotero Connection Status",
-            description="Current Zotero desktop app connection status",
-            mimeType="application/json"
-        ),
-        types.Resource(
-            uri="zotero://collections",
-            name="Zotero Collection List", 
-            description="All collections in your Zotero library",
-            mimeType="application/json"
+    return _RESOURCES
+
+async def _sync(fn, *args, **kwargs):
+    """Run a blocking connector call in a worker thread so the event loop keeps serving requests"""
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+def _preview(text: str, limit: int) -> str:
+    """text cut to limit characters with a trailing ellipsis; short text is returned as is"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+@functools.lru_cache(maxsize=64)
+def _text_response(text: str) -> list[types.TextContent]:
+    """Reply for a fixed message; the list is shared between calls and must not be modified"""
+    return [types.TextContent(type="text", text=text)]
+
+class _TTLCache:
+    """Remembers the result of one blocking call for ``ttl`` seconds; falsy results only when keep_empty"""
+    
+    def __init__(self, ttl: float, keep_empty: bool = True):
+        self.ttl = ttl
+        self.keep_empty = keep_empty
+        self._value = None
+        self._expires = 0.0
+    
+    async def get_or(self, fn):
+        """Return the remembered value, calling fn in a worker thread once it has expired"""
+        if time.monotonic() < self._expires:
+            return self._value
+        value = await _sync(fn)
+        if value or self.keep_empty:
+            self._value = value
+            self._expires = time.monotonic() + self.ttl
+        return value
+    
+    def invalidate(self) -> None:
+        self._expires = 0.0
+
+# Bursts of tool calls share one connector ping and one collection listing
+_running_cache = _TTLCache(2.0)
+# get_collections() returns [] when Zotero is down or the read fails, so that is not remembered
+_collections_cache = _TTLCache(30.0, keep_empty=False)
+
+async def _is_running_cached() -> bool:
+    """Whether Zotero is reachable, probing at most once per _running_cache ttl"""
+    return await _running_cache.get_or(zotero_connector.is_running)
+
+def _prefetch(awaitable) -> asyncio.Task:
+    """Start awaitable now and await the returned task when its result is needed"""
+    task = asyncio.ensure_future(awaitable)
+    # An abandoned prefetch must not log "exception was never retrieved"
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+class _LookupFailed(Exception):
+    """Carries an unusable lookup result out of an lru cache without storing it"""
+    
+    def __init__(self, info: dict):
+        super().__init__(info.get("error", "no title"))
+        self.info = info
+
+@functools.lru_cache(maxsize=256)
+def _cached_doi_info(doi: str) -> dict:
+    """Paper info for a DOI; only successful lookups are remembered"""
+    info = zotero_connector._build_paper_info_from_doi(doi)
+    if "error" in info or not info.get("title"):
+        raise _LookupFailed(info)
+    return info
+
+def _paper_info_for_doi(doi: str) -> dict:
+    """Private copy of the (cached) paper info for a DOI, or the failed lookup result"""
+    try:
+        return copy.deepcopy(_cached_doi_info(doi))
+    except _LookupFailed as e:
+        return e.info
+
+@functools.lru_cache(maxsize=512)
+def _cached_arxiv_meta(arxiv_url: str) -> dict:
+    """arXiv metadata for an abstract URL; ArxivMetadataError is raised, so failures are not remembered"""
+    return zotero_connector._extract_arxiv_metadata(arxiv_url)
+
+def _arxiv_metadata(arxiv_url: str) -> dict:
+    """Private copy of the (cached) arXiv metadata; raises ArxivMetadataError"""
+    return copy.deepcopy(_cached_arxiv_meta(arxiv_url))
+
+async def _tool_check_zotero_status(arguments: dict) -> list[types.TextContent]:
+    """Report whether Zotero is running, its version and collection count"""
+    try:
+        # Both probes are independent round-trips to Zotero; run them together
+        is_running, version = await asyncio.gather(
+            _is_running_cached(),
+            _sync(zotero_connector.get_version),
         )
-    ]
+        
+        if is_running:
+            collections_count = len(await _collections_cache.get_or(zotero_connector.get_collections))
+            
+            parts = ["Zotero Connection Successful!\n"]
+            parts.append("App Status: Zotero desktop is running")
+            parts.append(f"Version Info: {version}")
+            parts.append(f"Collection Count: {collections_count}")
+            parts.append("API Endpoint: http://127.0.0.1:23119\n")
+            parts.append("Available Tools:")
+            parts.append("  save_paper_to_zotero - Save academic papers")
+            parts.append("  get_zotero_collections - View collections")
+            parts.append("  extract_arxiv_metadata - Extract arXiv metadata")
+            parts.append("  create_zotero_collection - Create new collection")
+            parts.append("  search_arxiv_api - Search arXiv")
+            parts.append("  And more...\n")
+            parts.append("Getting Started: View your collections and save academic papers!")
+        else:
+            parts = ["Zotero Not Running\n"]
+            parts.append("Solutions:")
+            parts.append("1. Start Zotero desktop application")
+            parts.append("2. Ensure Zotero is fully loaded")
+            parts.append("3. Run this check again\n")
+            parts.append("Requirements: Zotero 6.0 or newer")
+        
+        return [types.TextContent(type="text", text="\n".join(parts))]
+        
+    except Exception as e:
+        logger.error("Failed to check Zotero status: %s", e)
+        return [types.TextContent(type="text", text=f"Error checking Zotero status: {e}")]
 
-@server.call_tool()
-async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
-    """Handle tool calls"""
+async def _tool_get_zotero_collections(arguments: dict) -> list[types.TextContent]:
+    """List the library's collections as an indented tree"""
+    try:
+        if not await _is_running_cached():
+            return _text_response("Zotero unavailable. Please start Zotero desktop app")
+        
+        collections = await _collections_cache.get_or(zotero_connector.get_collections)
+        
+        if not collections:
+            parts = ["Collection Management\n"]
+            parts.append("No collections found\n")
+            parts.append("Suggestions:")
+            parts.append("  Use create_zotero_collection to create a new collection")
+            parts.append("  Or manually create collections in Zotero desktop app")
+            return [types.TextContent(type="text", text="\n".join(parts))]
+        
+        parts = [f"Zotero Collection List ({len(collections)} total)\n"]
+        
+        # Index children by parent once (top-level ones under None), then walk
+        # the tree depth-first
+        kids = defaultdict(list)
+        for c in collections:
+            kids[c.get('parentCollection') or None].append(c)
+        root_collections = kids.pop(None, [])
+        
+        stack = [(c, 0) for c in reversed(root_collections)]
+        while stack:
+            coll, level = stack.pop()
+            indent = "  " * level
+            name = coll.get('name', 'Unknown Collection')
+            key = coll.get('key', 'no key')
+            parts.append(f"{indent}  {name}\n{indent}    Key: {key}")
+            stack.extend((child, level + 1) for child in reversed(kids.get(coll.get('id'), ())))
+        
+        parts.append("\nUsage:")
+        parts.append("  Copy the collection Key value")
+        parts.append("  Specify collection_key in save_paper_to_zotero")
+        parts.append("  Papers will be automatically saved to the specified collection")
+        
+        return [types.TextContent(type="text", text="\n".join(parts))]
+        
+    except Exception as e:
+        logger.error("Failed to get collections: %s", e)
+        return [types.TextContent(type="text", text=f"Failed to get collections: {e}")]
+
+async def _tool_save_paper_to_zotero(arguments: dict) -> list[types.TextContent]:
+    """Save a paper from its URL"""
+    paper_url = arguments.get("paper_url")
+    paper_title = arguments.get("paper_title", "")
+    collection_key = arguments.get("collection_key")
     
-    if name == "check_zotero_status":
-        try:
-            is_running = zotero_connector.is_running()
-            version = zotero_connector.get_version()
-            
-            if is_running:
-                collections_count = len(zotero_connector.get_collections())
-                
-                message = "Zotero Connection Successful!\n\n"
-                message += f"App Status: Zotero desktop is running\n"
-                message += f"Version Info: {version}\n"
-                message += f"Collection Count: {collections_count}\n"
-                message += f"API Endpoint: http://127.0.0.1:23119\n\n"
-                message += f"Available Tools:\n"
-                message += f"  save_paper_to_zotero - Save academic papers\n"
-                message += f"  get_zotero_collections - View collections\n"
-                message += f"  extract_arxiv_metadata - Extract arXiv metadata\n"
-                message += f"  create_zotero_collection - Create new collection\n"
-                message += f"  search_arxiv_api - Search arXiv\n"
-                message += f"  And more...\n\n"
-                message += f"Getting Started: View your collections and save academic papers!"
-            else:
-                message = "Zotero Not Running\n\n"
-                message += f"Solutions:\n"
-                message += f"1. Start Zotero desktop application\n"
-                message += f"2. Ensure Zotero is fully loaded\n"
-                message += f"3. Run this check again\n\n"
-                message += f"Requirements: Zotero 6.0 or newer"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to check Zotero status: {e}")
-            return [types.TextContent(type="text", text=f"Error checking Zotero status: {e}")]
+    if not paper_url:
+        return _text_response("Missing paper URL")
+    url_lc = paper_url.lower()
     
-    elif name == "get_zotero_collections":
-        try:
-            if not zotero_connector.is_running():
-                return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
-            
-            collections = zotero_connector.get_collections()
-            
-            if not collections:
-                message = "Collection Management\n\n"
-                message += "No collections found\n\n"
-                message += "Suggestions:\n"
-                message += "  Use create_zotero_collection to create a new collection\n"
-                message += "  Or manually create collections in Zotero desktop app"
-                return [types.TextContent(type="text", text=message)]
-            
-            message = f"Zotero Collection List ({len(collections)} total)\n\n"
-            
-            root_collections = [c for c in collections if not c.get('parentCollection')]
-            child_collections = [c for c in collections if c.get('parentCollection')]
-            
-            def format_collection(coll, level=0):
-                indent = "  " * level
-                name = coll.get('name', 'Unknown Collection')
-                key = coll.get('key', 'no key')
-                
-                formatted = f"{indent}  {name}\n"
-                formatted += f"{indent}    Key: {key}\n"
-                
-                children = [c for c in child_collections if c.get('parentCollection') == coll.get('id')]
-                for child in children:
-                    formatted += format_collection(child, level + 1)
-                
-                return formatted
-            
-            for root_coll in root_collections:
-                message += format_collection(root_coll)
-            
-            message += f"\nUsage:\n"
-            message += f"  Copy the collection Key value\n"
-            message += f"  Specify collection_key in save_paper_to_zotero\n"
-            message += f"  Papers will be automatically saved to the specified collection"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to get collections: {e}")
-            return [types.TextContent(type="text", text=f"Failed to get collections: {e}")]
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
     
-    elif name == "save_paper_to_zotero":
-        paper_url = arguments.get("paper_url")
-        paper_title = arguments.get("paper_title", "")
-        collection_key = arguments.get("collection_key")
+    try:
+        paper_info = {
+            "title": paper_title,
+            "url": paper_url
+        }
         
-        if not paper_url:
-            return [types.TextContent(type="text", text="Missing paper URL")]
+        if logger.isEnabledFor(logging.INFO) and _ARXIV_HOST in paper_url:
+            logger.info("Processing arXiv paper")
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        result = await _sync(zotero_connector.save_item_to_zotero, paper_info, collection_key=collection_key)
         
-        try:
-            paper_info = {
-                "title": paper_title,
-                "url": paper_url
-            }
-            
-            if 'arxiv.org' in paper_url:
-                logger.info("Processing arXiv paper")
-            
-            result = zotero_connector.save_item_to_zotero(paper_info, collection_key=collection_key)
-            
-            if result["success"]:
-                message = f"Paper saved successfully!\n\n"
-                
-                database = result.get("database", "Unknown")
-                enhanced = result.get("enhanced", False)
-                
-                message += f"Source: {database}\n"
-                message += f"Metadata enhanced: {'Yes' if enhanced else 'No'}\n"
-                
-                import re
-                
-                if 'arxiv.org' in paper_url:
-                    arxiv_match = re.search(r'arxiv\.org/(abs|pdf)/([^/?]+)', paper_url)
-                    if arxiv_match:
-                        arxiv_id = arxiv_match.group(2)
-                        message += f"Type: arXiv preprint\n"
-                        message += f"arXiv ID: {arxiv_id}\n"
-                        actual_title = result.get('title') or paper_title or f'arXiv:{arxiv_id} (extracting...)'
-                        message += f"Title: {actual_title}\n"
-                        message += f"Link: {paper_url}\n"
-                        message += f"PDF: https://arxiv.org/pdf/{arxiv_id}.pdf\n"
-                
-                elif 'biorxiv.org' in paper_url.lower():
-                    message = message.replace(f"Source: {database}\n", "Source: bioRxiv\n")
-                    message += f"Type: bioRxiv preprint\n"
-                    actual_title = result.get('title') or paper_title or 'extracting...'
-                    message += f"Title: {actual_title}\n"
-                    message += f"Link: {paper_url}\n"
-                    
-                elif 'medrxiv.org' in paper_url.lower():
-                    message = message.replace(f"Source: {database}\n", "Source: medRxiv\n")
-                    message += f"Type: medRxiv preprint\n"
-                    actual_title = result.get('title') or paper_title or 'extracting...'
-                    message += f"Title: {actual_title}\n"
-                    message += f"Link: {paper_url}\n"
-                    
-                elif 'chemrxiv.org' in paper_url.lower():
-                    message = message.replace(f"Source: {database}\n", "Source: ChemRxiv\n")
-                    message += f"Type: ChemRxiv preprint\n"
-                    actual_title = result.get('title') or paper_title or 'extracting...'
-                    message += f"Title: {actual_title}\n"
-                    message += f"Link: {paper_url}\n"
-                    
-                elif database and database != 'arXiv':
-                    message += f"Type: {database} journal article\n"
-                    actual_title = result.get('title') or paper_title or 'extracting...'
-                    message += f"Title: {actual_title}\n"
-                    message += f"Link: {paper_url}\n"
-                else:
-                    actual_title = result.get('title') or paper_title or 'extracting...'
-                    message += f"Title: {actual_title}\n"
-                    message += f"URL: {paper_url}\n"
-                
-                if collection_key:
-                    collection_moved = result.get("details", {}).get("collection_moved", False)
-                    if collection_moved:
-                        message += f"Collection: Moved to specified collection\n"
-                        message += f"Method: Using updateSession official mechanism\n"
-                    else:
-                        message += f"Collection: Move failed, item in default location\n"
-                        message += f"Manual: Please drag item to target collection in Zotero\n"
-                else:
-                    message += f"Saved to: My Library (default)\n"
+        if result["success"]:
+            parts = ["Paper saved successfully!\n"]
+            
+            database = result.get("database", "Unknown")
+            enhanced = result.get("enhanced", False)
+            got_title = result.get('title')
+            details = result.get("details") or {}
+            collection_moved = details.get("collection_moved", False)
+            pdf_downloaded = details.get("pdf_downloaded", False)
+            pdf_method = details.get("pdf_method", "link_attachment")
+            
+            preprint = None
+            if _ARXIV_HOST not in paper_url:
+                for host, label in _PREPRINT_SOURCES.items():
+                    if host in url_lc:
+                        preprint = label
+                        break
+            
+            parts.append(f"Source: {preprint or database}")
+            parts.append(f"Metadata enhanced: {'Yes' if enhanced else 'No'}")
+            
+            if _ARXIV_HOST in paper_url:
+                arxiv_match = _ARXIV_RE.search(paper_url)
+                if arxiv_match:
+                    arxiv_id = arxiv_match.group(2)
+                    parts.append("Type: arXiv preprint")
+                    parts.append(f"arXiv ID: {arxiv_id}")
+                    actual_title = got_title or paper_title or f'arXiv:{arxiv_id} (extracting...)'
+                    parts.append(f"Title: {actual_title}")
+                    parts.append(f"Link: {paper_url}")
+                    parts.append(f"PDF: https://arxiv.org/pdf/{arxiv_id}.pdf")
+            
+            elif preprint:
+                parts.append(f"Type: {preprint} preprint")
+                actual_title = got_title or paper_title or 'extracting...'
+                parts.append(f"Title: {actual_title}")
+                parts.append(f"Link: {paper_url}")
                 
-                details = result.get("details", {})
-                pdf_downloaded = details.get("pdf_downloaded", False)
-                pdf_error = details.get("pdf_error")
-                pdf_method = details.get("pdf_method", "link_attachment")
-                
-                if pdf_downloaded and pdf_method == "attachment":
-                    message += f"PDF: Downloaded and saved as attachment\n"
-                elif pdf_method == "failed":
-                    if "biorxiv.org" in paper_url.lower():
-                        message += f"PDF: Advanced download attempt failed\n"
-                        message += f"  Possible: Network delay, server load, or anti-bot detection\n"
-                        message += f"  Suggestion: Try again later or use browser Zotero connector\n"
-                    else:
-                        message += f"PDF: Save failed (network or server issue)\n"
-                        message += f"  Metadata saved, add PDF manually later\n"
-                elif pdf_method == "none":
-                    message += f"PDF: No PDF link found\n"
+            elif database and database != 'arXiv':
+                parts.append(f"Type: {database} journal article")
+                actual_title = got_title or paper_title or 'extracting...'
+                parts.append(f"Title: {actual_title}")
+                parts.append(f"Link: {paper_url}")
+            else:
+                actual_title = got_title or paper_title or 'extracting...'
+                parts.append(f"Title: {actual_title}")
+                parts.append(f"URL: {paper_url}")
+            
+            if collection_key:
+                if collection_moved:
+                    parts.append("Collection: Moved to specified collection")
+                    parts.append("Method: Using updateSession official mechanism")
                 else:
-                    message += f"PDF: Processing exception\n"
-                
-                if result.get("extra_preserved"):
-                    message += f"Metadata: Fully extracted (Comment, subjects, DOI, etc.)\n"
-                
-                message += f"\nVerification:\n"
-                if details.get("collection_moved"):
-                    message += f"Success! Paper is in the specified collection\n"
-                    message += f"1. Open Zotero desktop app\n"
-                    message += f"2. Check the specified collection for the new item\n"
-                    message += f"3. Verify PDF attachment and metadata completeness\n"
-                elif collection_key:
-                    message += f"Paper saved, collection move may need confirmation\n"
-                    message += f"1. Open Zotero desktop app\n"
-                    message += f"2. Check the specified collection first\n"
-                    message += f"3. If not found, check 'My Library' and move manually\n"
+                    parts.append("Collection: Move failed, item in default location")
+                    parts.append("Manual: Please drag item to target collection in Zotero")
+            else:
+                parts.append("Saved to: My Library (default)")
+            
+            if pdf_downloaded and pdf_method == "attachment":
+                parts.append("PDF: Downloaded and saved as attachment")
+            elif pdf_method == "failed":
+                if _BIORXIV_SUB in url_lc:
+                    parts.append("PDF: Advanced download attempt failed")
+                    parts.append("  Possible: Network delay, server load, or anti-bot detection")
+                    parts.append("  Suggestion: Try again later or use browser Zotero connector")
                 else:
-                    message += f"Paper saved to default location\n"
-                    message += f"1. Open Zotero desktop app\n"
-                    message += f"2. Find in 'My Library'\n"
-                    message += f"3. Move to collection if needed\n"
-                
-                message += f"\nDone! Enjoy your academic literature management!"
-                
+                    parts.append("PDF: Save failed (network or server issue)")
+                    parts.append("  Metadata saved, add PDF manually later")
+            elif pdf_method == "none":
+                parts.append("PDF: No PDF link found")
             else:
-                message = f"Save failed: {result.get('message', 'Unknown error')}\n\n"
-                message += f"Troubleshooting:\n"
-                message += f"  Ensure Zotero desktop app is running\n"
-                message += f"  Check network connection\n"
-                message += f"  Verify paper URL is valid\n"
-                message += f"  Try restarting Zotero app"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to save paper: {e}")
-            return [types.TextContent(type="text", text=f"Error saving paper: {e}")]
+                parts.append("PDF: Processing exception")
+            
+            if result.get("extra_preserved"):
+                parts.append("Metadata: Fully extracted (Comment, subjects, DOI, etc.)")
+            
+            parts.append("\nVerification:")
+            if collection_moved:
+                parts.append("Success! Paper is in the specified collection")
+                parts.append("1. Open Zotero desktop app")
+                parts.append("2. Check the specified collection for the new item")
+                parts.append("3. Verify PDF attachment and metadata completeness")
+            elif collection_key:
+                parts.append("Paper saved, collection move may need confirmation")
+                parts.append("1. Open Zotero desktop app")
+                parts.append("2. Check the specified collection first")
+                parts.append("3. If not found, check 'My Library' and move manually")
+            else:
+                parts.append("Paper saved to default location")
+                parts.append("1. Open Zotero desktop app")
+                parts.append("2. Find in 'My Library'")
+                parts.append("3. Move to collection if needed")
+            
+            parts.append("\nDone! Enjoy your academic literature management!")
+            
+        else:
+            parts = [f"Save failed: {result.get('message', 'Unknown error')}\n"]
+            parts.append("Troubleshooting:")
+            parts.append("  Ensure Zotero desktop app is running")
+            parts.append("  Check network connection")
+            parts.append("  Verify paper URL is valid")
+            parts.append("  Try restarting Zotero app")
+        
+        return [types.TextContent(type="text", text="\n".join(parts))]
+        
+    except Exception as e:
+        logger.error("Failed to save paper: %s", e)
+        return [types.TextContent(type="text", text=f"Error saving paper: {e}")]
+
+async def _tool_save_paper_by_doi(arguments: dict) -> list[types.TextContent]:
+    """Save a paper from its DOI"""
+    doi = arguments.get("doi", "").strip()
+    collection_key = arguments.get("collection_key")
+    
+    if not doi:
+        return _text_response("Missing DOI")
+    
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
     
-    elif name == "save_paper_by_doi":
-        doi = arguments.get("doi", "").strip()
-        collection_key = arguments.get("collection_key")
+    try:
+        logger.info("Processing DOI: %s", doi)
         
-        if not doi:
-            return [types.TextContent(type="text", text="Missing DOI")]
+        paper_info = await _sync(_paper_info_for_doi, doi)
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        if "error" in paper_info:
+            return [types.TextContent(type="text", text=f"DOI parsing failed: {paper_info['error']}")]
         
-        try:
-            logger.info(f"Processing DOI: {doi}")
-            
-            paper_info = zotero_connector._build_paper_info_from_doi(doi)
-            
-            if "error" in paper_info:
-                return [types.TextContent(type="text", text=f"DOI parsing failed: {paper_info['error']}")]
+        if not paper_info.get("title"):
+            return _text_response("Cannot extract paper title. DOI may be invalid or unsupported")
+        
+        result = await _sync(zotero_connector.save_item_to_zotero, paper_info, collection_key=collection_key)
+        
+        if result["success"]:
+            parts = ["Paper saved successfully!\n"]
+            parts.append(f"DOI: {doi}")
+            parts.append(f"Title: {paper_info.get('title', 'Unknown')}")
             
-            if not paper_info.get("title"):
-                return [types.TextContent(type="text", text="Cannot extract paper title. DOI may be invalid or unsupported")]
+            if paper_info.get('authors'):
+                parts.append(f"Authors: {paper_info['authors']}")
             
-            result = zotero_connector.save_item_to_zotero(paper_info, collection_key=collection_key)
+            if paper_info.get('date'):
+                parts.append(f"Date: {paper_info['date']}")
             
-            if result["success"]:
-                message = f"Paper saved successfully!\n\n"
-                message += f"DOI: {doi}\n"
-                message += f"Title: {paper_info.get('title', 'Unknown')}\n"
-                
-                if paper_info.get('authors'):
-                    message += f"Authors: {paper_info['authors']}\n"
-                
-                if paper_info.get('date'):
-                    message += f"Date: {paper_info['date']}\n"
-                
-                if collection_key:
-                    collection_moved = result.get("details", {}).get("collection_moved", False)
-                    if collection_moved:
-                        message += f"Collection: Moved to specified collection\n"
-                    else:
-                        message += f"Collection: Move failed, item in default location\n"
+            if collection_key:
+                collection_moved = result.get("details", {}).get("collection_moved", False)
+                if collection_moved:
+                    parts.append("Collection: Moved to specified collection")
                 else:
-                    message += f"Saved to: My Library\n"
-                
-                if paper_info.get('pdf_url'):
-                    message += f"PDF: {paper_info['pdf_url']}\n"
-                
-                message += f"\nTip: DOI is the most reliable paper identifier. Recommended!"
-                
+                    parts.append("Collection: Move failed, item in default location")
             else:
-                message = f"Save failed: {result.get('message', 'Unknown error')}\n\n"
-                message += f"Troubleshooting:\n"
-                message += f"  Ensure Zotero desktop app is running\n"
-                message += f"  Check network connection\n"
-                message += f"  Verify DOI is valid"
+                parts.append("Saved to: My Library")
             
-            return [types.TextContent(type="text", text=message)]
+            if paper_info.get('pdf_url'):
+                parts.append(f"PDF: {paper_info['pdf_url']}")
             
-        except Exception as e:
-            logger.error(f"Failed to save paper: {e}")
-            return [types.TextContent(type="text", text=f"Error saving paper: {e}")]
+            parts.append("\nTip: DOI is the most reliable paper identifier. Recommended!")
+            
+        else:
+            parts = [f"Save failed: {result.get('message', 'Unknown error')}\n"]
+            parts.append("Troubleshooting:")
+            parts.append("  Ensure Zotero desktop app is running")
+            parts.append("  Check network connection")
+            parts.append("  Verify DOI is valid")
+        
+        return [types.TextContent(type="text", text="\n".join(parts))]
+        
+    except Exception as e:
+        logger.error("Failed to save paper: %s", e)
+        return [types.TextContent(type="text", text=f"Error saving paper: {e}")]
+
+_CREATE_COLLECTION_TMPL = (
+    "Create Zotero Collection\n\n"
+    "Note: Due to Zotero API limitations, collections need to be created manually\n\n"
+    "Manual creation steps:\n"
+    "1. Open Zotero desktop app\n"
+    "2. Right-click on the collections panel on the left\n"
+    "3. Select 'New Collection'\n"
+    "4. Enter collection name: {name}\n"
+    "{parent_step}"
+    "6. Confirm creation\n\n"
+    "After creation:\n"
+    "  Use get_zotero_collections to get the new collection Key\n"
+    "  Use the Key in save_paper_to_zotero to specify target collection\n\n"
+    "Time: About 30 seconds for creation, long-term use!"
+)
+
+async def _tool_create_zotero_collection(arguments: dict) -> list[types.TextContent]:
+    """Explain how to create a collection by hand"""
+    collection_name = arguments.get("name", "").strip()
+    parent_key = arguments.get("parent_key", "").strip() or None
     
-    elif name == "create_zotero_collection":
-        collection_name = arguments.get("name", "").strip()
-        parent_key = arguments.get("parent_key", "").strip() or None
+    if not collection_name:
+        return _text_response("Missing collection name")
+    
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    # The collection is created by hand next, so the next listing must be fresh
+    _collections_cache.invalidate()
+    
+    parent_step = "5. Optionally drag under parent collection\n" if parent_key else ""
+    message = _CREATE_COLLECTION_TMPL.format(name=collection_name, parent_step=parent_step)
+    
+    return [types.TextContent(type="text", text=message)]
+
+async def _tool_extract_arxiv_metadata(arguments: dict) -> list[types.TextContent]:
+    """Show the metadata of an arXiv paper"""
+    arxiv_url = arguments.get("arxiv_url")
+    
+    if not arxiv_url:
+        return _text_response("Missing arXiv URL")
+    
+    if _ARXIV_HOST not in arxiv_url:
+        return _text_response("Invalid arXiv URL")
+    
+    try:
+        try:
+            metadata = await _sync(_arxiv_metadata, arxiv_url)
+        except ArxivMetadataError as e:
+            return [types.TextContent(type="text", text=f"Extraction failed: {e}")]
         
-        if not collection_name:
-            return [types.TextContent(type="text", text="Missing collection name")]
+        parts = [
+            "arXiv Paper Metadata",
+            "",
+            f"arXiv ID: {metadata.get('arxiv_id', 'Unknown')}",
+            f"Title: {metadata.get('title', 'Unknown')}",
+            f"Authors: {metadata.get('authors_string', 'Unknown')}",
+            f"Date: {metadata.get('date', 'Unknown')}",
+        ]
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        if metadata.get('comment'):
+            parts.append(f"Comment: {metadata['comment']}")
         
-        message = f"Create Zotero Collection\n\n"
-        message += f"Note: Due to Zotero API limitations, collections need to be created manually\n\n"
-        message += f"Manual creation steps:\n"
-        message += f"1. Open Zotero desktop app\n"
-        message += f"2. Right-click on the collections panel on the left\n"
-        message += f"3. Select 'New Collection'\n"
-        message += f"4. Enter collection name: {collection_name}\n"
+        if metadata.get('subjects'):
+            subjects_str = ', '.join(islice(metadata['subjects'], 3))
+            parts.append(f"Subjects: {subjects_str}")
         
-        if parent_key:
-            message += f"5. Optionally drag under parent collection\n"
+        if metadata.get('doi'):
+            parts.append(f"DOI: {metadata['doi']}")
         
-        message += f"6. Confirm creation\n\n"
-        message += f"After creation:\n"
-        message += f"  Use get_zotero_collections to get the new collection Key\n"
-        message += f"  Use the Key in save_paper_to_zotero to specify target collection\n\n"
-        message += f"Time: About 30 seconds for creation, long-term use!"
+        parts.append(f"PDF: {metadata.get('pdf_url', 'Unknown')}")
         
-        return [types.TextContent(type="text", text=message)]
-    
-    elif name == "extract_arxiv_metadata":
-        arxiv_url = arguments.get("arxiv_url")
+        if metadata.get('abstract'):
+            parts.extend(("", "Abstract Preview:", _preview(metadata['abstract'], 200)))
         
-        if not arxiv_url:
-            return [types.TextContent(type="text", text="Missing arXiv URL")]
+        parts.extend(("", "Next: Use save_paper_to_zotero to save to your library"))
         
-        if 'arxiv.org' not in arxiv_url:
-            return [types.TextContent(type="text", text="Invalid arXiv URL")]
+        return [types.TextContent(type="text", text="\n".join(parts))]
         
-        try:
-            metadata = zotero_connector._extract_arxiv_metadata(arxiv_url)
-            
-            if 'error' in metadata:
-                return [types.TextContent(type="text", text=f"Extraction failed: {metadata['error']}")]
-            
-            message = f"arXiv Paper Metadata\n\n"
-            message += f"arXiv ID: {metadata.get('arxiv_id', 'Unknown')}\n"
-            message += f"Title: {metadata.get('title', 'Unknown')}\n"
-            message += f"Authors: {metadata.get('authors_string', 'Unknown')}\n"
-            message += f"Date: {metadata.get('date', 'Unknown')}\n"
-            
-            if metadata.get('comment'):
-                message += f"Comment: {metadata['comment']}\n"
-            
-            if metadata.get('subjects'):
-                subjects_str = ', '.join(metadata['subjects'][:3])
-                message += f"Subjects: {subjects_str}\n"
-            
-            if metadata.get('doi'):
-                message += f"DOI: {metadata['doi']}\n"
-            
-            message += f"PDF: {metadata.get('pdf_url', 'Unknown')}\n"
-            
-            if metadata.get('abstract'):
-                abstract_preview = metadata['abstract'][:200] + "..." if len(metadata['abstract']) > 200 else metadata['abstract']
-                message += f"\nAbstract Preview:\n{abstract_preview}\n"
-            
-            message += f"\nNext: Use save_paper_to_zotero to save to your library"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to extract arXiv metadata: {e}")
-            return [types.TextContent(type="text", text=f"Error extracting metadata: {e}")]
+    except Exception as e:
+        logger.error("Failed to extract arXiv metadata: %s", e)
+        return [types.TextContent(type="text", text=f"Error extracting metadata: {e}")]
+
+def _library_item_details(item: dict) -> str:
+    """Counts and leading tags appended to an item's row in get_library_items"""
+    attachment_count = item.get('attachment_count', 0)
+    note_count = item.get('note_count', 0)
+    tag_count = item.get('tag_count', 0)
+    tags = item.get('tags', [])
     
-    elif name == "get_library_items":
-        limit = arguments.get("limit", 50)
-        offset = arguments.get("offset", 0)
-        include_details = arguments.get("include_details", False)
+    details_parts = []
+    if attachment_count > 0:
+        details_parts.append(f"{attachment_count} attachments")
+    if note_count > 0:
+        details_parts.append(f"{note_count} notes")
+    if tag_count > 0:
+        details_parts.append(f"{tag_count} tags")
+    
+    suffix = f" | {', '.join(details_parts)}" if details_parts else ""
+    if tags:
+        more = f" +{tag_count - 5} more" if tag_count > 5 else ""
+        suffix = f"{suffix}\n   Tags: {', '.join(islice(tags, 5))}{more}"
+    return suffix
+
+async def _tool_get_library_items(arguments: dict) -> list[types.TextContent]:
+    """List items in the library"""
+    limit = arguments.get("limit", 50)
+    offset = arguments.get("offset", 0)
+    include_details = arguments.get("include_details", False)
+    
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    try:
+        result = await _sync(zotero_connector.get_library_items, limit=limit, offset=offset, include_details=include_details)
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        if not result.get("success"):
+            return [types.TextContent(type="text", text=f"Error: {result.get('error', 'Unknown error')}")]
         
-        try:
-            result = zotero_connector.get_library_items(limit=limit, offset=offset, include_details=include_details)
-            
-            if not result.get("success"):
-                return [types.TextContent(type="text", text=f"Error: {result.get('error', 'Unknown error')}")]
-            
-            items = result.get("items", [])
-            
-            if not items:
-                message = "Your library is empty or no more items\n\n"
-                message += "Use save_paper_to_zotero to add papers!"
-                return [types.TextContent(type="text", text=message)]
-            
-            message = f"Zotero Library Items (showing {len(items)} items)\n\n"
-            
-            for i, item in enumerate(items, 1):
-                title = item.get('title', 'Untitled')
-                item_type = item.get('itemType', 'Unknown')
-                date_added = item.get('dateAdded', 'No date')[:10] if item.get('dateAdded') else 'No date'
-                key = item.get('itemKey', 'No key')
-                
-                message += f"{i}. {title}\n"
-                message += f"   Type: {item_type} | Added: {date_added}\n"
-                message += f"   Key: {key}"
-                
-                if include_details:
-                    attachment_count = item.get('attachment_count', 0)
-                    note_count = item.get('note_count', 0)
-                    tag_count = item.get('tag_count', 0)
-                    tags = item.get('tags', [])
-                    
-                    details_parts = []
-                    if attachment_count > 0:
-                        details_parts.append(f"{attachment_count} attachments")
-                    if note_count > 0:
-                        details_parts.append(f"{note_count} notes")
-                    if tag_count > 0:
-                        details_parts.append(f"{tag_count} tags")
-                    
-                    if details_parts:
-                        message += f" | {', '.join(details_parts)}"
-                    
-                    if tags:
-                        message += f"\n   Tags: {', '.join(tags[:5])}"
-                        if tag_count > 5:
-                            message += f" +{tag_count - 5} more"
-                
-                message += "\n\n"
-            
-            message += f"Use get_zotero_item with a specific key for full details"
-            
+        items = result.get("items", [])
+        
+        if not items:
+            message = "Your library is empty or no more items\n\nUse save_paper_to_zotero to add papers!"
             return [types.TextContent(type="text", text=message)]
+        
+        rows = [f"Zotero Library Items (showing {len(items)} items)"]
+        
+        for i, item in enumerate(items, 1):
+            title, item_type, date_added, key = (
+                item.get('title', 'Untitled'), item.get('itemType', 'Unknown'),
+                item.get('dateAdded'), item.get('itemKey', 'No key'),
+            )
+            date_added = date_added[:10] if date_added else 'No date'
             
-        except Exception as e:
-            logger.error(f"Failed to get library items: {e}")
-            return [types.TextContent(type="text", text=f"Error getting library items: {e}")]
-    
-    elif name == "search_zotero_items":
-        query = arguments.get("query", "").strip()
+            row = f"{i}. {title}\n   Type: {item_type} | Added: {date_added}\n   Key: {key}"
+            if include_details:
+                row += _library_item_details(item)
+            rows.append(row)
         
-        if not query:
-            return [types.TextContent(type="text", text="Missing search query")]
+        rows.append("Use get_zotero_item with a specific key for full details")
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        return [types.TextContent(type="text", text="\n\n".join(rows))]
         
-        try:
-            results = zotero_connector.search_items(query)
-            
-            if not results:
-                message = f"No items found matching: {query}\n\n"
-                message += "Try different keywords or save new papers"
-                return [types.TextContent(type="text", text=message)]
-            
-            message = f"Search Results for '{query}' ({len(results)} items)\n\n"
-            
-            for i, item in enumerate(results, 1):
-                title = item.get('title', 'Untitled')
-                item_type = item.get('itemType', 'Unknown')
-                key = item.get('key', 'No key')
-                
-                message += f"{i}. {title}\n"
-                message += f"   Type: {item_type} | Key: {key}\n\n"
-            
-            message += f"Use get_zotero_item with a specific key for details"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to search items: {e}")
-            return [types.TextContent(type="text", text=f"Error searching items: {e}")]
+    except Exception as e:
+        logger.error("Failed to get library items: %s", e)
+        return [types.TextContent(type="text", text=f"Error getting library items: {e}")]
+
+async def _tool_search_zotero_items(arguments: dict) -> list[types.TextContent]:
+    """Search library items by title"""
+    query = arguments.get("query", "").strip()
+    
+    if not query:
+        return _text_response("Missing search query")
     
-    elif name == "get_zotero_item":
-        item_key = arguments.get("item_key", "").strip()
-        include_attachments = arguments.get("include_attachments", True)
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    try:
+        results = await _sync(zotero_connector.search_items, query)
         
-        if not item_key:
-            return [types.TextContent(type="text", text="Missing item key")]
+        if not results:
+            message = f"No items found matching: {query}\n\nTry different keywords or save new papers"
+            return [types.TextContent(type="text", text=message)]
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        parts = [f"Search Results for '{query}' ({len(results)} items)", ""]
         
-        try:
-            result = zotero_connector.get_item(item_key, include_attachments=include_attachments)
-            
-            if not result.get("success"):
-                return [types.TextContent(type="text", text=f"Item not found: {item_key}")]
-            
-            item = result.get("item", {})
-            
+        for i, item in enumerate(results, 1):
             title = item.get('title', 'Untitled')
             item_type = item.get('itemType', 'Unknown')
-            date = item.get('date', 'No date')
-            url = item.get('url', 'No URL')
-            abstract = item.get('abstractNote', 'No abstract')
-            creators = item.get('creators', [])
-            attachments = item.get('attachments', [])
-            notes = item.get('notes', [])
-            tags = item.get('tags', [])
+            key = item.get('key', 'No key')
             
-            message = f"Zotero Item Details\n\n"
-            message += f"Title: {title}\n"
-            message += f"Type: {item_type}\n"
-            message += f"Date: {date}\n"
-            message += f"URL: {url}\n"
-            
-            if creators:
-                authors = []
-                for c in creators:
-                    name = c.get('firstName', '') + ' ' + c.get('lastName', '')
-                    if name.strip():
-                        authors.append(name.strip())
-                if authors:
-                    message += f"Authors: {', '.join(authors)}\n"
-            
-            if abstract and abstract != 'No abstract':
-                abstract_preview = abstract[:500] + "..." if len(abstract) > 500 else abstract
-                message += f"\nAbstract:\n{abstract_preview}\n"
-            
-            if include_attachments:
-                if attachments:
-                    message += f"\nAttachments ({len(attachments)}):\n"
-                    for att in attachments[:5]:
-                        filename = att.get('filename', 'Unknown')
-                        content_type = att.get('contentType', 'Unknown')
-                        message += f"  - {filename} ({content_type})\n"
-                    if len(attachments) > 5:
-                        message += f"  ... and {len(attachments) - 5} more\n"
-                
-                if notes:
-                    message += f"\nNotes ({len(notes)}):\n"
-                    for note in notes[:3]:
-                        note_text = note.get('note', '')[:100]
-                        message += f"  - {note_text}...\n"
-                    if len(notes) > 3:
-                        message += f"  ... and {len(notes) - 3} more\n"
-                
-                if tags:
-                    message += f"\nTags: {', '.join(tags)}\n"
-            
-            message += f"\nKey: {item_key}"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to get item: {e}")
-            return [types.TextContent(type="text", text=f"Error getting item: {e}")]
+            parts.extend((f"{i}. {title}", f"   Type: {item_type} | Key: {key}", ""))
+        
+        parts.append("Use get_zotero_item with a specific key for details")
+        
+        return [types.TextContent(type="text", text="\n".join(parts))]
+        
+    except Exception as e:
+        logger.error("Failed to search items: %s", e)
+        return [types.TextContent(type="text", text=f"Error searching items: {e}")]
+
+async def _tool_get_zotero_item(arguments: dict) -> list[types.TextContent]:
+    """Show one item with its attachments, notes and tags"""
+    item_key = arguments.get("item_key", "").strip()
+    include_attachments = arguments.get("include_attachments", True)
+    
+    if not item_key:
+        return _text_response("Missing item key")
     
-    elif name == "update_zotero_item":
-        item_key = arguments.get("item_key", "").strip()
-        title = arguments.get("title", "").strip() or None
-        abstract = arguments.get("abstract", "").strip() or None
-        date = arguments.get("date", "").strip() or None
-        url = arguments.get("url", "").strip() or None
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    try:
+        result = await _sync(zotero_connector.get_item, item_key, include_attachments=include_attachments)
         
-        if not item_key:
-            return [types.TextContent(type="text", text="Missing item key")]
+        if not result.get("success"):
+            return [types.TextContent(type="text", text=f"Item not found: {item_key}")]
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        item = result.get("item", {})
         
-        try:
-            updates = {}
-            if title: updates['title'] = title
-            if abstract: updates['abstractNote'] = abstract
-            if date: updates['date'] = date
-            if url: updates['url'] = url
-            
-            if not updates:
-                return [types.TextContent(type="text", text="No updates specified")]
-            
-            success = zotero_connector.update_item(item_key, updates)
-            
-            if success:
-                message = f"Item updated successfully!\n\n"
-                message += f"Key: {item_key}\n"
-                if title: message += f"New title: {title}\n"
-                if abstract: message += f"New abstract: Set\n"
-                if date: message += f"New date: {date}\n"
-                if url: message += f"New URL: {url}\n"
-                message += f"\nCheck Zotero to verify changes"
-            else:
-                message = f"Update failed for item: {item_key}\n\n"
-                message += f"Possible causes:\n"
-                message += f"  Item may not exist\n"
-                message += f"  Network error\n"
-                message += f"  Zotero sync in progress"
+        get = item.get
+        title, item_type, date, url, abstract = (
+            get('title', 'Untitled'), get('itemType', 'Unknown'), get('date', 'No date'),
+            get('url', 'No URL'), get('abstractNote', 'No abstract'),
+        )
+        creators, attachments, notes, tags = get('creators', []), get('attachments', []), get('notes', []), get('tags', [])
+        
+        parts = [
+            "Zotero Item Details",
+            "",
+            f"Title: {title}",
+            f"Type: {item_type}",
+            f"Date: {date}",
+            f"URL: {url}",
+        ]
+        
+        if creators:
+            authors = []
+            for c in creators:
+                name = f"{c.get('firstName', '')} {c.get('lastName', '')}"
+                if name.strip():
+                    authors.append(name.strip())
+            if authors:
+                parts.append(f"Authors: {', '.join(authors)}")
+        
+        if abstract and abstract != 'No abstract':
+            abstract_preview = _preview(abstract, 500)
+            parts.extend(("", "Abstract:", abstract_preview))
+        
+        if include_attachments:
+            if attachments:
+                parts.extend(("", f"Attachments ({len(attachments)}):"))
+                parts.extend(
+                    f"  - {att.get('filename', 'Unknown')} ({att.get('contentType', 'Unknown')})"
+                    for att in islice(attachments, 5)
+                )
+                if len(attachments) > 5:
+                    parts.append(f"  ... and {len(attachments) - 5} more")
             
-            return [types.TextContent(type="text", text=message)]
+            if notes:
+                parts.extend(("", f"Notes ({len(notes)}):"))
+                parts.extend(f"  - {note.get('note', '')[:100]}..." for note in islice(notes, 3))
+                if len(notes) > 3:
+                    parts.append(f"  ... and {len(notes) - 3} more")
             
-        except Exception as e:
-            logger.error(f"Failed to update item: {e}")
-            return [types.TextContent(type="text", text=f"Error updating item: {e}")]
+            if tags:
+                parts.extend(("", f"Tags: {', '.join(tags)}"))
+        
+        parts.extend(("", f"Key: {item_key}"))
+        
+        return [types.TextContent(type="text", text="\n".join(parts))]
+        
+    except Exception as e:
+        logger.error("Failed to get item: %s", e)
+        return [types.TextContent(type="text", text=f"Error getting item: {e}")]
+
+# Fixed explanations appended to failed write and PDF tools
+_CAUSES_ITEM_WRITE = (
+    "Possible causes:\n"
+    "  Item may not exist\n"
+    "  Network error"
+)
+_CAUSES_ITEM_UPDATE = f"{_CAUSES_ITEM_WRITE}\n  Zotero sync in progress"
+_CAUSES_ITEM_MOVE = (
+    "Possible causes:\n"
+    "  Item or collection may not exist\n"
+    "  Network error\n"
+    "  Use get_zotero_collections to verify keys"
+)
+_CAUSES_NO_OPEN_PDF = (
+    "Possible causes:\n"
+    "  Paper is behind paywall\n"
+    "  arXiv PDF not yet available\n"
+    "  Publisher doesn't provide open access\n\n"
+    "Suggestions:\n"
+    "  Try alternative source: arXiv, PubMed, etc.\n"
+    "  Check if PDF is available on publisher website"
+)
+
+async def _tool_update_zotero_item(arguments: dict) -> list[types.TextContent]:
+    """Update fields of an item"""
+    item_key = arguments.get("item_key", "").strip()
+    title = arguments.get("title", "").strip() or None
+    abstract = arguments.get("abstract", "").strip() or None
+    date = arguments.get("date", "").strip() or None
+    url = arguments.get("url", "").strip() or None
+    
+    if not item_key:
+        return _text_response("Missing item key")
     
-    elif name == "update_zotero_item_tags":
-        item_key = arguments.get("item_key", "").strip()
-        tags = arguments.get("tags", [])
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    try:
+        updates = {}
+        if title: updates['title'] = title
+        if abstract: updates['abstractNote'] = abstract
+        if date: updates['date'] = date
+        if url: updates['url'] = url
         
-        if not item_key:
-            return [types.TextContent(type="text", text="Missing item key")]
+        if not updates:
+            return _text_response("No updates specified")
         
-        if not tags:
-            return [types.TextContent(type="text", text="No tags specified")]
+        success = await _sync(zotero_connector.update_item, item_key, updates)
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        if success:
+            message = "Item updated successfully!\n\n"
+            message += f"Key: {item_key}\n"
+            if title: message += f"New title: {title}\n"
+            if abstract: message += "New abstract: Set\n"
+            if date: message += f"New date: {date}\n"
+            if url: message += f"New URL: {url}\n"
+            message += "\nCheck Zotero to verify changes"
+        else:
+            message = f"Update failed for item: {item_key}\n\n{_CAUSES_ITEM_UPDATE}"
         
-        try:
-            success = zotero_connector.update_item_tags(item_key, tags)
-            
-            if success:
-                message = f"Tags updated successfully!\n\n"
-                message += f"Item Key: {item_key}\n"
-                message += f"New Tags: {', '.join(tags)}\n"
-            else:
-                message = f"Failed to update tags for: {item_key}\n\n"
-                message += f"Possible causes:\n"
-                message += f"  Item may not exist\n"
-                message += f"  Network error"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to update tags: {e}")
-            return [types.TextContent(type="text", text=f"Error updating tags: {e}")]
+        return [types.TextContent(type="text", text=message)]
+        
+    except Exception as e:
+        logger.error("Failed to update item: %s", e)
+        return [types.TextContent(type="text", text=f"Error updating item: {e}")]
+
+async def _tool_update_zotero_item_tags(arguments: dict) -> list[types.TextContent]:
+    """Replace the tags of an item"""
+    item_key = arguments.get("item_key", "").strip()
+    tags = arguments.get("tags", [])
+    
+    if not item_key:
+        return _text_response("Missing item key")
+    
+    if not tags:
+        return _text_response("No tags specified")
     
-    elif name == "delete_zotero_item":
-        item_key = arguments.get("item_key", "").strip()
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    try:
+        success = await _sync(zotero_connector.update_item_tags, item_key, tags)
         
-        if not item_key:
-            return [types.TextContent(type="text", text="Missing item key")]
+        if success:
+            message = "Tags updated successfully!\n\n"
+            message += f"Item Key: {item_key}\n"
+            message += f"New Tags: {', '.join(tags)}\n"
+        else:
+            message = f"Failed to update tags for: {item_key}\n\n{_CAUSES_ITEM_WRITE}"
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        return [types.TextContent(type="text", text=message)]
         
-        try:
-            success = zotero_connector.delete_item(item_key)
-            
-            if success:
-                message = f"Item deleted successfully!\n\n"
-                message += f"Key: {item_key}\n"
-                message += f"\nNote: This action cannot be undone"
-            else:
-                message = f"Failed to delete item: {item_key}\n\n"
-                message += f"Possible causes:\n"
-                message += f"  Item may not exist\n"
-                message += f"  Network error"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to delete item: {e}")
-            return [types.TextContent(type="text", text=f"Error deleting item: {e}")]
+    except Exception as e:
+        logger.error("Failed to update tags: %s", e)
+        return [types.TextContent(type="text", text=f"Error updating tags: {e}")]
+
+async def _tool_delete_zotero_item(arguments: dict) -> list[types.TextContent]:
+    """Delete an item"""
+    item_key = arguments.get("item_key", "").strip()
+    
+    if not item_key:
+        return _text_response("Missing item key")
+    
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
     
-    elif name == "move_zotero_item":
-        item_key = arguments.get("item_key", "").strip()
-        collection_key = arguments.get("collection_key", "").strip()
+    try:
+        success = await _sync(zotero_connector.delete_item, item_key)
         
-        if not item_key:
-            return [types.TextContent(type="text", text="Missing item key")]
+        if success:
+            message = "Item deleted successfully!\n\n"
+            message += f"Key: {item_key}\n"
+            message += "\nNote: This action cannot be undone"
+        else:
+            message = f"Failed to delete item: {item_key}\n\n{_CAUSES_ITEM_WRITE}"
         
-        if not collection_key:
-            return [types.TextContent(type="text", text="Missing collection key")]
+        return [types.TextContent(type="text", text=message)]
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+    except Exception as e:
+        logger.error("Failed to delete item: %s", e)
+        return [types.TextContent(type="text", text=f"Error deleting item: {e}")]
+
+async def _tool_move_zotero_item(arguments: dict) -> list[types.TextContent]:
+    """Add an item to a collection"""
+    item_key = arguments.get("item_key", "").strip()
+    collection_key = arguments.get("collection_key", "").strip()
+    
+    if not item_key:
+        return _text_response("Missing item key")
+    
+    if not collection_key:
+        return _text_response("Missing collection key")
+    
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    try:
+        success = await _sync(zotero_connector.move_item_to_collection, item_key, collection_key)
+        _collections_cache.invalidate()
         
-        try:
-            success = zotero_connector.move_item_to_collection(item_key, collection_key)
-            
-            if success:
-                message = f"Item moved successfully!\n\n"
-                message += f"Item Key: {item_key}\n"
-                message += f"Collection Key: {collection_key}\n"
-            else:
-                message = f"Failed to move item: {item_key}\n\n"
-                message += f"Possible causes:\n"
-                message += f"  Item or collection may not exist\n"
-                message += f"  Network error\n"
-                message += f"  Use get_zotero_collections to verify keys"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to move item: {e}")
-            return [types.TextContent(type="text", text=f"Error moving item: {e}")]
+        if success:
+            message = "Item moved successfully!\n\n"
+            message += f"Item Key: {item_key}\n"
+            message += f"Collection Key: {collection_key}\n"
+        else:
+            message = f"Failed to move item: {item_key}\n\n{_CAUSES_ITEM_MOVE}"
+        
+        return [types.TextContent(type="text", text=message)]
+        
+    except Exception as e:
+        logger.error("Failed to move item: %s", e)
+        return [types.TextContent(type="text", text=f"Error moving item: {e}")]
+
+async def _tool_search_arxiv_api(arguments: dict) -> list[types.TextContent]:
+    """Search arXiv"""
+    query = arguments.get("query", "").strip()
+    max_results = arguments.get("max_results", 5)
+    
+    if not query:
+        return _text_response("Missing search query")
     
-    elif name == "search_arxiv_api":
-        query = arguments.get("query", "").strip()
-        max_results = arguments.get("max_results", 5)
+    try:
+        if max_results > 50:
+            max_results = 50
+        elif max_results < 1:
+            max_results = 1
         
-        if not query:
-            return [types.TextContent(type="text", text="Missing search query")]
+        results = await _sync(zotero_connector.search_arxiv, query, max_results=max_results)
         
-        try:
-            if max_results > 50:
-                max_results = 50
-            elif max_results < 1:
-                max_results = 1
-            
-            results = zotero_connector.search_arxiv(query, max_results=max_results)
-            
-            if not results:
-                message = f"No results found for: {query}\n\n"
-                message += f"Try different search terms"
-                return [types.TextContent(type="text", text=message)]
-            
-            message = f"arXiv Search Results for '{query}' ({len(results)} items)\n\n"
-            
-            for i, paper in enumerate(results, 1):
-                title = paper.get('title', 'Untitled')
-                arxiv_id = paper.get('id', 'Unknown')
-                date = paper.get('published', 'Unknown date')
-                authors = paper.get('authors', [])
-                
-                message += f"{i}. {title}\n"
-                message += f"   ID: {arxiv_id}\n"
-                message += f"   Date: {date}\n"
-                if authors:
-                    author_names = [a.get('name', '') for a in authors[:3]]
-                    message += f"   Authors: {', '.join(author_names)}\n"
-                message += f"   Link: https://arxiv.org/abs/{arxiv_id}\n\n"
-            
-            message += f"Use save_paper_to_zotero with the arXiv URL to save papers"
-            
+        if not results:
+            message = f"No results found for: {query}\n\nTry different search terms"
             return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to search arXiv: {e}")
-            return [types.TextContent(type="text", text=f"Error searching arXiv: {e}")]
+        
+        parts = [f"arXiv Search Results for '{query}' ({len(results)} items)", ""]
+        
+        for i, paper in enumerate(results, 1):
+            title = paper.get('title', 'Untitled')
+            arxiv_id = paper.get('id', 'Unknown')
+            date = paper.get('published', 'Unknown date')
+            authors = paper.get('authors', [])
+            
+            parts.append(f"{i}. {title}")
+            parts.append(f"   ID: {arxiv_id}")
+            parts.append(f"   Date: {date}")
+            if authors:
+                author_names = [a.get('name', '') for a in islice(authors, 3)]
+                parts.append(f"   Authors: {', '.join(author_names)}")
+            parts.extend((f"   Link: https://arxiv.org/abs/{arxiv_id}", ""))
+        
+        parts.append("Use save_paper_to_zotero with the arXiv URL to save papers")
+        
+        return [types.TextContent(type="text", text="\n".join(parts))]
+        
+    except Exception as e:
+        logger.error("Failed to search arXiv: %s", e)
+        return [types.TextContent(type="text", text=f"Error searching arXiv: {e}")]
+
+# Fields the validators compare with arXiv: (field, clean, compare_as, only when set in Zotero)
+_ARXIV_DIFF_FIELDS = (
+    ("title", lambda value: value.strip().replace('\n', ' '), str.casefold, False),
+    ("date", lambda value: value, lambda value: value, True),
+)
+
+def _arxiv_field_diffs(item: dict, metadata: dict) -> dict[str, tuple[str, str]]:
+    """Fields where the Zotero item and arXiv disagree, as field -> (Zotero value, arXiv value)"""
+    diffs = {}
+    for field, clean, compare_as, only_if_set in _ARXIV_DIFF_FIELDS:
+        current = clean(item.get(field, ''))
+        latest = clean(metadata.get(field, ''))
+        if only_if_set and not current:
+            continue
+        if compare_as(current) != compare_as(latest):
+            diffs[field] = (current, latest)
+    return diffs
+
+async def _tool_validate_zotero_item(arguments: dict) -> list[types.TextContent]:
+    """Compare an item with its arXiv metadata"""
+    item_key = arguments.get("item_key", "").strip()
+    
+    if not item_key:
+        return _text_response("Missing item key")
     
-    elif name == "validate_zotero_item":
-        item_key = arguments.get("item_key", "").strip()
+    # The item read overlaps the liveness probe; the arXiv request needs the item's DOI
+    item_task = _prefetch(_sync(zotero_connector.get_item, item_key))
+    
+    if not await _is_running_cached():
+        item_task.cancel()
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    try:
+        item = await item_task
+        
+        if not item:
+            return [types.TextContent(type="text", text=f"Item not found: {item_key}")]
         
-        if not item_key:
-            return [types.TextContent(type="text", text="Missing item key")]
+        doi = item.get('DOI', '')
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        if not doi or doi[:len(_ARXIV_DOI_PREFIX)].lower() != _ARXIV_DOI_PREFIX:
+            return [types.TextContent(type="text", text=f"Item {item_key} does not have an arXiv DOI. Validation requires arXiv papers.")]
+        
+        arxiv_id = doi[len(_ARXIV_DOI_PREFIX):]
         
         try:
-            item = zotero_connector.get_item(item_key)
-            
-            if not item:
-                return [types.TextContent(type="text", text=f"Item not found: {item_key}")]
-            
-            doi = item.get('DOI', '')
-            
-            if not doi or 'arxiv' not in doi.lower():
-                return [types.TextContent(type="text", text=f"Item {item_key} does not have an arXiv DOI. Validation requires arXiv papers.")]
-            
-            arxiv_id = doi.replace('10.48550/arXiv.', '')
-            
-            metadata = zotero_connector._extract_arxiv_metadata(f"https://arxiv.org/abs/{arxiv_id}")
-            
-            if 'error' in metadata:
-                return [types.TextContent(type="text", text=f"Failed to fetch arXiv metadata: {metadata['error']}")]
-            
-            differences = []
-            
-            zotero_title = item.get('title', '').strip()
-            arxiv_title = metadata.get('title', '').strip().replace('\n', ' ')
-            
-            if zotero_title.lower() != arxiv_title.lower():
-                differences.append(f"Title:\n  Zotero: {zotero_title}\n  arXiv: {arxiv_title}\n")
-            
-            zotero_date = item.get('date', '')
-            arxiv_date = metadata.get('date', '')
-            
-            if zotero_date and zotero_date != arxiv_date:
-                differences.append(f"Date:\n  Zotero: {zotero_date}\n  arXiv: {arxiv_date}\n")
-            
-            message = f"Validation Results for {item_key}\n\n"
-            message += f"DOI: {doi}\n"
-            message += f"arXiv ID: {arxiv_id}\n\n"
-            
-            if differences:
-                message += f"Found {len(differences)} difference(s):\n\n"
-                for diff in differences:
-                    message += f"{diff}\n"
-                message += f"Use validate_and_update_item to automatically update"
-            else:
-                message += f"No differences found. Metadata matches arXiv!"
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to validate item: {e}")
-            return [types.TextContent(type="text", text=f"Error validating item: {e}")]
+            metadata = await _sync(_arxiv_metadata, f"https://arxiv.org/abs/{arxiv_id}")
+        except ArxivMetadataError as e:
+            return [types.TextContent(type="text", text=f"Failed to fetch arXiv metadata: {e}")]
+        
+        differences = [
+            f"{field.capitalize()}:\n  Zotero: {current}\n  arXiv: {latest}"
+            for field, (current, latest) in _arxiv_field_diffs(item, metadata).items()
+        ]
+        
+        parts = [f"Validation Results for {item_key}", "", f"DOI: {doi}", f"arXiv ID: {arxiv_id}", ""]
+        
+        if differences:
+            parts.extend((f"Found {len(differences)} difference(s):", ""))
+            for diff in differences:
+                parts.extend((diff, ""))
+            parts.append("Use validate_and_update_item to automatically update")
+        else:
+            parts.append("No differences found. Metadata matches arXiv!")
+        
+        return [types.TextContent(type="text", text="\n".join(parts))]
+        
+    except Exception as e:
+        logger.error("Failed to validate item: %s", e)
+        return [types.TextContent(type="text", text=f"Error validating item: {e}")]
+
+async def _tool_validate_and_update_item(arguments: dict) -> list[types.TextContent]:
+    """Compare an item with arXiv and apply the differences"""
+    item_key = arguments.get("item_key", "").strip()
+    apply_updates = arguments.get("apply_updates", False)
+    
+    if not item_key:
+        return _text_response("Missing item key")
     
-    elif name == "validate_and_update_item":
-        item_key = arguments.get("item_key", "").strip()
-        apply_updates = arguments.get("apply_updates", False)
+    # The item read overlaps the liveness probe; the arXiv request needs the item's DOI
+    item_task = _prefetch(_sync(zotero_connector.get_item, item_key))
+    
+    if not await _is_running_cached():
+        item_task.cancel()
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    try:
+        item = await item_task
+        
+        if not item:
+            return [types.TextContent(type="text", text=f"Item not found: {item_key}")]
         
-        if not item_key:
-            return [types.TextContent(type="text", text="Missing item key")]
+        doi = item.get('DOI', '')
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        if not doi or doi[:len(_ARXIV_DOI_PREFIX)].lower() != _ARXIV_DOI_PREFIX:
+            return [types.TextContent(type="text", text=f"Item {item_key} does not have an arXiv DOI. Validation requires arXiv papers.")]
+        
+        arxiv_id = doi[len(_ARXIV_DOI_PREFIX):]
         
         try:
-            item = zotero_connector.get_item(item_key)
-            
-            if not item:
-                return [types.TextContent(type="text", text=f"Item not found: {item_key}")]
-            
-            doi = item.get('DOI', '')
-            
-            if not doi or 'arxiv' not in doi.lower():
-                return [types.TextContent(type="text", text=f"Item {item_key} does not have an arXiv DOI. Validation requires arXiv papers.")]
-            
-            arxiv_id = doi.replace('10.48550/arXiv.', '')
-            
-            metadata = zotero_connector._extract_arxiv_metadata(f"https://arxiv.org/abs/{arxiv_id}")
-            
-            if 'error' in metadata:
-                return [types.TextContent(type="text", text=f"Failed to fetch arXiv metadata: {metadata['error']}")]
-            
-            updates = {}
-            zotero_title = item.get('title', '').strip()
-            arxiv_title = metadata.get('title', '').strip().replace('\n', ' ')
-            
-            if zotero_title.lower() != arxiv_title.lower():
-                updates['title'] = arxiv_title
-            
-            zotero_date = item.get('date', '')
-            arxiv_date = metadata.get('date', '')
-            
-            if zotero_date and zotero_date != arxiv_date:
-                updates['date'] = arxiv_date
-            
-            message = f"Validation Results for {item_key}\n\n"
-            message += f"DOI: {doi}\n"
-            message += f"arXiv ID: {arxiv_id}\n\n"
-            
-            if not updates:
-                message += f"No updates needed. Metadata matches arXiv!"
-                if apply_updates:
-                    message += f"\nNothing to update."
-                return [types.TextContent(type="text", text=message)]
-            
+            metadata = await _sync(_arxiv_metadata, f"https://arxiv.org/abs/{arxiv_id}")
+        except ArxivMetadataError as e:
+            return [types.TextContent(type="text", text=f"Failed to fetch arXiv metadata: {e}")]
+        
+        diffs = _arxiv_field_diffs(item, metadata)
+        updates = {field: latest for field, (_, latest) in diffs.items()}
+        
+        parts = [f"Validation Results for {item_key}", "", f"DOI: {doi}", f"arXiv ID: {arxiv_id}", ""]
+        
+        if not updates:
+            parts.append("No updates needed. Metadata matches arXiv!")
             if apply_updates:
-                success = zotero_connector.update_item(item_key, updates)
-                
-                if success:
-                    message += f"Applied {len(updates)} update(s):\n\n"
-                    if 'title' in updates:
-                        message += f"Title: Updated to arXiv version\n"
-                    if 'date' in updates:
-                        message += f"Date: Updated to {arxiv_date}\n"
-                    message += f"\nZotero item updated successfully!"
-                else:
-                    message += f"Failed to apply updates to {item_key}"
-                
-                return [types.TextContent(type="text", text=message)]
-            else:
-                message += f"Found {len(updates)} update(s) available:\n\n"
+                parts.append("Nothing to update.")
+            return [types.TextContent(type="text", text="\n".join(parts))]
+        
+        if apply_updates:
+            success = await _sync(zotero_connector.update_item, item_key, updates)
+            
+            if success:
+                parts.extend((f"Applied {len(updates)} update(s):", ""))
                 if 'title' in updates:
-                    message += f"Title:\n  Current: {zotero_title}\n  arXiv: {arxiv_title}\n\n"
+                    parts.append("Title: Updated to arXiv version")
                 if 'date' in updates:
-                    message += f"Date:\n  Current: {zotero_date}\n  arXiv: {arxiv_date}\n\n"
-                message += f"Use apply_updates=true to apply these changes"
-                return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to validate and update item: {e}")
-            return [types.TextContent(type="text", text=f"Error: {e}")]
+                    parts.append(f"Date: Updated to {updates['date']}")
+                parts.extend(("", "Zotero item updated successfully!"))
+            else:
+                parts.append(f"Failed to apply updates to {item_key}")
+            
+            return [types.TextContent(type="text", text="\n".join(parts))]
+        else:
+            parts.extend((f"Found {len(updates)} update(s) available:", ""))
+            for field, (current, latest) in diffs.items():
+                parts.extend((f"{field.capitalize()}:", f"  Current: {current}", f"  arXiv: {latest}", ""))
+            parts.append("Use apply_updates=true to apply these changes")
+            return [types.TextContent(type="text", text="\n".join(parts))]
+        
+    except Exception as e:
+        logger.error("Failed to validate and update item: %s", e)
+        return [types.TextContent(type="text", text=f"Error: {e}")]
+
+async def _tool_fetch_pdf(arguments: dict) -> list[types.TextContent]:
+    """Fetch a PDF for an item"""
+    item_key = arguments.get("item_key", "").strip()
+    source = arguments.get("source", "auto")
+    save_to_zotero = arguments.get("save_to_zotero", True)
+    
+    if not item_key:
+        return _text_response("Missing item key")
+    
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
     
-    elif name == "fetch_pdf":
-        item_key = arguments.get("item_key", "").strip()
-        source = arguments.get("source", "auto")
-        save_to_zotero = arguments.get("save_to_zotero", True)
+    try:
+        item = await _sync(zotero_connector.get_item, item_key)
         
-        if not item_key:
-            return [types.TextContent(type="text", text="Missing item key")]
+        if not item:
+            return [types.TextContent(type="text", text=f"Item not found: {item_key}")]
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+        title = item.get('title', 'Unknown')
+        parts = [f"Fetching PDF for: {title}", ""]
         
-        try:
-            item = zotero_connector.get_item(item_key)
-            
-            if not item:
-                return [types.TextContent(type="text", text=f"Item not found: {item_key}")]
+        pdf_result = await _sync(zotero_connector.fetch_pdf_for_item, item_key, source=source)
+        
+        if pdf_result.get("success"):
+            parts.append("PDF fetched successfully!")
+            parts.append(f"Source: {pdf_result.get('source', 'Unknown')}")
+            parts.append(f"Size: {pdf_result.get('size', 'Unknown')}")
+            
+            if pdf_result.get("saved_to_zotero"):
+                parts.append("Status: Saved to Zotero as attachment")
+            elif save_to_zotero:
+                parts.append("Status: Downloaded but not saved to Zotero")
+            else:
+                parts.append("Status: Downloaded only")
             
-            title = item.get('title', 'Unknown')
-            message = f"Fetching PDF for: {title}\n\n"
+            if pdf_result.get("file_path"):
+                parts.append(f"Path: {pdf_result['file_path']}")
             
-            pdf_result = zotero_connector.fetch_pdf_for_item(item_key, source=source)
+            parts.extend(("", "Tip: Check Zotero to view the PDF attachment"))
+        else:
+            error_msg = pdf_result.get("error", "Unknown error")
+            parts.extend((f"Failed to fetch PDF: {error_msg}", ""))
             
-            if pdf_result.get("success"):
-                message += f"PDF fetched successfully!\n"
-                message += f"Source: {pdf_result.get('source', 'Unknown')}\n"
-                message += f"Size: {pdf_result.get('size', 'Unknown')}\n"
-                
-                if pdf_result.get("saved_to_zotero"):
-                    message += f"Status: Saved to Zotero as attachment\n"
-                elif save_to_zotero:
-                    message += f"Status: Downloaded but not saved to Zotero\n"
-                else:
-                    message += f"Status: Downloaded only\n"
-                
-                if pdf_result.get("file_path"):
-                    message += f"Path: {pdf_result['file_path']}\n"
-                
-                message += f"\nTip: Check Zotero to view the PDF attachment"
+            if "open access" in error_msg.lower() or "arXiv" in error_msg:
+                parts.append(_CAUSES_NO_OPEN_PDF)
             else:
-                error_msg = pdf_result.get("error", "Unknown error")
-                message += f"Failed to fetch PDF: {error_msg}\n\n"
-                
-                if "open access" in error_msg.lower() or "arXiv" in error_msg:
-                    message += f"Possible causes:\n"
-                    message += f"  Paper is behind paywall\n"
-                    message += f"  arXiv PDF not yet available\n"
-                    message += f"  Publisher doesn't provide open access\n\n"
-                    message += f"Suggestions:\n"
-                    message += f"  Try alternative source: arXiv, PubMed, etc.\n"
-                    message += f"  Check if PDF is available on publisher website"
-                else:
-                    message += f"Network or server error. Try again later."
-            
-            return [types.TextContent(type="text", text=message)]
-            
-        except Exception as e:
-            logger.error(f"Failed to fetch PDF: {e}")
-            return [types.TextContent(type="text", text=f"Error fetching PDF: {e}")]
-    
-    elif name == "get_item_pdf_text":
-        item_key = arguments.get("item_key", "").strip()
+                parts.append("Network or server error. Try again later.")
         
-        if not item_key:
-            return [types.TextContent(type="text", text="Missing item key")]
+        return [types.TextContent(type="text", text="\n".join(parts))]
         
-        if not zotero_connector.is_running():
-            return [types.TextContent(type="text", text="Zotero unavailable. Please start Zotero desktop app")]
+    except Exception as e:
+        logger.error("Failed to fetch PDF: %s", e)
+        return [types.TextContent(type="text", text=f"Error fetching PDF: {e}")]
+
+# Hints appended to a failed get_item_pdf_text, chosen by the connector's error
+_ERR_NO_ITEM = (
+    "Possible causes:\n"
+    "  Item does not exist\n"
+    "  Item key is incorrect\n\n"
+    "Suggestions:\n"
+    "  Use get_library_items to list available items\n"
+    "  Copy the correct item key"
+)
+_ERR_NO_PDF = (
+    "Possible causes:\n"
+    "  Item has no PDF attachment\n"
+    "  PDF is stored remotely\n\n"
+    "Suggestions:\n"
+    "  Use fetch_pdf to download a PDF\n"
+    "  Check if PDF is synced locally"
+)
+_ERR_NOT_SYNCED = (
+    "PDF may not be synced locally.\n"
+    "Open Zotero and ensure the item is synced."
+)
+
+_PDF_OK_TMPL = (
+    "PDF Text Extracted\n\n"
+    "Item: {title}\n"
+    "Pages: {pages}\n"
+    "Characters: {chars:,}\n\n"
+    "Text Preview:\n"
+    "{preview}\n\n"
+    "Full text available for full-text search.\n"
+    "Use get_item_pdf_text to extract text from other items."
+)
+_PDF_NO_TEXT_TMPL = (
+    "PDF Text Extracted\n\n"
+    "Item: {title}\n"
+    "Pages: {pages}\n"
+    "Characters: {chars:,}\n\n"
+    "No text could be extracted from the PDF.\n"
+    "The PDF may be scanned images without OCR."
+)
+
+@functools.lru_cache(maxsize=32)
+def _pdf_text_reply(title: str, pages: int, chars: int, head: str) -> str:
+    """get_item_pdf_text reply; head is text[:2001], all the preview can use, so whole documents are not kept"""
+    fields = {"title": title, "pages": pages, "chars": chars}
+    if not head:
+        return _PDF_NO_TEXT_TMPL.format_map(fields)
+    fields["preview"] = _preview(head, 2000)
+    return _PDF_OK_TMPL.format_map(fields)
+
+async def _tool_get_item_pdf_text(arguments: dict) -> list[types.TextContent]:
+    """Extract the text of an item's PDF attachment"""
+    item_key = arguments.get("item_key", "").strip()
+    
+    if not item_key:
+        return _text_response("Missing item key")
+    
+    if not await _is_running_cached():
+        return _text_response("Zotero unavailable. Please start Zotero desktop app")
+    
+    try:
+        result = await _sync(zotero_connector.get_item_pdf_content, item_key)
         
-        try:
-            result = zotero_connector.get_item_pdf_content(item_key)
-            
-            if not result.get("success"):
-                error_msg = result.get("error", "Unknown error")
-                message = f"Failed to extract PDF text: {error_msg}\n\n"
-                
-                if "not found" in error_msg.lower():
-                    message += f"Possible causes:\n"
-                    message += f"  Item does not exist\n"
-                    message += f"  Item key is incorrect\n\n"
-                    message += f"Suggestions:\n"
-                    message += f"  Use get_library_items to list available items\n"
-                    message += f"  Copy the correct item key"
-                elif "no pdf" in error_msg.lower():
-                    message += f"Possible causes:\n"
-                    message += f"  Item has no PDF attachment\n"
-                    message += f"  PDF is stored remotely\n\n"
-                    message += f"Suggestions:\n"
-                    message += f"  Use fetch_pdf to download a PDF\n"
-                    message += f"  Check if PDF is synced locally"
-                else:
-                    message += f"PDF may not be synced locally.\n"
-                    message += f"Open Zotero and ensure the item is synced."
-                
-                return [types.TextContent(type="text", text=message)]
-            
-            title = result.get("title", "Untitled")
-            page_count = result.get("page_count", 0)
-            char_count = result.get("character_count", 0)
-            text = result.get("text", "")
-            
-            message = f"PDF Text Extracted\n\n"
-            message += f"Item: {title}\n"
-            message += f"Pages: {page_count}\n"
-            message += f"Characters: {char_count:,}\n\n"
-            
-            if text:
-                text_preview = text[:2000] + "..." if len(text) > 2000 else text
-                message += f"Text Preview:\n{text_preview}\n"
-                
-                message += f"\nFull text available for full-text search.\n"
-                message += f"Use get_item_pdf_text to extract text from other items."
+        if not result.get("success"):
+            error_msg = result.get("error", "Unknown error")
+            error_lc = error_msg.lower()
+            
+            if "not found" in error_lc:
+                hint = _ERR_NO_ITEM
+            elif "no pdf" in error_lc:
+                hint = _ERR_NO_PDF
             else:
-                message += f"No text could be extracted from the PDF.\n"
-                message += f"The PDF may be scanned images without OCR."
-            
-            return [types.TextContent(type="text", text=message)]
+                hint = _ERR_NOT_SYNCED
             
-        except Exception as e:
-            logger.error(f"Failed to extract PDF text: {e}")
-            return [types.TextContent(type="text", text=f"Error extracting PDF text: {e}")]
-    
-    else:
-        return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
+            parts = [f"Failed to extract PDF text: {error_msg}", "", hint]
+            return [types.TextContent(type="text", text="\n".join(parts))]
+        
+        message = _pdf_text_reply(
+            result.get("title", "Untitled"),
+            result.get("page_count", 0),
+            result.get("character_count", 0),
+            result.get("text", "")[:2001],
+        )
+        
+        return [types.TextContent(type="text", text=message)]
+        
+    except Exception as e:
+        logger.error("Failed to extract PDF text: %s", e)
+        return [types.TextContent(type="text", text=f"Error extracting PDF text: {e}")]
+
+_TOOL_HANDLERS: dict[str, Callable[[dict], Awaitable[list[types.TextContent]]]] = {
+    "check_zotero_status": _tool_check_zotero_status,
+    "get_zotero_collections": _tool_get_zotero_collections,
+    "save_paper_to_zotero": _tool_save_paper_to_zotero,
+    "save_paper_by_doi": _tool_save_paper_by_doi,
+    "create_zotero_collection": _tool_create_zotero_collection,
+    "extract_arxiv_metadata": _tool_extract_arxiv_metadata,
+    "get_library_items": _tool_get_library_items,
+    "search_zotero_items": _tool_search_zotero_items,
+    "get_zotero_item": _tool_get_zotero_item,
+    "update_zotero_item": _tool_update_zotero_item,
+    "update_zotero_item_tags": _tool_update_zotero_item_tags,
+    "delete_zotero_item": _tool_delete_zotero_item,
+    "move_zotero_item": _tool_move_zotero_item,
+    "search_arxiv_api": _tool_search_arxiv_api,
+    "validate_zotero_item": _tool_validate_zotero_item,
+    "validate_and_update_item": _tool_validate_and_update_item,
+    "fetch_pdf": _tool_fetch_pdf,
+    "get_item_pdf_text": _tool_get_item_pdf_text,
+}
+
+@server.call_tool()
+async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+    """Handle tool calls"""
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return _text_response(f"Unknown tool: {name}")
+    return await handler(arguments)
 
 async def main():
     """Main entry point"""
+    # Bound the threads used by _sync for blocking connector calls
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=_SYNC_WORKERS, thread_name_prefix="zotlink")
+    )
+    await _startup()
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,